@@ -0,0 +1,92 @@
+import json
+import logging
+import random
+from typing import Callable, List
+
+import msgpack
+
+from src.replay import build_replay_engine
+from src.infrastructure.adapters.queue import LocalRedis
+from src.infrastructure.adapters.recording import FeedId
+
+
+class HotPathBenchmark:
+    """
+    One frame handler wired exactly like production, fed with synthetic frames.
+    """
+    def __init__(self, name: str, handler: Callable, frames: List, local_redis: LocalRedis, ws):
+        self.name = name
+        self.handler = handler
+        self.frames = frames
+        self.local_redis = local_redis
+        self.ws = ws
+
+
+def get_benchmark_logger() -> logging.Logger:
+    """
+    INFO logger without I/O, so record creation and formatting stay in the
+    measurement but terminal writes do not.
+    """
+    logger = logging.getLogger("benchmarks")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
+
+
+def make_binance_frames(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    price = 60000.0
+    frames = []
+    for _ in range(count):
+        price += rng.choice((-1, 1)) * rng.uniform(10, 50)
+        frames.append(json.dumps({
+            "stream": "btcusd_perp@markPrice",
+            "data": {"e": "markPriceUpdate", "E": 1700000000000, "s": "BTCUSD_PERP", "p": f"{price:.2f}"}
+        }))
+    return frames
+
+
+def make_flowa_order_frames(count: int) -> List[bytes]:
+    return [
+        msgpack.packb({
+            "StrategyId": f"MTB_2_10_250724115927_{index % 50:05d}",
+            "Symbol": "BITH11",
+            "Side": "BUY",
+            "Quantity": 1000,
+            "Price": 50.1,
+            "OrderType": "LIMIT",
+            "ExecutedQuantity": index % 1000,
+            "TimeInForce": "DAY",
+            "Status": "PartiallyFilled"
+        })
+        for index in range(count)
+    ]
+
+
+def build_benchmarks(frame_count: int) -> List[HotPathBenchmark]:
+    logger = get_benchmark_logger()
+    replay_engine, local_redis = build_replay_engine(
+        logger=logger,
+        records=[],
+        speed=0,
+        usd_brl=5.0,
+        quantities={"BITH11": 0.0002, "ETHE11": 0.004, "SOLH11": 0.06}
+    )
+    return [
+        HotPathBenchmark(
+            "binance_on_message_to_publish",
+            replay_engine.handlers[FeedId.BINANCE_COINM],
+            make_binance_frames(frame_count),
+            local_redis,
+            replay_engine.ws
+        ),
+        HotPathBenchmark(
+            "flowa_on_message_to_order_event",
+            replay_engine.handlers[FeedId.FLOWA_ORDERS],
+            make_flowa_order_frames(frame_count),
+            local_redis,
+            replay_engine.ws
+        )
+    ]
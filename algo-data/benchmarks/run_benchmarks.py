@@ -0,0 +1,148 @@
+"""
+Hot path benchmarks for algo-data.
+
+    python -m benchmarks.run_benchmarks                   # compare with baselines.json
+    python -m benchmarks.run_benchmarks --update-baseline # store current results
+
+Exits with status 1 when any metric regresses past the tolerance. Baselines
+are host specific, regenerate them on the machine that gates regressions.
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.hot_path import HotPathBenchmark, build_benchmarks
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# Metric name -> (higher is better, tolerance multiplier). Far tails are noisier.
+METRICS = {
+    "throughput_per_second": (True, 1),
+    "p50_us": (False, 1),
+    "p99_us": (False, 1),
+    "p999_us": (False, 2),
+    "alloc_bytes_per_message": (False, 1)
+}
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_benchmark(benchmark: HotPathBenchmark, warmup: int) -> dict:
+    handler = benchmark.handler
+    ws = benchmark.ws
+    frames = benchmark.frames
+
+    for frame in frames[:warmup]:
+        handler(ws, frame)
+
+    gc.collect()
+    gc.disable()
+    try:
+        started_at = time.perf_counter_ns()
+        for frame in frames:
+            handler(ws, frame)
+        elapsed_ns = time.perf_counter_ns() - started_at
+
+        latencies = []
+        for frame in frames:
+            message_started_at = time.perf_counter_ns()
+            handler(ws, frame)
+            latencies.append(time.perf_counter_ns() - message_started_at)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    peak_bytes = 0
+    for frame in frames[:min(len(frames), 2000)]:
+        tracemalloc.reset_peak()
+        current_bytes, _ = tracemalloc.get_traced_memory()
+        handler(ws, frame)
+        peak_bytes += tracemalloc.get_traced_memory()[1] - current_bytes
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "messages": len(frames),
+        "throughput_per_second": round(len(frames) / (elapsed_ns / 1e9), 1),
+        "p50_us": round(percentile(latencies, 0.5) / 1000, 2),
+        "p99_us": round(percentile(latencies, 0.99) / 1000, 2),
+        "p999_us": round(percentile(latencies, 0.999) / 1000, 2),
+        "alloc_bytes_per_message": round(peak_bytes / min(len(frames), 2000), 1)
+    }
+
+
+def run_repeated(benchmark: HotPathBenchmark, warmup: int, repeat: int) -> dict:
+    """
+    Median of each metric over several runs, single runs are too noisy to gate on.
+    """
+    runs = [run_benchmark(benchmark, warmup) for _ in range(repeat)]
+    return {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+
+
+def find_regressions(name: str, result: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for metric, (higher_is_better, multiplier) in METRICS.items():
+        if metric not in baseline:
+            continue
+        expected = baseline[metric]
+        actual = result[metric]
+        allowed = tolerance * multiplier
+        if higher_is_better and actual < expected * (1 - allowed):
+            regressions.append(f"{name}.{metric}: {actual} < baseline {expected}")
+        if not higher_is_better and actual > expected * (1 + allowed):
+            regressions.append(f"{name}.{metric}: {actual} > baseline {expected}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--warmup", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression per metric")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    for benchmark in build_benchmarks(args.messages):
+        results[benchmark.name] = run_repeated(benchmark, args.warmup, args.repeat)
+        print(f"{benchmark.name}: {json.dumps(results[benchmark.name])}")
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+            file.write("\n")
+        print(f"Baselines written to {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("No baselines stored yet, run with --update-baseline")
+        return 0
+
+    with open(BASELINE_PATH) as file:
+        baselines = json.load(file)
+
+    regressions = []
+    for name, result in results.items():
+        regressions += find_regressions(name, result, baselines.get(name, {}), args.tolerance)
+
+    if regressions:
+        print("REGRESSIONS:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("No regressions against baselines")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,4 +3,7 @@ from .inav_data_collector import InavDataCollector
 from .md_data_collector import MdDataCollector
 from .order_reporter import OrderReporter
 from .trade_streamer import TradeStreamer
-from .dollar_collector import DollarCollector
\ No newline at end of file
+from .dollar_collector import DollarCollector
+from .inav_conflator import InavConflator
+from .poll_scheduler import AdaptivePollScheduler
+from .fx_aggregator import FxAggregator
\ No newline at end of file
@@ -1,9 +1,22 @@
+import asyncio
+import os
+import queue
+import threading
 import time
 import logging
 
+from dotenv import load_dotenv
+
 from src.application.data_collectors.data_collector import DataCollector
+from src.application.data_collectors.fx_aggregator import FxAggregator
 from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+from src.infrastructure.adapters.cache.shared_value_cache import SharedValueCache
 from src.infrastructure.adapters.md_adapter import MDAdapter
+from src.infrastructure.adapters.crypto.binance.binance_spot_fx_adapter import BinanceSpotFxAdapter
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
 
 
 
@@ -12,23 +25,85 @@ class DollarCollector(DataCollector):
             self,
             logger: logging.Logger,
             redis_adapter: RedisAdapter,
-            dollar_adapter: MDAdapter
+            dollar_adapter: MDAdapter,
+            stream_adapter: BinanceSpotFxAdapter = None,
+            aggregator: FxAggregator = None,
+            poll_interval: float = None,
+            stats_interval: int = 60,
+            shared_cache: SharedValueCache = None
         ):
         self.logger = logger
         self.redis_adapter = redis_adapter
         self.dollar_adapter = dollar_adapter
-    
+        self.stream_adapter = stream_adapter
+        self.aggregator = aggregator or FxAggregator(logger, self.enqueue_rate)
+        self.poll_interval = float(poll_interval or os.environ.get(f"FX_POLL_INTERVAL_{ENV}", 5))
+        self.stats_interval = stats_interval
+        self.shared_cache = shared_cache
+        self.symbol = "USD:BRL"
+        self.last_dollar_price: float = None
+        # Rates are published from their own thread so Redis I/O never blocks the stream's event loop.
+        self.rates: queue.Queue = queue.Queue()
+
+    def dispatch_fx_event(self, dollar_price: float, sources: list = None):
+        channel = f"fx-{self.symbol}"
+        self.redis_adapter.publish_message(channel, {
+            "symbol": self.symbol,
+            "price": dollar_price,
+            "sources": sources or [],
+            "timestamp": time.time()
+        })
+        self.logger.info(f"{channel} | FX event was dispatched: {dollar_price} from {sources}")
+
+    def publish_rate(self, dollar_price: float, sources: list):
+        if self.shared_cache:
+            self.shared_cache.put(self.symbol, dollar_price)
+        with self.redis_adapter.batch():
+            # The key stays as a snapshot for late subscribers warming up.
+            self.redis_adapter.set_key(self.symbol, dollar_price)
+            if dollar_price != self.last_dollar_price:
+                self.dispatch_fx_event(dollar_price, sources)
+        self.last_dollar_price = dollar_price
+
+    def enqueue_rate(self, dollar_price: float, sources: list):
+        self.rates.put((dollar_price, sources))
+
+    def run_publisher(self):
+        while True:
+            dollar_price, sources = self.rates.get()
+            try:
+                self.publish_rate(dollar_price, sources)
+            except Exception as err:
+                self.logger.error(f"Could not publish dollar price, reason: {err}")
+            finally:
+                self.rates.task_done()
+
     def collect_dollar(self):
+        started_at = time.perf_counter()
         dollar_price = self.dollar_adapter.fetch_price()
-        self.redis_adapter.set_key("USD:BRL", dollar_price)
+        self.aggregator.on_quote("coinbase", dollar_price, time.perf_counter() - started_at)
 
-    def start_collecting(self):
+    def start_polling(self):
+        last_stats_time = time.monotonic()
         while True:
             try:
                 self.collect_dollar()
             except Exception as err:
                 self.logger.error(f"Could not fetch dollar price, reason: {err}")
-            time.sleep(5)
+
+            if time.monotonic() - last_stats_time >= self.stats_interval:
+                self.aggregator.log_stats()
+                last_stats_time = time.monotonic()
+            time.sleep(self.poll_interval)
+
+    def start_collecting(self):
+        threading.Thread(target=self.run_publisher, daemon=True).start()
+        if not self.stream_adapter:
+            self.start_polling()
+            return
+
+        threading.Thread(target=self.start_polling, daemon=True).start()
+        asyncio.run(self.stream_adapter.run(self.aggregator.on_quote))
 
     def run(self):
-        self.start_collecting()
\ No newline at end of file
+        self.start_collecting()
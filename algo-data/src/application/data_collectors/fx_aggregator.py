@@ -0,0 +1,175 @@
+import logging
+import os
+import statistics
+import threading
+import time
+from typing import Callable, Optional
+
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.metrics import MetricsRegistry
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class FxSourceState:
+    def __init__(self):
+        self.rate: float = None
+        self.updated_at: float = None
+        self.updates = 0
+        self.rejections = 0
+        self.total_latency = 0.0
+        self.latency_samples = 0
+        self.max_interval = 0.0
+
+
+class FxAggregator:
+    """
+    Combines USD/BRL quotes from several sources into one rate.
+
+    Quotes older than max_age are ignored, quotes further than
+    outlier_threshold (relative) from the median of the fresh quotes are
+    rejected, and the result is the median of what is left. With fewer than
+    three fresh quotes there is no majority to reject against, so the quote
+    closest to the last published rate wins. on_rate is called with
+    (rate, sources used) whenever the rounded rate changes, outside the
+    aggregation lock and never older than a rate already published.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        on_rate: Callable,
+        max_age: float = None,
+        outlier_threshold: float = None,
+        precision: int = 4
+    ):
+        self.logger = logger
+        self.on_rate = on_rate
+        self.max_age = float(max_age or os.environ.get(f"FX_SOURCE_MAX_AGE_{ENV}", 15))
+        self.outlier_threshold = float(outlier_threshold or os.environ.get(f"FX_OUTLIER_THRESHOLD_{ENV}", 0.005))
+        self.precision = precision
+        self.sources: dict[str, FxSourceState] = {}
+        self.rate: float = None
+        self.sequence = 0
+        self.published_sequence = 0
+        self._lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        registry = MetricsRegistry.get_default()
+        self.quotes_total = registry.counter("fx_quotes_total", "FX quotes received", ("source", ))
+        self.quote_counters: dict = {}
+        self.rates_total = registry.counter("fx_rates_published_total", "Aggregated FX rate changes published")
+
+    def get_source(self, source: str) -> FxSourceState:
+        if source not in self.sources:
+            self.sources[source] = FxSourceState()
+        return self.sources[source]
+
+    def on_quote(self, source: str, rate: float, latency: float = None):
+        """
+        latency is the request or transport delay of the quote when the
+        source can measure it.
+        """
+        now = time.monotonic()
+        quote_counter = self.quote_counters.get(source)
+        if quote_counter is None:
+            quote_counter = self.quote_counters[source] = self.quotes_total.labels(source)
+        quote_counter.inc()
+        with self._lock:
+            state = self.get_source(source)
+            if state.updated_at is not None:
+                state.max_interval = max(state.max_interval, now - state.updated_at)
+            state.rate = rate
+            state.updated_at = now
+            state.updates += 1
+            if latency is not None:
+                state.total_latency += latency
+                state.latency_samples += 1
+
+            result = self.aggregate(now)
+            if result is None:
+                return
+            rate, sources_used = result
+            if rate == self.rate:
+                return
+            self.rate = rate
+            self.sequence += 1
+            sequence = self.sequence
+
+        self.rates_total.inc()
+        self.publish(sequence, rate, sources_used)
+
+    def publish(self, sequence: int, rate: float, sources_used: list):
+        with self._publish_lock:
+            # A quote from another source thread may have produced a newer rate while this one waited.
+            if sequence <= self.published_sequence:
+                return
+            self.published_sequence = sequence
+            self.on_rate(rate, sources_used)
+
+    def aggregate(self, now: float) -> Optional[tuple]:
+        fresh = {
+            source: state.rate
+            for source, state in self.sources.items()
+            if state.rate is not None and now - state.updated_at <= self.max_age
+        }
+        if not fresh:
+            return None
+        if len(fresh) < 3:
+            return self.closest_to_last_rate(fresh)
+
+        median = statistics.median(fresh.values())
+        accepted = []
+        for source, rate in fresh.items():
+            if abs(rate - median) / median > self.outlier_threshold:
+                self.sources[source].rejections += 1
+                continue
+            accepted.append(source)
+        if not accepted:
+            return None
+
+        rate = round(statistics.median(fresh[source] for source in accepted), self.precision)
+        return rate, sorted(accepted)
+
+    def closest_to_last_rate(self, fresh: dict) -> tuple:
+        """
+        Two quotes within 2 * outlier_threshold of each other are both within
+        outlier_threshold of their median, so they are kept together as with
+        three or more sources. Otherwise the one nearer the last published
+        rate is kept; before any rate was published there is nothing to
+        compare against and both are used.
+        """
+        if self.rate is None:
+            accepted = list(fresh)
+        else:
+            anchor = fresh[min(fresh, key=lambda source: abs(fresh[source] - self.rate))]
+            accepted = [
+                source for source, rate in fresh.items()
+                if abs(rate - anchor) / anchor <= self.outlier_threshold * 2
+            ]
+            for source in fresh:
+                if source not in accepted:
+                    self.sources[source].rejections += 1
+
+        rate = round(statistics.median(fresh[source] for source in accepted), self.precision)
+        return rate, sorted(accepted)
+
+    def get_stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            source: {
+                "rate": state.rate,
+                "age_seconds": round(now - state.updated_at, 3) if state.updated_at is not None else None,
+                "stale": state.updated_at is None or now - state.updated_at > self.max_age,
+                "updates": state.updates,
+                "rejections": state.rejections,
+                "avg_latency_ms": round(state.total_latency / state.latency_samples * 1000, 2) if state.latency_samples else None,
+                "max_interval_seconds": round(state.max_interval, 3)
+            }
+            for source, state in self.sources.items()
+        }
+
+    def log_stats(self):
+        for source, stats in self.get_stats().items():
+            self.logger.info(f"[FxAggregator] {source} | {stats}")
@@ -0,0 +1,117 @@
+import logging
+import os
+import threading
+from typing import Callable
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class InavConflator:
+    """
+    Keeps only the latest iNAV per key and flushes it on a fixed cadence, or
+    right away when it moves by at least the deadband since the last flush.
+
+    on_flush receives (key, message_data, coalesced_updates).
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        on_flush: Callable[[str, dict, int], None],
+        flush_interval: float = None,
+        deadband: float = None
+    ):
+        self.logger = logger
+        self.on_flush = on_flush
+        self.flush_interval = float(
+            flush_interval if flush_interval is not None
+            else os.environ.get(f"INAV_FLUSH_INTERVAL_{ENV}", 0.25)
+        )
+        self.deadband = float(
+            deadband if deadband is not None
+            else os.environ.get(f"INAV_DEADBAND_{ENV}", 0.05)
+        )
+
+        self._lock = threading.Lock()
+        # Held from taking a pending value until on_flush returns, so the
+        # flusher and the publishing thread never send a key out of order.
+        self._dispatch_lock = threading.Lock()
+        self._pending: dict[str, tuple[float, dict]] = {}
+        self._pending_updates: dict[str, int] = {}
+        self._last_flushed: dict[str, float] = {}
+        self._stop_event = threading.Event()
+        self.flusher_thread: threading.Thread = None
+
+        self.flushes = 0
+        self.coalesced_updates = 0
+
+    def offer(self, key: str, value: float, message_data: dict):
+        with self._lock:
+            self._pending[key] = (value, message_data)
+            self._pending_updates[key] = self._pending_updates.get(key, 0) + 1
+            last_value = self._last_flushed.get(key)
+
+        if (
+            self.flush_interval <= 0
+            or last_value is None
+            or abs(value - last_value) >= self.deadband
+        ):
+            self.flush_key(key)
+
+    def flush_key(self, key: str):
+        with self._dispatch_lock:
+            with self._lock:
+                pending = self._pending.pop(key, None)
+                updates = self._pending_updates.pop(key, 0)
+                if pending is None:
+                    return
+                value, message_data = pending
+                if self._last_flushed.get(key) == value:
+                    return
+                self._last_flushed[key] = value
+                self.flushes += 1
+                # Every update folded into this flush besides the one being sent.
+                coalesced = updates - 1
+                self.coalesced_updates += coalesced
+
+            self.on_flush(key, message_data, coalesced)
+
+    def flush(self):
+        with self._lock:
+            keys = list(self._pending)
+        for key in keys:
+            try:
+                self.flush_key(key)
+            except Exception as err:
+                self.logger.error(f"[InavConflator] Could not flush {key}, reason: {err}")
+
+    def run_flusher(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def start(self):
+        if self.flush_interval <= 0:
+            return
+        if self.flusher_thread and self.flusher_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.flusher_thread = threading.Thread(
+            target=self.run_flusher,
+            daemon=True
+        )
+        self.flusher_thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        self.flush()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "flushes": self.flushes,
+                "coalesced_updates": self.coalesced_updates
+            }
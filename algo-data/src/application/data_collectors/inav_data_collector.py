@@ -1,11 +1,15 @@
 import asyncio
 import logging
+import time
 from typing import List
 import json
 
 from src.application.data_collectors.data_collector import DataCollector
+from src.application.data_collectors.poll_scheduler import AdaptivePollScheduler
 from src.infrastructure.adapters.inav_md_adapter import InavMDAdapter
 from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+from src.infrastructure.adapters.cache.shared_value_cache import SharedValueCache
+from src.infrastructure.adapters.metrics import MetricsRegistry
 
 
 class InavDataCollector(DataCollector):
@@ -14,18 +18,27 @@ class InavDataCollector(DataCollector):
         logger: logging.Logger,
         collector_adapter: InavMDAdapter,
         redis_adapter: RedisAdapter,
-        assets_list: List[str]
+        assets_list: List[str],
+        scheduler: AdaptivePollScheduler = None,
+        stats_interval: int = 60,
+        shared_cache: SharedValueCache = None
     ):
         self.logger = logger
         self.collector_adapter = collector_adapter
         self.redis_adapter = redis_adapter
         self.assets_list = assets_list
+        self.scheduler = scheduler or AdaptivePollScheduler(logger)
+        self.stats_interval = stats_interval
+        self.shared_cache = shared_cache
         self.onshore_offshore_mapping = {
             "BITH11": "HBTC.BH",
             "ETHE11": "HETH.BH",
             "SOLH11": "HSOL.BH"
         }
         self.latest_inav_dict: dict[str, float] = {}
+        registry = MetricsRegistry.get_default()
+        self.polls_total = registry.counter("inav_polls_total", "iNAV polls by result", ("asset", "status"))
+        self.poll_duration = registry.histogram("inav_poll_duration_seconds", "iNAV request duration", ("asset", ))
     
     def should_dispatch_event(self, asset: str, inav: float) -> bool:
         last_inav = self.latest_inav_dict.get(asset)
@@ -42,10 +55,34 @@ class InavDataCollector(DataCollector):
             "amount_of_underlying_asset": amount_of_underlying_asset
         }
 
+    def store_and_dispatch(self, asset: str, inav: float, message_data: dict):
+        if self.shared_cache:
+            self.shared_cache.put(f"inav:{asset}", message_data["inav"], message_data["amount_of_underlying_asset"])
+        # Snapshot and event share one round trip.
+        should_dispatch = self.should_dispatch_event(asset, inav)
+        with self.redis_adapter.batch():
+            self.redis_adapter.set_key(f"inav:{asset}", json.dumps(message_data))
+            if should_dispatch:
+                self.dispatch_price_collected_event(f"inav-{asset}", message_data)
+        # Only once the batch went out, so a failed one is dispatched again on the next poll.
+        if should_dispatch:
+            self.latest_inav_dict[asset] = inav
+
     async def collect_data(self, asset: str):
+        started_at = time.perf_counter()
+        try:
+            inav = await self.collector_adapter.fetch_price_async(asset)
+        except Exception as err:
+            self.scheduler.record_error(asset, time.perf_counter() - started_at)
+            self.polls_total.labels(asset, "error").inc()
+            self.logger.error(f"Could not fetch inav for {asset}, reason: {err}")
+            return
+        duration = time.perf_counter() - started_at
+        self.scheduler.record_success(asset, inav, duration)
+        self.polls_total.labels(asset, "success").inc()
+        self.poll_duration.labels(asset).observe(duration)
+
         try:
-            inav = await asyncio.to_thread(self.collector_adapter.fetch_price, asset)
-            
             amount_of_underlying_asset = await asyncio.to_thread(
                 self.collector_adapter.get_crypto_quantity_on_onshore_etf,
                 asset,
@@ -55,21 +92,30 @@ class InavDataCollector(DataCollector):
 
             self.logger.debug(f"New inav was collected {asset}: {inav}")
             message_data = self.mount_message_data(asset, inav, amount_of_underlying_asset)
-            await asyncio.to_thread(self.redis_adapter.set_key, f"inav:{asset}", json.dumps(message_data))
-            if self.should_dispatch_event(asset, inav):
-                self.latest_inav_dict[asset] = inav
-                self.dispatch_price_collected_event(f"inav-{asset}", message_data)
+            await asyncio.to_thread(self.store_and_dispatch, asset, inav, message_data)
 
         except Exception as err:
             self.logger.error(f"Could not collect inav for {asset}, reason: {err}")
 
     async def start_collecting(self, asset: str):
         while True:
+            started_at = time.monotonic()
             await self.collect_data(asset)
+            interval = self.scheduler.next_interval(asset)
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started_at)))
+
+    async def log_stats(self):
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self.scheduler.log_stats()
 
     async def run_async(self):
         tasks = [self.start_collecting(asset) for asset in self.assets_list]
-        await asyncio.gather(*tasks)
+        tasks.append(self.log_stats())
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await self.collector_adapter.close()
 
     def run(self):
         asyncio.run(self.run_async())
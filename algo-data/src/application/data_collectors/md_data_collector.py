@@ -1,10 +1,17 @@
+import asyncio
+import threading
 import time
 import logging
 
 from src.infrastructure.adapters.websocket_adapter import WebsocketAdapter
+from src.infrastructure.adapters.crypto.binance.binance_coinm_stream_engine import BinanceCoinMStreamEngine
 from src.infrastructure.adapters.stocks.hashdex.hashdex_md_adapter import HashdexMDAdapter
+from src.domain.market_data.basket_inav_engine import BasketInavEngine
 from src.application.data_collectors.data_collector import DataCollector
-from src.infrastructure.adapters.queue import RedisAdapter
+from src.application.data_collectors.inav_conflator import InavConflator
+from src.infrastructure.adapters.queue import RedisAdapter, HandoffQueue, OverflowPolicy
+from src.infrastructure.adapters.cache import FxCache, PcfCache, SharedValueCache
+from src.infrastructure.adapters.metrics import LatencyTracker, MetricsRegistry, TS_EXCHANGE, TS_RECEIVED, TS_PUBLISHED
 
 
 
@@ -15,27 +22,61 @@ class MdDataCollector(DataCollector):
             websocket_adapter: WebsocketAdapter,
             inav_adapter: HashdexMDAdapter,
             message_broker: RedisAdapter,
-            retry_time: int
+            retry_time: int,
+            stream_engine: BinanceCoinMStreamEngine = None,
+            handoff_queue: HandoffQueue = None,
+            inav_conflator: InavConflator = None,
+            fx_cache: FxCache = None,
+            pcf_cache: PcfCache = None,
+            stats_interval: int = 60,
+            shared_cache: SharedValueCache = None,
+            latency_tracker: LatencyTracker = None,
+            etf_baskets: dict = None
         ):
         self.logger = logger
         self.websocket_adapter = websocket_adapter
         self.inav_adapter = inav_adapter
         self.message_broker = message_broker
         self.retry_time = retry_time
-        self.from_underlying_to_etf = {
-            "BTCUSD_PERP": {
-                "onshore": "BITH11",
-                "offshore": "HBTC.BH"
-            },
-            "ETHUSD_PERP": {
-                "onshore": "ETHE11",
-                "offshore": "HETH.BH"
-            },
-            "SOLUSD_PERP": {
-                "onshore": "SOLH11",
-                "offshore": "HSOL.BH"
-            },
+        self.stream_engine = stream_engine
+        # Ticks are handed from the websocket reader to the publisher thread,
+        # so broker round trips never stall market data intake.
+        # An empty HandoffQueue is falsy, it has a __len__.
+        self.handoff_queue = handoff_queue if handoff_queue is not None else HandoffQueue(logger, "md-ticks")
+        if stream_engine is not None and self.handoff_queue.overflow_policy == OverflowPolicy.BLOCK:
+            # The engine enqueues from its event loop, blocking there would freeze every shard.
+            raise ValueError("The BLOCK handoff policy cannot be used with the sharded stream engine, use CONFLATE or DROP_OLDEST")
+        self.inav_conflator = inav_conflator or InavConflator(logger, self.dispatch_inav)
+        self.fx_cache = fx_cache or FxCache(logger, message_broker, shared_cache=shared_cache)
+        self.stats_interval = stats_interval
+        self.latency_tracker = latency_tracker or LatencyTracker(logger, "md-binance", store=message_broker)
+        registry = MetricsRegistry.get_default()
+        self.ticks_total = registry.counter("md_ticks_total", "Ticks taken by the publisher", ("provider", "asset"))
+        self.inavs_published_total = registry.counter("md_inavs_published_total", "iNAVs published", ("channel", ))
+        # Children per label values, labels() validates and formats them on every call.
+        self.tick_counters: dict = {}
+        self.inav_counters: dict = {}
+        self.publisher_thread: threading.Thread = None
+        # Onshore ETF -> offshore fund and the underlyings it holds, keyed by
+        # their PCF holding symbol. Multi-asset ETFs list several and take
+        # their weights from the "basket" of their PCF entry.
+        self.etf_baskets = etf_baskets or {
+            "BITH11": {"offshore": "HBTC.BH", "underlyings": {"BTC": "BTCUSD_PERP"}},
+            "ETHE11": {"offshore": "HETH.BH", "underlyings": {"ETH": "ETHUSD_PERP"}},
+            "SOLH11": {"offshore": "HSOL.BH", "underlyings": {"SOL": "SOLUSD_PERP"}},
         }
+        self.pcf_cache = pcf_cache or PcfCache(
+            logger,
+            inav_adapter,
+            message_broker,
+            {etf: basket["offshore"] for etf, basket in self.etf_baskets.items()},
+            shared_cache=shared_cache
+        )
+        underlyings = list(dict.fromkeys(
+            underlying for basket in self.etf_baskets.values() for underlying in basket["underlyings"].values()
+        ))
+        self.basket_engine = BasketInavEngine(list(self.etf_baskets), underlyings)
+        self.basket_generation: int = None
         self.inav_price_dict = {}
 
     def should_publish_data(self, symbol, inav):
@@ -47,41 +88,136 @@ class MdDataCollector(DataCollector):
         
         return False
 
-    def mount_message_data(self, asset: str, inav: float, amount_of_underlying_asset: float):
-        return {
+    def mount_message_data(self, asset: str, inav: float, amount_of_underlying_asset: float, basket: dict = None):
+        message_data = {
             "symbol": asset,
             "inav": inav,
             "amount_of_underlying_asset": amount_of_underlying_asset
         }
+        if basket:
+            message_data["basket"] = basket
+        return message_data
+
+    def get_basket_weights(self, etf: str, entry: dict) -> dict:
+        underlyings = self.etf_baskets[etf]["underlyings"]
+        if len(underlyings) == 1:
+            return {next(iter(underlyings.values())): entry["amount_of_underlying_asset"]}
+        basket = entry.get("basket")
+        if not basket:
+            raise KeyError(f"PCF entry of {etf} has no basket")
+        return {underlyings[holding]: quantity for holding, quantity in basket.items()}
+
+    def load_basket_weights(self):
+        generation = self.pcf_cache.generation
+        for etf in self.etf_baskets:
+            entry = self.pcf_cache.entries.get(etf)
+            if not entry:
+                continue
+            try:
+                self.basket_engine.set_weights(etf, self.get_basket_weights(etf, entry), entry.get("cash", 0.0))
+            except Exception as err:
+                # Keeps pricing the others, the ETF is retried on the next PCF refresh.
+                self.logger.error(f"Could not load basket of {etf}, reason: {err}")
+        self.basket_generation = generation
+        self.basket_engine.recompute()
     
-    def publish_data(self, provider: str, asset: str, price: float):
-        onshore = self.from_underlying_to_etf[asset]["onshore"]
-        offshore = self.from_underlying_to_etf[asset]["offshore"]
+    def publish_data(self, provider: str, asset: str, price: float, event_time: float = None, received_at: float = None):
+        if self.pcf_cache.generation != self.basket_generation:
+            self.load_basket_weights()
+        tick_counter = self.tick_counters.get((provider, asset))
+        if tick_counter is None:
+            tick_counter = self.tick_counters[(provider, asset)] = self.ticks_total.labels(provider, asset)
+        tick_counter.inc()
 
-        qty = self.inav_adapter.get_crypto_quantity_on_onshore_etf(onshore, offshore)
-        dollar_price = float(self.message_broker.get_key("USD:BRL"))
-        inav = round(qty * price * dollar_price, 2)
+        timestamps = None
+        if self.latency_tracker.enabled and received_at is not None:
+            self.latency_tracker.record("exchange_to_receive", event_time, received_at)
+            self.latency_tracker.record("receive_to_dequeue", received_at, time.time())
+            timestamps = {TS_EXCHANGE: event_time, TS_RECEIVED: received_at}
 
-        if self.should_publish_data(onshore, inav):
-            self.inav_price_dict[onshore] = inav
-        else:
+        rows = self.basket_engine.update_price(asset, price)
+        if not len(rows):
             return
+        dollar_price = self.fx_cache.get_rate()
+        inavs = (self.basket_engine.inavs[rows] * dollar_price).tolist()
+        column = self.basket_engine.underlying_index[asset]
 
-        channel = f"inav-{onshore}-{provider}"
-        self.logger.info(f"{channel}: {inav}")
-        message_data = self.mount_message_data(onshore, inav, qty)
+        for row, inav in zip(rows.tolist(), inavs):
+            # NaN until every underlying of the basket has a price.
+            if inav != inav:
+                continue
+            inav = round(inav, 2)
+            onshore = self.basket_engine.etfs[row]
+            if self.should_publish_data(onshore, inav):
+                self.inav_price_dict[onshore] = inav
+            else:
+                continue
+
+            channel = f"inav-{onshore}-{provider}"
+            basket = self.basket_engine.get_weights(onshore) if len(self.etf_baskets[onshore]["underlyings"]) > 1 else None
+            message_data = self.mount_message_data(onshore, inav, self.basket_engine.weights.item(row, column), basket)
+            if timestamps:
+                message_data["ts"] = dict(timestamps)
+            self.inav_conflator.offer(channel, inav, message_data)
+
+    def dispatch_inav(self, channel: str, message_data: dict, coalesced_updates: int):
+        self.logger.info("%s: %s (coalesced %s updates)", channel, message_data["inav"], coalesced_updates)
+        timestamps = message_data.get("ts")
+        if timestamps:
+            timestamps[TS_PUBLISHED] = time.time()
+            self.latency_tracker.record("receive_to_publish", timestamps[TS_RECEIVED], timestamps[TS_PUBLISHED])
         self.message_broker.publish_message(channel, message_data)
+        inav_counter = self.inav_counters.get(channel)
+        if inav_counter is None:
+            inav_counter = self.inav_counters[channel] = self.inavs_published_total.labels(channel)
+        inav_counter.inc()
+
+    def enqueue_tick(self, provider: str, asset: str, price: float, event_time: float = None, received_at: float = None):
+        self.handoff_queue.put(asset, (provider, asset, price, event_time, received_at))
+
+    def run_publisher(self):
+        last_stats_time = time.monotonic()
+        while True:
+            tick = self.handoff_queue.get(timeout=self.stats_interval)
+            if tick:
+                try:
+                    self.publish_data(*tick)
+                except Exception as err:
+                    self.logger.error(f"Could not publish {tick[1]} data, reason: {err}")
+
+            if time.monotonic() - last_stats_time >= self.stats_interval:
+                self.handoff_queue.log_stats()
+                self.logger.info(f"[InavConflator] {self.inav_conflator.get_stats()}")
+                self.latency_tracker.report()
+                # Clears the rounding the incremental tick updates accumulate.
+                self.basket_engine.recompute()
+                last_stats_time = time.monotonic()
+
+    def start_publisher_thread(self):
+        if self.publisher_thread and self.publisher_thread.is_alive():
+            return
+        self.publisher_thread = threading.Thread(
+            target=self.run_publisher,
+            daemon=True
+        )
+        self.publisher_thread.start()
 
     def start_websocket_session(self):
+        if self.stream_engine:
+            self.logger.info(f"Starting sharded websocket engine...")
+            asyncio.run(self.stream_engine.run(self.enqueue_tick))
+            return
+
         self.logger.info(f"Starting websocket connection...")
-        ws = self.websocket_adapter.get_ws(self.publish_data)
+        ws = self.websocket_adapter.get_ws(self.enqueue_tick)
         ws.run_forever()
     
     def start_collecting(self):
         self.logger.info(f"Caching underlying quantity on ETFs...")
-        for k, v in self.from_underlying_to_etf.items():
-            self.inav_adapter.get_crypto_quantity_on_onshore_etf(v["onshore"], v["offshore"])
-
+        self.pcf_cache.start()
+        self.fx_cache.start()
+        self.inav_conflator.start()
+        self.start_publisher_thread()
         while True:
             try:
                 self.start_websocket_session()
@@ -0,0 +1,124 @@
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+# B3 trades on Brasilia time, which has had no daylight saving since 2019.
+B3_TIMEZONE = timezone(timedelta(hours=-3))
+
+
+class AssetPollState:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+        self.last_value: Optional[float] = None
+        self.volatile_polls_left = 0
+        self.interval = 0.0
+
+
+class AdaptivePollScheduler:
+    """
+    Decides how long each asset waits before its next poll.
+
+    Assets poll at market_interval during B3 hours and off_hours_interval
+    outside them. A relative move of at least volatility_threshold switches
+    the asset to volatile_interval for the next volatile_polls polls, and
+    consecutive errors back off exponentially up to max_backoff.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        market_interval: float = None,
+        off_hours_interval: float = None,
+        volatile_interval: float = None,
+        volatility_threshold: float = None,
+        volatile_polls: int = 20,
+        max_backoff: float = 60,
+        market_open: str = "10:00",
+        market_close: str = "18:00"
+    ):
+        self.logger = logger
+        self.market_interval = market_interval or float(os.environ.get(f"INAV_POLL_INTERVAL_{ENV}", 1))
+        self.off_hours_interval = off_hours_interval or float(os.environ.get(f"INAV_POLL_OFF_HOURS_INTERVAL_{ENV}", 30))
+        self.volatile_interval = volatile_interval or float(os.environ.get(f"INAV_POLL_VOLATILE_INTERVAL_{ENV}", 0.25))
+        self.volatility_threshold = volatility_threshold or float(os.environ.get(f"INAV_POLL_VOLATILITY_THRESHOLD_{ENV}", 0.001))
+        self.volatile_polls = volatile_polls
+        self.max_backoff = max_backoff
+        self.market_open = datetime.strptime(market_open, "%H:%M").time()
+        self.market_close = datetime.strptime(market_close, "%H:%M").time()
+        self.states: Dict[str, AssetPollState] = {}
+
+    def get_state(self, asset: str) -> AssetPollState:
+        if asset not in self.states:
+            self.states[asset] = AssetPollState()
+        return self.states[asset]
+
+    def is_market_open(self, now: datetime = None) -> bool:
+        now = (now or datetime.now(timezone.utc)).astimezone(B3_TIMEZONE)
+        return now.weekday() < 5 and self.market_open <= now.time() < self.market_close
+
+    def record_success(self, asset: str, value: float, latency: float):
+        state = self.get_state(asset)
+        self.record_latency(state, latency)
+        state.consecutive_errors = 0
+
+        if state.last_value:
+            change = abs(value - state.last_value) / state.last_value
+            if change >= self.volatility_threshold:
+                state.volatile_polls_left = self.volatile_polls
+        state.last_value = value
+
+    def record_error(self, asset: str, latency: float):
+        state = self.get_state(asset)
+        self.record_latency(state, latency)
+        state.errors += 1
+        state.consecutive_errors += 1
+
+    @staticmethod
+    def record_latency(state: AssetPollState, latency: float):
+        state.requests += 1
+        state.total_latency += latency
+        state.last_latency = latency
+        state.max_latency = max(state.max_latency, latency)
+
+    def next_interval(self, asset: str, now: datetime = None) -> float:
+        state = self.get_state(asset)
+        base_interval = self.market_interval if self.is_market_open(now) else self.off_hours_interval
+
+        if state.consecutive_errors:
+            interval = min(base_interval * 2 ** state.consecutive_errors, max(self.max_backoff, base_interval))
+        elif state.volatile_polls_left > 0:
+            state.volatile_polls_left -= 1
+            interval = min(self.volatile_interval, base_interval)
+        else:
+            interval = base_interval
+
+        state.interval = interval
+        return interval
+
+    def get_stats(self) -> dict:
+        return {
+            asset: {
+                "requests": state.requests,
+                "errors": state.errors,
+                "avg_latency_ms": round(state.total_latency / state.requests * 1000, 2) if state.requests else 0.0,
+                "max_latency_ms": round(state.max_latency * 1000, 2),
+                "last_latency_ms": round(state.last_latency * 1000, 2),
+                "interval": state.interval
+            }
+            for asset, state in self.states.items()
+        }
+
+    def log_stats(self):
+        for asset, stats in self.get_stats().items():
+            self.logger.info(f"[AdaptivePollScheduler] {asset} | {stats}")
@@ -4,6 +4,7 @@ import logging
 from src.application.data_collectors.data_collector import DataCollector
 from src.infrastructure.adapters.websocket_adapter import WebsocketAdapter
 from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+from src.infrastructure.adapters.queue.redis_stream_writer import RedisStreamWriter
 
 
 class TradeStreamer(DataCollector):
@@ -12,19 +13,22 @@ class TradeStreamer(DataCollector):
         logger: logging.Logger,
         reporter_adapter: WebsocketAdapter,
         redis_adapter: RedisAdapter,
-        provider: str
+        provider: str,
+        stream_writer: RedisStreamWriter = None
     ):
         self.logger = logger
         self.reporter_adapter = reporter_adapter
         self.redis_adapter = redis_adapter
         self.provider = provider
+        self.stream_writer = stream_writer or RedisStreamWriter(logger, redis_adapter)
 
     def dispatch_trade_report_event(self, message_data: dict):
         channel = f"{self.provider}-trade-{message_data['StrategyID']}"
-        self.redis_adapter.stream_data(channel, message_data)
-        self.logger.info(f"{channel} | Trade was streammed: {message_data}")
+        self.stream_writer.write(channel, message_data)
+        self.logger.info("%s | Trade was streammed: %s", channel, message_data)
 
     def start_collecting(self):
+        self.stream_writer.start()
         while True:
             try:
                 ws = self.reporter_adapter.get_ws(self.dispatch_trade_report_event)
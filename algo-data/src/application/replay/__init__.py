@@ -0,0 +1,2 @@
+from .replay_engine import ReplayEngine, ReplayWebSocket
+from .stand_ins import StaticInavAdapter
\ No newline at end of file
@@ -0,0 +1,92 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Callable, Iterable
+
+from src.infrastructure.adapters.recording.tick_journal import JournalRecord
+
+
+class ReplayWebSocket:
+    """
+    Stand-in for the websocket handed to on_message handlers, heartbeat
+    replies are dropped.
+    """
+    def __init__(self):
+        self.keep_running = True
+        self.sent = 0
+
+    def send(self, data):
+        self.sent += 1
+
+    def close(self):
+        self.keep_running = False
+
+
+class ReplayEngine:
+    """
+    Feeds recorded frames back through the adapters' on_message handlers.
+
+    speed = 1 replays in real time, speed = N replays N times faster and
+    speed = 0 replays as fast as possible.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        records: Iterable[JournalRecord],
+        speed: float = 0
+    ):
+        self.logger = logger
+        self.records = records
+        self.speed = speed
+        self.handlers: dict[int, Callable] = {}
+        self.ws = ReplayWebSocket()
+
+    def register(self, feed_id: int, handler: Callable):
+        """
+        handler has the websocket-client on_message signature: (ws, message).
+        """
+        self.handlers[feed_id] = handler
+
+    def wait_until(self, record: JournalRecord, first_record_ns: int, started_at_ns: int):
+        target_ns = started_at_ns + (record.recv_time_ns - first_record_ns) / self.speed
+        delay = (target_ns - time.perf_counter_ns()) / 1e9
+        if delay > 0:
+            time.sleep(delay)
+
+    def run(self) -> dict:
+        frames_per_feed = defaultdict(int)
+        skipped = 0
+        errors = 0
+        first_record_ns = None
+        started_at_ns = time.perf_counter_ns()
+
+        for record in self.records:
+            handler = self.handlers.get(record.feed_id)
+            if handler is None:
+                skipped += 1
+                continue
+
+            if first_record_ns is None:
+                first_record_ns = record.recv_time_ns
+            if self.speed > 0:
+                self.wait_until(record, first_record_ns, started_at_ns)
+
+            try:
+                handler(self.ws, record.payload)
+            except Exception as err:
+                errors += 1
+                self.logger.error(f"[ReplayEngine] Handler for feed {record.feed_id} failed, reason: {err}")
+            frames_per_feed[record.feed_id] += 1
+
+        elapsed = (time.perf_counter_ns() - started_at_ns) / 1e9
+        frames = sum(frames_per_feed.values())
+        stats = {
+            "frames": frames,
+            "frames_per_feed": dict(frames_per_feed),
+            "skipped": skipped,
+            "errors": errors,
+            "elapsed_seconds": round(elapsed, 6),
+            "frames_per_second": round(frames / elapsed, 2) if elapsed else 0.0
+        }
+        self.logger.info(f"[ReplayEngine] Replay finished: {stats}")
+        return stats
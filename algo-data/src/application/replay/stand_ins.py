@@ -0,0 +1,23 @@
+from src.infrastructure.adapters.inav_md_adapter import InavMDAdapter
+
+
+
+class StaticInavAdapter(InavMDAdapter):
+    """
+    Serves fixed underlying quantities so replays never call Hashdex.
+    """
+    def __init__(self, quantities: dict[str, float], baskets: dict[str, dict] = None):
+        self.quantities = quantities
+        self.baskets = baskets or {}
+
+    def fetch_price(self, ticker: str) -> float:
+        raise NotImplementedError("Static adapter does not serve iNAV prices")
+
+    def get_crypto_quantity_on_onshore_etf(self, onshore_ticker: str, offshore_ticker: str) -> float:
+        return self.quantities[onshore_ticker]
+
+    def fetch_pcf(self, onshore_ticker: str, offshore_ticker: str) -> dict:
+        pcf = super().fetch_pcf(onshore_ticker, offshore_ticker)
+        if onshore_ticker in self.baskets:
+            pcf["basket"] = self.baskets[onshore_ticker]
+        return pcf
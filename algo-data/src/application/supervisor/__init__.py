@@ -0,0 +1 @@
+from .process_supervisor import ProcessSupervisor, ProcessSpec, RestartPolicy, load_supervisor_config
\ No newline at end of file
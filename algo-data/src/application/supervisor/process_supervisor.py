@@ -0,0 +1,263 @@
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from enum import Enum
+from multiprocessing import Process
+from typing import Callable, List
+
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.metrics import MetricsRegistry, MetricsServer
+from src.infrastructure.adapters.metrics.metrics_registry import format_labels
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class RestartPolicy(str, Enum):
+    ALWAYS = "always"
+    ON_FAILURE = "on-failure"
+    NEVER = "never"
+
+
+class ProcessSpec:
+    def __init__(
+        self,
+        name: str,
+        target: Callable,
+        args: tuple = (),
+        enabled: bool = True,
+        cpus: List[int] = None,
+        restart: RestartPolicy = RestartPolicy.ALWAYS,
+        min_backoff: float = 1,
+        max_backoff: float = 60,
+        stable_after: float = 60,
+        metrics_port: int = None
+    ):
+        self.name = name
+        self.target = target
+        self.args = args
+        self.enabled = enabled
+        self.cpus = cpus
+        self.restart = RestartPolicy(restart)
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        # A process that ran this long before exiting starts over from min_backoff.
+        self.stable_after = stable_after
+        # The process serves its own /metrics here when set.
+        self.metrics_port = metrics_port
+
+    def apply_config(self, config: dict) -> "ProcessSpec":
+        for field in ("enabled", "cpus", "min_backoff", "max_backoff", "stable_after", "metrics_port"):
+            if field in config:
+                setattr(self, field, config[field])
+        if "restart" in config:
+            self.restart = RestartPolicy(config["restart"])
+        return self
+
+
+def load_supervisor_config(value: str = None) -> dict:
+    """
+    Per process overrides from SUPERVISOR_CONFIG, either inline JSON or the
+    path to a JSON file, e.g. {"binance-md": {"cpus": [2]}, "inav": {"enabled": true}}.
+    """
+    value = value if value is not None else os.environ.get(f"SUPERVISOR_CONFIG_{ENV}")
+    if not value:
+        return {}
+    if value.strip().startswith("{"):
+        return json.loads(value)
+    with open(value) as config_file:
+        return json.load(config_file)
+
+
+def run_pinned(target: Callable, cpus: List[int], args: tuple, logger: logging.Logger = None, metrics_port: int = None):
+    # Forked children inherit the supervisor's handler, terminate() must stop them.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    if cpus and hasattr(os, "sched_setaffinity"):
+        # Threads started by the target inherit the affinity.
+        os.sched_setaffinity(0, cpus)
+    if metrics_port is not None:
+        MetricsServer(logger or logging.getLogger(__name__), metrics_port).start()
+    target(*args)
+
+
+class SupervisedProcess:
+    def __init__(self, spec: ProcessSpec):
+        self.spec = spec
+        self.process: Process = None
+        self.started_at: float = None
+        self.restart_at: float = None
+        self.restarts = 0
+        self.consecutive_failures = 0
+        self.last_exit_code: int = None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def get_uptime(self) -> float:
+        return time.monotonic() - self.started_at if self.is_alive() else 0.0
+
+    def get_stats(self) -> dict:
+        return {
+            "alive": self.is_alive(),
+            "pid": self.process.pid if self.is_alive() else None,
+            "restarts": self.restarts,
+            "last_exit_code": self.last_exit_code,
+            "uptime": round(self.get_uptime(), 1),
+            "cpus": self.spec.cpus
+        }
+
+
+class ProcessSupervisor:
+    """
+    Starts the enabled processes, each pinned to its CPU set, and restarts
+    them by policy with exponential backoff. Liveness and restart counts are
+    logged every stats_interval and available from get_stats.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        specs: List[ProcessSpec],
+        check_interval: float = 1,
+        stats_interval: float = 60,
+        stop_timeout: float = 10,
+        metrics_port: int = None
+    ):
+        self.logger = logger
+        self.check_interval = check_interval
+        self.stats_interval = stats_interval
+        self.stop_timeout = stop_timeout
+        self.metrics_port = metrics_port
+        self.metrics_server: MetricsServer = None
+        self.processes = {spec.name: SupervisedProcess(spec) for spec in specs if spec.enabled}
+        self._stop_event = threading.Event()
+        self.available_cpus = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+
+    def get_cpus(self, spec: ProcessSpec) -> List[int]:
+        if not spec.cpus or self.available_cpus is None:
+            return None
+        cpus = [cpu for cpu in spec.cpus if cpu in self.available_cpus]
+        if len(cpus) < len(spec.cpus):
+            self.logger.warning(
+                f"[ProcessSupervisor] {spec.name} CPUs {sorted(set(spec.cpus) - set(cpus))} are not available"
+            )
+        return cpus or None
+
+    def start_process(self, supervised: SupervisedProcess):
+        spec = supervised.spec
+        supervised.process = Process(
+            target=run_pinned,
+            args=(spec.target, self.get_cpus(spec), spec.args, self.logger, spec.metrics_port),
+            name=spec.name
+        )
+        supervised.process.start()
+        supervised.started_at = time.monotonic()
+        supervised.restart_at = None
+        self.logger.info(f"[ProcessSupervisor] Started {spec.name} (pid {supervised.process.pid}, cpus {spec.cpus})")
+
+    def get_backoff(self, supervised: SupervisedProcess) -> float:
+        spec = supervised.spec
+        return min(spec.max_backoff, spec.min_backoff * 2 ** max(0, supervised.consecutive_failures - 1))
+
+    def handle_exit(self, supervised: SupervisedProcess, now: float):
+        spec = supervised.spec
+        exit_code = supervised.process.exitcode
+        supervised.last_exit_code = exit_code
+        ran_for = now - supervised.started_at
+        supervised.process = None
+
+        if ran_for >= spec.stable_after:
+            supervised.consecutive_failures = 0
+        supervised.consecutive_failures += 1
+
+        if spec.restart == RestartPolicy.NEVER or (spec.restart == RestartPolicy.ON_FAILURE and exit_code == 0):
+            self.logger.warning(f"[ProcessSupervisor] {spec.name} exited with code {exit_code}, not restarting")
+            return
+
+        backoff = self.get_backoff(supervised)
+        supervised.restart_at = now + backoff
+        self.logger.error(
+            f"[ProcessSupervisor] {spec.name} exited with code {exit_code} after {ran_for:.1f}s, "
+            f"restarting in {backoff:.1f}s"
+        )
+
+    def check_processes(self):
+        now = time.monotonic()
+        for supervised in self.processes.values():
+            if supervised.process is not None and not supervised.process.is_alive():
+                self.handle_exit(supervised, now)
+            if supervised.restart_at is not None and now >= supervised.restart_at:
+                supervised.restarts += 1
+                self.start_process(supervised)
+
+    def get_stats(self) -> dict:
+        return {name: supervised.get_stats() for name, supervised in self.processes.items()}
+
+    def log_stats(self):
+        self.logger.info(f"[ProcessSupervisor] {self.get_stats()}")
+
+    def render_metrics(self) -> list:
+        lines = [
+            "# HELP supervised_process_up Whether the process is running",
+            "# TYPE supervised_process_up gauge",
+        ]
+        lines.extend(
+            f"supervised_process_up{format_labels(('process', ), (name, ))} {int(supervised.is_alive())}"
+            for name, supervised in self.processes.items()
+        )
+        lines.extend([
+            "# HELP supervised_process_restarts_total Restarts since the supervisor started",
+            "# TYPE supervised_process_restarts_total counter",
+        ])
+        lines.extend(
+            f"supervised_process_restarts_total{format_labels(('process', ), (name, ))} {supervised.restarts}"
+            for name, supervised in self.processes.items()
+        )
+        return lines
+
+    def start(self):
+        if self.metrics_port is not None:
+            MetricsRegistry.get_default().add_collector(self.render_metrics)
+            self.metrics_server = MetricsServer(self.logger, self.metrics_port)
+            self.metrics_server.start()
+        for supervised in self.processes.values():
+            self.start_process(supervised)
+
+    def stop(self, *_):
+        self._stop_event.set()
+
+    def shutdown(self):
+        for supervised in self.processes.values():
+            if supervised.is_alive():
+                supervised.process.terminate()
+        deadline = time.monotonic() + self.stop_timeout
+        for supervised in self.processes.values():
+            if supervised.process is None:
+                continue
+            supervised.process.join(max(0.0, deadline - time.monotonic()))
+            if supervised.process.is_alive():
+                self.logger.warning(f"[ProcessSupervisor] {supervised.spec.name} did not stop, killing it")
+                supervised.process.kill()
+                supervised.process.join()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        self.logger.info("[ProcessSupervisor] All processes terminated.")
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self.stop)
+        self.start()
+        last_stats_time = time.monotonic()
+        try:
+            while not self._stop_event.wait(self.check_interval):
+                self.check_processes()
+                if time.monotonic() - last_stats_time >= self.stats_interval:
+                    self.log_stats()
+                    last_stats_time = time.monotonic()
+        except KeyboardInterrupt:
+            self.logger.info("[ProcessSupervisor] KeyboardInterrupt received. Terminating child processes...")
+        finally:
+            self.shutdown()
@@ -1,2 +1,3 @@
 from .orders import SimpleOrder,  OrderCreationManager, OrderCreationError
-from .algorithms import *
\ No newline at end of file
+from .algorithms import *
+from .market_data import BasketInavEngine
\ No newline at end of file
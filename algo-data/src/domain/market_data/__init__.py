@@ -0,0 +1 @@
+from .basket_inav_engine import BasketInavEngine
\ No newline at end of file
@@ -0,0 +1,82 @@
+import math
+from typing import Dict, List
+
+import numpy as np
+
+
+
+class BasketInavEngine:
+    """
+    iNAV in underlying currency for many ETFs at once.
+
+    weights[etf, underlying] holds the quantity of each underlying per ETF
+    share. A tick on one underlying only touches the ETFs that hold it and
+    shifts their iNAV by weight * price change, so each tick costs
+    O(affected ETFs). ETFs stay NaN until every underlying they hold has a
+    price.
+    """
+    def __init__(self, etfs: List[str], underlyings: List[str]):
+        self.etfs = list(etfs)
+        self.underlyings = list(underlyings)
+        self.etf_index: Dict[str, int] = {etf: index for index, etf in enumerate(self.etfs)}
+        self.underlying_index: Dict[str, int] = {underlying: index for index, underlying in enumerate(self.underlyings)}
+
+        self.weights = np.zeros((len(self.etfs), len(self.underlyings)))
+        self.cash = np.zeros(len(self.etfs))
+        self.prices = np.full(len(self.underlyings), np.nan)
+        self.inavs = np.full(len(self.etfs), np.nan)
+        # Per underlying: rows of the ETFs holding it and their weights, kept
+        # contiguous so a tick does no column gathers.
+        self.affected_rows: List[np.ndarray] = [np.empty(0, dtype=np.intp) for _ in self.underlyings]
+        self.affected_weights: List[np.ndarray] = [np.empty(0) for _ in self.underlyings]
+
+    def set_weights(self, etf: str, weights: Dict[str, float], cash: float = 0.0):
+        """
+        Replace the basket of one ETF, unknown underlyings raise KeyError.
+        """
+        row = self.etf_index[etf]
+        self.weights[row] = 0.0
+        for underlying, weight in weights.items():
+            self.weights[row, self.underlying_index[underlying]] = weight
+        self.cash[row] = cash
+
+        for column in range(len(self.underlyings)):
+            self.affected_rows[column] = np.flatnonzero(self.weights[:, column])
+            self.affected_weights[column] = self.weights[self.affected_rows[column], column]
+        self.recompute(np.array([row]))
+
+    def get_weights(self, etf: str) -> Dict[str, float]:
+        row = self.weights[self.etf_index[etf]]
+        return {self.underlyings[column]: float(row[column]) for column in np.flatnonzero(row)}
+
+    def recompute(self, rows: np.ndarray = None):
+        """
+        Full dot product for the given rows (all by default), used after
+        basket changes and to clear accumulated rounding.
+        """
+        if rows is None:
+            rows = np.arange(len(self.etfs))
+        held = self.weights[rows] != 0
+        # Weights of zero must not pull in NaN prices of underlyings the ETF does not hold.
+        priced = np.where(held, self.prices, 0.0)
+        self.inavs[rows] = np.einsum("ij,ij->i", self.weights[rows], priced) + self.cash[rows]
+        missing = (held & np.isnan(self.prices)).any(axis=1)
+        self.inavs[rows[missing]] = np.nan
+
+    def update_price(self, underlying: str, price: float) -> np.ndarray:
+        """
+        Apply a tick and return the indexes of the ETFs whose iNAV moved.
+        """
+        column = self.underlying_index[underlying]
+        rows = self.affected_rows[column]
+        previous_price = self.prices.item(column)
+        self.prices[column] = price
+
+        if math.isnan(previous_price):
+            self.recompute(rows)
+        elif len(rows):
+            self.inavs[rows] += self.affected_weights[column] * (price - previous_price)
+        return rows
+
+    def get_inav(self, etf: str) -> float:
+        return float(self.inavs[self.etf_index[etf]])
@@ -5,5 +5,8 @@ from .crypto import (
 from .stocks import HashdexMDAdapter, FlowaTradeReporter
 from .logger_adapter import LoggerAdapter
 from .queue import RedisAdapter
+from .cache import FxCache, PcfCache
+from .http import AsyncHttpClient
+from .recording import TickJournal, TickJournalReader, FeedId
 from .md_adapter import MDAdapter
 from .websocket_adapter import WebsocketAdapter
\ No newline at end of file
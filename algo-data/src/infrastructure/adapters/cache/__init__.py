@@ -0,0 +1,4 @@
+from .fx_cache import FxCache, FxUnavailableError
+from .pcf_cache import PcfCache, PcfUnavailableError
+from .file_lock import FileLock
+from .shared_value_cache import SharedValueCache, CachedValue, SharedCacheFullError
\ No newline at end of file
@@ -0,0 +1,21 @@
+import fcntl
+import os
+
+
+class FileLock:
+    """
+    Exclusive flock on path, held for the duration of a with block. Used to
+    serialize work between processes that share a directory.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.fd: int = None
+
+    def __enter__(self):
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        os.close(self.fd)
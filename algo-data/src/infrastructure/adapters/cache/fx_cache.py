@@ -0,0 +1,96 @@
+import logging
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+from src.infrastructure.adapters.cache.shared_value_cache import SharedValueCache
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class FxCache:
+    """
+    In-process FX rate kept current by the `fx-{symbol}` channel, so readers
+    on the tick path never go to the broker. When the host shared cache has
+    a fresh rate it takes precedence, it is written before the event is sent.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        message_broker: RedisAdapter,
+        symbol: str = "USD:BRL",
+        max_age: float = None,
+        retry_time: int = 2,
+        shared_cache: SharedValueCache = None
+    ):
+        self.logger = logger
+        self.message_broker = message_broker
+        self.symbol = symbol
+        self.channel = f"fx-{symbol}"
+        self.max_age = float(max_age or os.environ.get(f"FX_MAX_AGE_{ENV}", 30))
+        self.retry_time = retry_time
+        self.shared_cache = shared_cache
+
+        self.rate: float = None
+        self.updated_at: float = None
+        self.last_stale_warning: float = 0
+        self.listener_thread: threading.Thread = None
+
+    def on_fx_update(self, data: dict):
+        self.rate = float(data["price"])
+        self.updated_at = time.monotonic()
+        self.logger.debug(f"[FxCache] {self.symbol} updated: {self.rate}")
+
+    def warm_up(self):
+        rate = self.message_broker.get_key(self.symbol)
+        if rate is not None:
+            self.on_fx_update({"price": rate})
+
+    def get_age(self) -> float:
+        if self.updated_at is None:
+            return float("inf")
+        return time.monotonic() - self.updated_at
+
+    def is_stale(self) -> bool:
+        return self.get_age() > self.max_age
+
+    def get_rate(self) -> float:
+        if self.shared_cache:
+            cached = self.shared_cache.get(self.symbol, self.max_age)
+            if cached is not None:
+                return cached.value
+
+        if self.rate is None:
+            raise FxUnavailableError(f"No {self.symbol} rate was received yet")
+
+        if self.is_stale() and time.monotonic() - self.last_stale_warning > self.max_age:
+            self.last_stale_warning = time.monotonic()
+            self.logger.warning(f"[FxCache] {self.symbol} rate is stale, last update {self.get_age():.1f}s ago")
+        return self.rate
+
+    def listen(self):
+        while True:
+            try:
+                self.message_broker.start_listening()
+            except Exception as err:
+                self.logger.error(f"[FxCache] Listener crashed, reason: {err}")
+            time.sleep(self.retry_time)
+            self.warm_up()
+
+    def start(self):
+        self.warm_up()
+        self.message_broker.subscribe(self.channel, self.on_fx_update)
+        self.listener_thread = threading.Thread(
+            target=self.listen,
+            daemon=True
+        )
+        self.listener_thread.start()
+
+
+class FxUnavailableError(Exception):
+    pass
@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.inav_md_adapter import InavMDAdapter
+from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+from src.infrastructure.adapters.cache.shared_value_cache import SharedValueCache
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+# Bump when the stored entry layout changes, older entries are ignored on warm up.
+PCF_SCHEMA_VERSION = 2
+
+
+class PcfCache:
+    """
+    Underlying quantity per ETF share, refreshed from the PCF source on a
+    background thread and persisted to `pcf:{symbol}` so restarts and other
+    processes read it without calling the source.
+
+    Multi-asset sources also fill `basket`, the quantity of every holding
+    per ETF share. Each entry carries a version that increases whenever the
+    quantity or basket changes, and changes are announced on the `pcf-{symbol}` channel.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        pcf_source: InavMDAdapter,
+        store: RedisAdapter,
+        etf_mapping: dict,
+        refresh_interval: float = None,
+        retry_time: float = 30,
+        shared_cache: SharedValueCache = None
+    ):
+        self.logger = logger
+        self.pcf_source = pcf_source
+        self.store = store
+        # onshore ticker -> offshore ticker
+        self.etf_mapping = etf_mapping
+        self.refresh_interval = float(refresh_interval or os.environ.get(f"PCF_REFRESH_INTERVAL_{ENV}", 3600))
+        self.retry_time = retry_time
+        self.shared_cache = shared_cache
+        self.entries: dict[str, dict] = {}
+        self.quantities: dict[str, float] = {}
+        # Bumped on every entry load so readers can notice changes with one int compare.
+        self.generation = 0
+        self.refresh_thread: threading.Thread = None
+
+    @staticmethod
+    def get_store_key(symbol: str) -> str:
+        return f"pcf:{symbol}"
+
+    def load_entry(self, entry: dict):
+        self.entries[entry["symbol"]] = entry
+        self.quantities[entry["symbol"]] = entry["amount_of_underlying_asset"]
+        self.generation += 1
+        if self.shared_cache:
+            self.shared_cache.put(self.get_store_key(entry["symbol"]), entry["amount_of_underlying_asset"])
+
+    def warm_up(self):
+        for symbol in self.etf_mapping:
+            entry = self.store.get_key(self.get_store_key(symbol))
+            if not entry or entry.get("schema") != PCF_SCHEMA_VERSION:
+                continue
+            self.load_entry(entry)
+            self.logger.info(f"[PcfCache] {symbol} warmed up from store: {entry}")
+
+    def refresh(self, symbol: str) -> dict:
+        pcf = self.pcf_source.fetch_pcf(symbol, self.etf_mapping[symbol])
+        current = self.entries.get(symbol)
+        changed = (
+            current is None
+            or current["amount_of_underlying_asset"] != pcf["amount_of_underlying_asset"]
+            or current.get("basket") != pcf.get("basket")
+        )
+
+        entry = dict(
+            pcf,
+            symbol=symbol,
+            schema=PCF_SCHEMA_VERSION,
+            version=(current["version"] + 1 if changed else current["version"]) if current else 1,
+            as_of=datetime.now().date().isoformat(),
+            updated_at=time.time()
+        )
+        with self.store.batch():
+            self.store.set_key(self.get_store_key(symbol), json.dumps(entry))
+            if changed:
+                self.logger.info(f"[PcfCache] {symbol} quantity changed to {entry['amount_of_underlying_asset']} (version {entry['version']})")
+                self.store.publish_message(f"pcf-{symbol}", entry)
+        # Loaded after the store write so a failed write is retried, and published, on the next refresh.
+        self.load_entry(entry)
+        return entry
+
+    def refresh_all(self) -> bool:
+        refreshed = True
+        for symbol in self.etf_mapping:
+            try:
+                self.refresh(symbol)
+            except Exception as err:
+                refreshed = False
+                self.logger.error(f"[PcfCache] Could not refresh {symbol}, reason: {err}")
+        return refreshed
+
+    def run_refresher(self, initial_delay: float = 0):
+        time.sleep(initial_delay)
+        while True:
+            refreshed = self.refresh_all()
+            time.sleep(self.refresh_interval if refreshed else self.retry_time)
+
+    def get_quantity(self, symbol: str) -> float:
+        try:
+            return self.quantities[symbol]
+        except KeyError:
+            raise PcfUnavailableError(f"No PCF cached for {symbol}")
+
+    def start(self):
+        self.warm_up()
+        initial_delay = 0
+        missing = [symbol for symbol in self.etf_mapping if symbol not in self.quantities]
+        if missing:
+            # Ticks cannot be priced without quantities, so cold starts load them first.
+            self.logger.info(f"[PcfCache] No stored PCF for {missing}, fetching before start")
+            if self.refresh_all():
+                initial_delay = self.refresh_interval
+
+        self.refresh_thread = threading.Thread(
+            target=self.run_refresher,
+            args=(initial_delay,),
+            daemon=True
+        )
+        self.refresh_thread.start()
+
+
+class PcfUnavailableError(Exception):
+    pass
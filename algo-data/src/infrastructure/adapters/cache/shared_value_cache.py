@@ -0,0 +1,204 @@
+import logging
+import os
+import struct
+import tempfile
+import time
+import zlib
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.cache.file_lock import FileLock
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+# magic, layout version, slot count
+HEADER = struct.Struct("<4sII")
+HEADER_SIZE = 64
+MAGIC = b"LVC1"
+LAYOUT_VERSION = 1
+
+# sequence, key, value, quantity, updated at (epoch seconds); one cache line
+SLOT_SIZE = 64
+SEQ = struct.Struct("<Q")
+KEY = struct.Struct("<32s")
+FIELDS = struct.Struct("<ddd")
+KEY_OFFSET = SEQ.size
+FIELDS_OFFSET = KEY_OFFSET + KEY.size
+
+CachedValue = namedtuple("CachedValue", ["value", "quantity", "updated_at"])
+
+
+class SharedValueCache:
+    """
+    Host-wide last-value cache in shared memory: fixed 64 byte slots keyed by
+    name (e.g. `inav:BITH11`, `USD:BRL`), each guarded by a seqlock. A key
+    must have a single writer; readers never block it and retry a read that
+    raced with a write.
+
+    Only writers create the segment. Readers that find no segment return None
+    and retry attaching later, so callers fall back to Redis. Containers must
+    share the IPC namespace for the segment to be visible across them.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        name: str = None,
+        slots: int = None,
+        create: bool = False,
+        attach_retry: float = 5,
+        max_spins: int = 100
+    ):
+        self.logger = logger
+        self.name = name or os.environ.get(f"SHARED_CACHE_NAME_{ENV}", "trading-system-lvc")
+        self.slots = int(slots or os.environ.get(f"SHARED_CACHE_SLOTS_{ENV}", 256))
+        self.create = create
+        self.attach_retry = attach_retry
+        self.max_spins = max_spins
+
+        self.shm: shared_memory.SharedMemory = None
+        self.buffer: memoryview = None
+        self.slot_index: dict = {}
+        self.last_attach_attempt: float = None
+        self.torn_reads = 0
+
+        self.open()
+
+    def open(self) -> bool:
+        self.last_attach_attempt = time.monotonic()
+        size = HEADER_SIZE + self.slots * SLOT_SIZE
+        try:
+            if self.create:
+                with self._allocation_lock():
+                    try:
+                        shm = shared_memory.SharedMemory(self.name, create=True, size=size)
+                        HEADER.pack_into(shm.buf, 0, MAGIC, LAYOUT_VERSION, self.slots)
+                    except FileExistsError:
+                        shm = shared_memory.SharedMemory(self.name)
+            else:
+                shm = shared_memory.SharedMemory(self.name)
+        except FileNotFoundError:
+            return False
+        except Exception as err:
+            self.logger.error(f"[SharedValueCache] Could not open segment {self.name}, reason: {err}")
+            return False
+
+        # The segment outlives any single process, keep the resource tracker
+        # from unlinking it when this one exits.
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+        magic, version, slots = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self.logger.error(f"[SharedValueCache] Segment {self.name} has an unknown layout: {magic}/{version}")
+            shm.close()
+            return False
+
+        self.shm = shm
+        self.buffer = shm.buf
+        self.slots = slots
+        return True
+
+    def is_attached(self) -> bool:
+        if self.buffer is not None:
+            return True
+        if time.monotonic() - self.last_attach_attempt >= self.attach_retry:
+            return self.open()
+        return False
+
+    def _allocation_lock(self):
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        return FileLock(os.path.join(directory, f"{self.name}.lock"))
+
+    def _find_slot(self, key: bytes, claim: bool) -> int:
+        offset = self.slot_index.get(key)
+        if offset is not None:
+            return offset
+
+        start = zlib.crc32(key) % self.slots
+        for probe in range(self.slots):
+            offset = HEADER_SIZE + (start + probe) % self.slots * SLOT_SIZE
+            slot_key = KEY.unpack_from(self.buffer, offset + KEY_OFFSET)[0].rstrip(b"\0")
+            if slot_key == key:
+                self.slot_index[key] = offset
+                return offset
+            if not slot_key:
+                if not claim:
+                    return None
+                with self._allocation_lock():
+                    # Another writer may have claimed it meanwhile.
+                    slot_key = KEY.unpack_from(self.buffer, offset + KEY_OFFSET)[0].rstrip(b"\0")
+                    if not slot_key:
+                        KEY.pack_into(self.buffer, offset + KEY_OFFSET, key)
+                        self.slot_index[key] = offset
+                        return offset
+                    if slot_key == key:
+                        self.slot_index[key] = offset
+                        return offset
+        if claim:
+            raise SharedCacheFullError(f"All {self.slots} slots of {self.name} are taken")
+        return None
+
+    def put(self, key: str, value: float, quantity: float = float("nan")):
+        if not self.is_attached():
+            return
+        encoded_key = key.encode()
+        if len(encoded_key) > KEY.size:
+            raise ValueError(f"Key {key} is longer than {KEY.size} bytes")
+
+        offset = self._find_slot(encoded_key, claim=True)
+        seq = SEQ.unpack_from(self.buffer, offset)[0]
+        # Odd while the write is in progress.
+        seq = seq if seq & 1 else seq + 1
+        SEQ.pack_into(self.buffer, offset, seq)
+        FIELDS.pack_into(self.buffer, offset + FIELDS_OFFSET, value, quantity, time.time())
+        SEQ.pack_into(self.buffer, offset, seq + 1)
+
+    def get(self, key: str, max_age: float = None) -> CachedValue:
+        if not self.is_attached():
+            return None
+        offset = self._find_slot(key.encode(), claim=False)
+        if offset is None:
+            return None
+
+        buffer = self.buffer
+        for _ in range(self.max_spins):
+            seq = SEQ.unpack_from(buffer, offset)[0]
+            if seq & 1:
+                continue
+            fields = FIELDS.unpack_from(buffer, offset + FIELDS_OFFSET)
+            if SEQ.unpack_from(buffer, offset)[0] != seq:
+                continue
+            if not seq or (max_age is not None and time.time() - fields[2] > max_age):
+                return None
+            return CachedValue(*fields)
+
+        self.torn_reads += 1
+        return None
+
+    def close(self):
+        if self.shm is not None:
+            self.buffer = None
+            self.shm.close()
+            self.shm = None
+
+    def unlink(self):
+        if self.shm is None:
+            # Attaching registers the segment with the tracker, unlink unregisters it.
+            shm = shared_memory.SharedMemory(self.name)
+        else:
+            shm = self.shm
+            resource_tracker.register(shm._name, "shared_memory")
+        self.close()
+        shm.close()
+        shm.unlink()
+        try:
+            os.remove(self._allocation_lock().path)
+        except FileNotFoundError:
+            pass
+
+
+class SharedCacheFullError(Exception):
+    pass
@@ -1,2 +1,3 @@
-from .binance import BinanceMDAdapter, BinanceCoinMWebsocketAdapter
-from .coinbase import CoinbaseDollarAdapter
\ No newline at end of file
+from .binance import BinanceMDAdapter, BinanceCoinMWebsocketAdapter, BinanceCoinMDepthAdapter, BinanceCoinMStreamEngine, BinanceSpotFxAdapter
+from .coinbase import CoinbaseDollarAdapter
+from .order_book import L2OrderBook, PriceSource
\ No newline at end of file
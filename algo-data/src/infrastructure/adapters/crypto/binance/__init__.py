@@ -1,2 +1,5 @@
 from .binance_md_adapter import BinanceMDAdapter
-from .binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
\ No newline at end of file
+from .binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+from .binance_coinm_depth_adapter import BinanceCoinMDepthAdapter
+from .binance_coinm_stream_engine import BinanceCoinMStreamEngine
+from .binance_spot_fx_adapter import BinanceSpotFxAdapter
\ No newline at end of file
@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import threading
+from collections import deque
+from typing import Deque, Dict
+
+import requests
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.crypto.binance.binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+from src.infrastructure.adapters.crypto.order_book import L2OrderBook, PriceSource
+from src.infrastructure.adapters.recording.tick_journal import TickJournal, FeedId
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class BinanceCoinMDepthAdapter(BinanceCoinMWebsocketAdapter):
+    """
+    Maintains local L2 books from Coin-M diff depth streams and emits the
+    configured book price instead of the last trade.
+
+    Follows Binance's book sync procedure: diffs are buffered until a REST
+    snapshot arrives, and any break in the pu -> u chain drops the book and
+    triggers a new snapshot in the background.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        streams: list = None,
+        host: str = None,
+        recorder: TickJournal = None,
+        rest_endpoint: str = None,
+        price_source: PriceSource = None,
+        depth_quantity: float = None,
+        snapshot_limit: int = 1000,
+        max_pending_events: int = 10000
+    ) -> None:
+        super().__init__(
+            logger,
+            # Example: ["btcusd_perp@depth@100ms", "ethusd_perp@depth@100ms"]
+            streams=streams if streams is not None else json.loads(os.environ.get(f"BINANCE_COINM_DEPTH_STREAMS_{ENV}")),
+            host=host,
+            recorder=recorder
+        )
+        self.rest_endpoint: str = rest_endpoint or os.environ.get(f"BINANCE_COINM_REST_ENDPOINT_{ENV}", "https://dapi.binance.com")
+        self.price_source = PriceSource(price_source or os.environ.get(f"BINANCE_COINM_PRICE_SOURCE_{ENV}", PriceSource.MID.value))
+        if self.price_source == PriceSource.LAST:
+            raise ValueError("BinanceCoinMDepthAdapter prices from the book, use BinanceCoinMWebsocketAdapter for last prices")
+        # Contracts swept on each side for depth-weighted prices.
+        self.depth_quantity = depth_quantity or float(os.environ.get(f"BINANCE_COINM_DEPTH_QUANTITY_{ENV}", 100))
+        self.snapshot_limit = snapshot_limit
+        self.max_pending_events = max_pending_events
+        self.feed_id = FeedId.BINANCE_COINM_DEPTH
+        self.books: Dict[str, L2OrderBook] = {}
+        self.synced: Dict[str, bool] = {}
+        self.pending_events: Dict[str, Deque[dict]] = {}
+        self.snapshot_requested: Dict[str, bool] = {}
+        self.last_prices: Dict[str, float] = {}
+        self.resyncs: Dict[str, int] = {}
+        self.failed_events: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_book(self, symbol: str) -> L2OrderBook:
+        return self.books.get(symbol)
+
+    def fetch_snapshot(self, symbol: str) -> dict:
+        response = requests.get(
+            url=f"{self.rest_endpoint}/dapi/v1/depth",
+            params={"symbol": symbol, "limit": self.snapshot_limit},
+            timeout=10
+        )
+        response.raise_for_status()
+        if self.recorder:
+            self.recorder.record(FeedId.BINANCE_COINM_DEPTH_SNAPSHOT, response.content)
+        return response.json()
+
+    def request_snapshot(self, symbol: str):
+        if self.snapshot_requested.get(symbol):
+            return
+        self.snapshot_requested[symbol] = True
+        threading.Thread(target=self.load_snapshot, args=(symbol,), daemon=True).start()
+
+    def load_snapshot(self, symbol: str):
+        try:
+            snapshot = self.fetch_snapshot(symbol)
+        except Exception as err:
+            self.logger.error(f"Binance Coin-M depth: Could not fetch {symbol} snapshot, reason: {err}")
+            with self._lock:
+                self.snapshot_requested[symbol] = False
+            return
+
+        with self._lock:
+            self.snapshot_requested[symbol] = False
+            book = self.books.setdefault(symbol, L2OrderBook(symbol))
+            book.load_snapshot(snapshot["bids"], snapshot["asks"], snapshot["lastUpdateId"])
+            pending_events = list(self.pending_events.pop(symbol, ()))
+            self.synced[symbol] = True
+            for index, event in enumerate(pending_events):
+                try:
+                    applied = self.apply_event(symbol, event)
+                except Exception as err:
+                    self.failed_events[symbol] = self.failed_events.get(symbol, 0) + 1
+                    self.logger.error(f"Binance Coin-M depth: Could not apply {symbol} update {event.get('u')}, reason: {err}")
+                    self.resync(symbol, f"update {event.get('u')} failed to apply")
+                    applied = False
+                if not applied:
+                    # The rest are kept for the next snapshot, like live events after a gap.
+                    for pending_event in pending_events[index:]:
+                        self.buffer_event(symbol, pending_event)
+                    return
+        self.logger.info(f"Binance Coin-M depth: {symbol} book synced at update {snapshot['lastUpdateId']}")
+
+    def resync(self, symbol: str, reason: str):
+        self.logger.warning(f"Binance Coin-M depth: Resyncing {symbol} book, reason: {reason}")
+        self.synced[symbol] = False
+        self.resyncs[symbol] = self.resyncs.get(symbol, 0) + 1
+        self.last_prices.pop(symbol, None)
+        self.request_snapshot(symbol)
+
+    def apply_event(self, symbol: str, event: dict) -> bool:
+        """
+        Applies a diff to a synced book, returns False when the book had to be
+        dropped because of a sequence gap.
+        """
+        book = self.books[symbol]
+        last_update_id = book.last_update_id
+        if event["u"] < last_update_id:
+            return True
+
+        first_after_snapshot = event["U"] <= last_update_id <= event["u"]
+        if not first_after_snapshot and event["pu"] != last_update_id:
+            self.resync(symbol, f"expected pu {last_update_id}, got {event['pu']}")
+            return False
+
+        book.apply_diff(event["b"], event["a"], event["u"])
+        return True
+
+    def buffer_event(self, symbol: str, event: dict):
+        if symbol not in self.pending_events:
+            self.pending_events[symbol] = deque(maxlen=self.max_pending_events)
+        self.pending_events[symbol].append(event)
+
+    def on_connection_lost(self, streams: list = None):
+        with self._lock:
+            if streams is None:
+                symbols = list(self.synced)
+            else:
+                # "btcusd_perp@depth@100ms" carries BTCUSD_PERP.
+                symbols = [stream.split("@")[0].upper() for stream in streams]
+            for symbol in symbols:
+                self.synced[symbol] = False
+                self.pending_events.pop(symbol, None)
+                self.last_prices.pop(symbol, None)
+
+    def parse_message(self, message) -> tuple:
+        event = json.loads(message)["data"]
+        symbol = event["s"]
+
+        with self._lock:
+            if not self.synced.get(symbol):
+                self.buffer_event(symbol, event)
+                self.request_snapshot(symbol)
+                return None
+            if not self.apply_event(symbol, event):
+                self.buffer_event(symbol, event)
+                return None
+            price = self.books[symbol].get_price(self.price_source, self.depth_quantity)
+            # Resyncs clear last_prices from the snapshot thread.
+            if price is None or price == self.last_prices.get(symbol):
+                return None
+            self.last_prices[symbol] = price
+
+        event_time = event.get("E")
+        return symbol, price, event_time / 1000 if event_time else None
+
+    def get_stats(self) -> dict:
+        return {
+            symbol: {
+                "synced": self.synced.get(symbol, False),
+                "last_update_id": book.last_update_id,
+                "best_bid": book.best_bid(),
+                "best_ask": book.best_ask(),
+                "resyncs": self.resyncs.get(symbol, 0),
+                "failed_events": self.failed_events.get(symbol, 0)
+            }
+            for symbol, book in self.books.items()
+        }
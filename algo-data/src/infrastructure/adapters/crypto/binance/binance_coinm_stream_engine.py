@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Callable, List
+
+import websockets
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.crypto.binance.binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+# Binance caps combined streams at 200 per connection.
+MAX_STREAMS_PER_CONNECTION = 200
+
+
+class BinanceCoinMStreamEngine:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        websocket_adapter: BinanceCoinMWebsocketAdapter,
+        shard_count: int = None,
+        retry_time: float = 2,
+        max_retry_time: float = 30
+    ) -> None:
+        self.logger = logger
+        self.websocket_adapter = websocket_adapter
+        self.shard_count = shard_count or int(os.environ.get(f"BINANCE_COINM_SHARD_COUNT_{ENV}", 1))
+        self.retry_time = retry_time
+        self.max_retry_time = max_retry_time
+        self.shards: List[List[str]] = self.split_streams(self.websocket_adapter.streams, self.shard_count)
+        self.on_event: Callable = None
+        self.shard_reconnects: dict[int, int] = {shard_id: 0 for shard_id in range(len(self.shards))}
+        self.shard_messages: dict[int, int] = {shard_id: 0 for shard_id in range(len(self.shards))}
+
+    @staticmethod
+    def split_streams(streams: List[str], shard_count: int) -> List[List[str]]:
+        """
+        Spread streams round-robin over the shards, never exceeding the
+        per-connection stream limit.
+        """
+        if not streams:
+            return []
+        shard_count = max(shard_count, math.ceil(len(streams) / MAX_STREAMS_PER_CONNECTION))
+        shard_count = min(shard_count, len(streams))
+        return [streams[shard_id::shard_count] for shard_id in range(shard_count)]
+
+    def get_shard_url(self, shard_streams: List[str]) -> str:
+        stream_path = "/".join(shard_streams)
+        return f"{self.websocket_adapter.host}/stream?streams={stream_path}"
+
+    def handle_message(self, shard_id: int, message):
+        received_at = time.time()
+        self.shard_messages[shard_id] += 1
+        self.websocket_adapter.record_message(message)
+        try:
+            tick = self.websocket_adapter.parse_message(message)
+            if tick is None:
+                return
+            asset, price, event_time = tick
+            # The callback must not block, collectors hand ticks off to their own publisher stage.
+            self.on_event(self.websocket_adapter.provider, asset, price, event_time, received_at)
+        except Exception as err:
+            self.logger.error(f"Binance Coin-M shard {shard_id}: Could not process message, reason: {err}")
+
+    async def run_shard(self, shard_id: int, shard_streams: List[str]):
+        url = self.get_shard_url(shard_streams)
+        retry_time = self.retry_time
+
+        while True:
+            try:
+                async with websockets.connect(url, compression=None, max_queue=None) as ws:
+                    self.logger.info(f"Binance Coin-M shard {shard_id}: Streams: {shard_streams}")
+                    retry_time = self.retry_time
+                    async for message in ws:
+                        self.handle_message(shard_id, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.error(f"Binance Coin-M shard {shard_id}: Connection lost, reason: {err}")
+            # Only this shard's books go stale, the other shards keep streaming.
+            self.websocket_adapter.on_connection_lost(shard_streams)
+
+            self.shard_reconnects[shard_id] += 1
+            self.logger.info(f"Binance Coin-M shard {shard_id}: Reconnecting in {retry_time} seconds...")
+            await asyncio.sleep(retry_time)
+            retry_time = min(retry_time * 2, self.max_retry_time)
+
+    async def run(self, callback: Callable):
+        self.on_event = callback
+        self.logger.info(f"Binance Coin-M: Starting {len(self.shards)} shard(s) for {len(self.websocket_adapter.streams)} streams")
+
+        tasks = [
+            asyncio.create_task(self.run_shard(shard_id, shard_streams))
+            for shard_id, shard_streams in enumerate(self.shards)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
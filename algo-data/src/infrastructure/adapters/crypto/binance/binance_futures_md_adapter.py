@@ -2,11 +2,13 @@ from typing import Callable
 import logging
 import json
 import os
+import time
 
 import websocket
 from dotenv import load_dotenv
 
 from src.infrastructure.adapters.websocket_adapter import WebsocketAdapter
+from src.infrastructure.adapters.recording.tick_journal import TickJournal, FeedId
 
 load_dotenv()
 
@@ -16,22 +18,50 @@ ENV = os.environ.get("ENV", "DEV")
 class BinanceCoinMWebsocketAdapter(WebsocketAdapter):
     def __init__(
         self,
-        logger: logging.Logger
+        logger: logging.Logger,
+        streams: list = None,
+        host: str = None,
+        recorder: TickJournal = None
     ) -> None:
         self.logger = logger
         # Example: ["btcusd_perp@ticker", "ethusd_perp@ticker"]
-        self.streams: list = json.loads(os.environ.get(f'BINANCE_COINM_STREAMS_{ENV}'))
-        self.host: str = os.environ.get(f'BINANCE_COINM_WSS_HOST_{ENV}')
+        self.streams: list = streams if streams is not None else json.loads(os.environ.get(f'BINANCE_COINM_STREAMS_{ENV}'))
+        self.host: str = host or os.environ.get(f'BINANCE_COINM_WSS_HOST_{ENV}')
         self.on_event: Callable = None
         self.provider = "binance"
+        self.recorder = recorder
+        self.feed_id = FeedId.BINANCE_COINM
+
+    def record_message(self, message):
+        if self.recorder:
+            self.recorder.record(self.feed_id, message)
+
+    def parse_message(self, message) -> tuple:
+        """
+        Returns (asset, price, exchange event time in epoch seconds), or None
+        when the frame carries no new price.
+        """
+        data = json.loads(message)["data"]
+        event_time = data.get("E")
+        return data["s"], float(data["p"]), event_time / 1000 if event_time else None
+
+    def on_connection_lost(self, streams: list = None):
+        """
+        Called when the connection carrying streams (all of them when None)
+        drops, so adapters keeping per-symbol state can reset it.
+        """
+        pass
 
     def on_message(self, ws: websocket.WebSocketApp, message):
+        received_at = time.time()
+        self.record_message(message)
         try:
-            message_json = json.loads(message)
-            asset = message_json["data"]["s"]
-            price = message_json["data"]["p"]
-            self.on_event(self.provider, asset, float(price))
-            self.logger.debug(f"Data was streamed: {message_json}")
+            tick = self.parse_message(message)
+            if tick is None:
+                return
+            asset, price, event_time = tick
+            self.on_event(self.provider, asset, price, event_time, received_at)
+            self.logger.debug(f"Data was streamed: {asset} {price}")
         except Exception as err:
             self.logger.error(f"Binance Coin-M: Could not process message, reason: {err}")
             
@@ -43,6 +73,7 @@ class BinanceCoinMWebsocketAdapter(WebsocketAdapter):
         pass
 
     def on_close(self, ws, close_status_code, close_msg):
+        self.on_connection_lost()
         self.logger.info(f"Binance Coin-M: Connection closed with code: {close_status_code}, message: {close_msg}")
 
     def get_ws(self, callback: Callable) -> websocket.WebSocketApp:
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Callable
+
+import websockets
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class BinanceSpotFxAdapter:
+    """
+    Derives USD/BRL quotes from Binance spot book tickers: USDT/BRL directly
+    and the BTC/BRL over BTC/USDT cross.
+
+    on_quote is called with (source, rate, latency) every time a source
+    moves. Book ticker frames carry no event time, so latency is half the
+    round trip of the connection's last keepalive ping.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        host: str = None,
+        retry_time: float = 2,
+        max_retry_time: float = 30
+    ):
+        self.logger = logger
+        self.host: str = host or os.environ.get(f"BINANCE_SPOT_WSS_HOST_{ENV}", "wss://stream.binance.com:9443")
+        self.streams = ["usdtbrl@bookTicker", "btcbrl@bookTicker", "btcusdt@bookTicker"]
+        self.retry_time = retry_time
+        self.max_retry_time = max_retry_time
+        self.on_quote: Callable = None
+        self.mids: dict[str, float] = {}
+        self.latency: float = None
+        self.reconnects = 0
+
+    def get_url(self) -> str:
+        return f"{self.host}/stream?streams={'/'.join(self.streams)}"
+
+    def parse_message(self, message) -> list:
+        """
+        Returns the (source, rate) quotes moved by one book ticker frame.
+        """
+        data = json.loads(message)["data"]
+        symbol = data["s"]
+        self.mids[symbol] = (float(data["b"]) + float(data["a"])) / 2
+
+        if symbol == "USDTBRL":
+            return [("binance-usdtbrl", self.mids[symbol])]
+
+        btc_brl = self.mids.get("BTCBRL")
+        btc_usdt = self.mids.get("BTCUSDT")
+        if btc_brl and btc_usdt:
+            return [("binance-btc-cross", btc_brl / btc_usdt)]
+        return []
+
+    def handle_message(self, message):
+        try:
+            for source, rate in self.parse_message(message):
+                self.on_quote(source, rate, self.latency)
+        except Exception as err:
+            self.logger.error(f"Binance spot FX: Could not process message, reason: {err}")
+
+    async def run(self, callback: Callable):
+        self.on_quote = callback
+        retry_time = self.retry_time
+        while True:
+            try:
+                async with websockets.connect(self.get_url(), compression=None) as ws:
+                    self.logger.info(f"Binance spot FX: Streams: {self.streams}")
+                    retry_time = self.retry_time
+                    async for message in ws:
+                        # websockets reports 0 until the first keepalive pong arrives.
+                        self.latency = ws.latency / 2 if ws.latency else None
+                        self.handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                self.logger.error(f"Binance spot FX: Connection lost, reason: {err}")
+
+            self.mids.clear()
+            self.latency = None
+            self.reconnects += 1
+            self.logger.info(f"Binance spot FX: Reconnecting in {retry_time} seconds...")
+            await asyncio.sleep(retry_time)
+            retry_time = min(retry_time * 2, self.max_retry_time)
@@ -0,0 +1,110 @@
+from array import array
+from bisect import bisect_left
+from enum import Enum
+from typing import Iterable, Optional
+
+
+class PriceSource(str, Enum):
+    LAST = "last"
+    BID = "bid"
+    ASK = "ask"
+    MID = "mid"
+    DEPTH_WEIGHTED = "depth-weighted"
+
+
+class L2OrderBook:
+    """
+    Price level book backed by sorted arrays of doubles.
+
+    Bids are keyed by negated price so index 0 is the best level on both
+    sides and updates are a bisect plus an in-place array edit.
+    """
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bid_keys = array("d")
+        self.bid_quantities = array("d")
+        self.ask_keys = array("d")
+        self.ask_quantities = array("d")
+        self.last_update_id: int = None
+
+    @staticmethod
+    def _apply_level(keys: array, quantities: array, key: float, quantity: float):
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            if quantity == 0:
+                del keys[index]
+                del quantities[index]
+            else:
+                quantities[index] = quantity
+        elif quantity != 0:
+            keys.insert(index, key)
+            quantities.insert(index, quantity)
+
+    def clear(self):
+        for levels in (self.bid_keys, self.bid_quantities, self.ask_keys, self.ask_quantities):
+            del levels[:]
+        self.last_update_id = None
+
+    def load_snapshot(self, bids: Iterable, asks: Iterable, last_update_id: int):
+        self.clear()
+        self.apply_diff(bids, asks)
+        self.last_update_id = last_update_id
+
+    def apply_diff(self, bids: Iterable, asks: Iterable, update_id: int = None):
+        for price, quantity in bids:
+            self._apply_level(self.bid_keys, self.bid_quantities, -float(price), float(quantity))
+        for price, quantity in asks:
+            self._apply_level(self.ask_keys, self.ask_quantities, float(price), float(quantity))
+        if update_id is not None:
+            self.last_update_id = update_id
+
+    def best_bid(self) -> Optional[float]:
+        return -self.bid_keys[0] if self.bid_keys else None
+
+    def best_ask(self) -> Optional[float]:
+        return self.ask_keys[0] if self.ask_keys else None
+
+    def mid_price(self) -> Optional[float]:
+        if not (self.bid_keys and self.ask_keys):
+            return None
+        return (self.ask_keys[0] + self.best_bid()) / 2
+
+    @staticmethod
+    def _sweep_price(keys: array, quantities: array, quantity: float) -> Optional[float]:
+        remaining = quantity
+        notional = 0.0
+        for index in range(len(keys)):
+            filled = min(remaining, quantities[index])
+            notional += filled * abs(keys[index])
+            remaining -= filled
+            if remaining <= 0:
+                return notional / quantity
+        return None
+
+    def depth_weighted_price(self, quantity: float) -> Optional[float]:
+        """
+        Average of the prices paid to sweep `quantity` on each side, None when
+        the book is too thin.
+        """
+        bid = self._sweep_price(self.bid_keys, self.bid_quantities, quantity)
+        ask = self._sweep_price(self.ask_keys, self.ask_quantities, quantity)
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def get_price(self, price_source: PriceSource, quantity: float = 0) -> Optional[float]:
+        if price_source == PriceSource.BID:
+            return self.best_bid()
+        if price_source == PriceSource.ASK:
+            return self.best_ask()
+        if price_source == PriceSource.MID:
+            return self.mid_price()
+        if price_source == PriceSource.DEPTH_WEIGHTED:
+            return self.depth_weighted_price(quantity)
+        raise ValueError(f"Order book cannot price from '{price_source}'")
+
+    def get_depth(self, levels: int = 10) -> dict:
+        return {
+            "bids": [[-self.bid_keys[index], self.bid_quantities[index]] for index in range(min(levels, len(self.bid_keys)))],
+            "asks": [[self.ask_keys[index], self.ask_quantities[index]] for index in range(min(levels, len(self.ask_keys)))]
+        }
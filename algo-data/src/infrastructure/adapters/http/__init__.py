@@ -0,0 +1 @@
+from .async_http_client import AsyncHttpClient, HttpStatusError
\ No newline at end of file
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import os
+from typing import Tuple
+
+import aiohttp
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class AsyncHttpClient:
+    """
+    aiohttp session with a bounded keep-alive pool, created lazily on the
+    running loop so the owner can be built outside of it.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        base_url: str = "",
+        pool_size: int = None,
+        timeout: float = None,
+        keepalive_timeout: float = 30
+    ):
+        self.logger = logger
+        self.base_url = base_url
+        self.pool_size = pool_size or int(os.environ.get(f"HTTP_POOL_SIZE_{ENV}", 10))
+        self.timeout = timeout or float(os.environ.get(f"HTTP_TIMEOUT_{ENV}", 5))
+        self.keepalive_timeout = keepalive_timeout
+        self.session: aiohttp.ClientSession = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def get(self, path: str, params: dict = None) -> Tuple[int, bytes]:
+        async with self.get_session().get(f"{self.base_url}{path}", params=params) as response:
+            return response.status, await response.read()
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+            # Let the connector finish closing its transports.
+            await asyncio.sleep(0)
+        self.session = None
+
+
+class HttpStatusError(Exception):
+    pass
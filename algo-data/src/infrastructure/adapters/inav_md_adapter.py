@@ -1,7 +1,21 @@
+import asyncio
+
 from src.infrastructure.adapters.md_adapter import MDAdapter
 
 
 
 class InavMDAdapter(MDAdapter):
     def get_crypto_quantity_on_onshore_etf(self):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def fetch_pcf(self, onshore_ticker: str, offshore_ticker: str) -> dict:
+        return {
+            "offshore_symbol": offshore_ticker,
+            "amount_of_underlying_asset": self.get_crypto_quantity_on_onshore_etf(onshore_ticker, offshore_ticker)
+        }
+
+    async def fetch_price_async(self, ticker: str) -> float:
+        return await asyncio.to_thread(self.fetch_price, ticker)
+
+    async def close(self):
+        pass
@@ -0,0 +1,119 @@
+import threading
+
+# Values below 2**SUB_BUCKET_BITS microseconds get one bucket each, above that
+# every power of two is split in 2**(SUB_BUCKET_BITS - 1) buckets, so any
+# recorded value is within 1/64 (~1.6%) of its bucket.
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+
+def get_bucket_index(value: int) -> int:
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * SUB_BUCKET_HALF + (value >> shift)
+
+
+def get_bucket_value(index: int) -> int:
+    """
+    Midpoint of the values that fall in the bucket.
+    """
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_HALF - 1
+    lowest = (index - shift * SUB_BUCKET_HALF) << shift
+    return lowest + (1 << shift) // 2
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies in microseconds, with fixed
+    memory and O(1) recording. Values above max_value are clamped to it and
+    negative ones (clock skew between hosts) are counted and recorded as 0.
+    """
+    def __init__(self, max_value: int = 60_000_000):
+        self.max_value = max_value
+        self.counts = [0] * (get_bucket_index(max_value) + 1)
+        self.count = 0
+        self.total = 0
+        self.min_value: int = None
+        self.max_recorded: int = None
+        self.negative = 0
+        self._lock = threading.Lock()
+
+    def record(self, value_us: float):
+        value = int(value_us)
+        with self._lock:
+            if value < 0:
+                self.negative += 1
+                value = 0
+            elif value > self.max_value:
+                value = self.max_value
+            self.counts[get_bucket_index(value)] += 1
+            self.count += 1
+            self.total += value
+            if self.min_value is None or value < self.min_value:
+                self.min_value = value
+            if self.max_recorded is None or value > self.max_recorded:
+                self.max_recorded = value
+
+    def get_percentiles(self, fractions: tuple) -> list:
+        with self._lock:
+            counts = list(self.counts)
+            count = self.count
+            max_recorded = self.max_recorded
+        if not count:
+            return [None] * len(fractions)
+
+        results = []
+        targets = sorted((max(1, round(fraction * count)), position) for position, fraction in enumerate(fractions))
+        seen = 0
+        index = 0
+        for target, position in targets:
+            while seen < target:
+                seen += counts[index]
+                index += 1
+            results.append((position, min(get_bucket_value(index - 1), max_recorded)))
+        return [value for _, value in sorted(results)]
+
+    def get_percentile(self, fraction: float) -> int:
+        return self.get_percentiles((fraction, ))[0]
+
+    def merge(self, other: "LatencyHistogram"):
+        with other._lock:
+            counts = list(other.counts)
+            count, total, negative = other.count, other.total, other.negative
+            min_value, max_recorded = other.min_value, other.max_recorded
+        with self._lock:
+            for index, bucket_count in enumerate(counts[:len(self.counts)]):
+                self.counts[index] += bucket_count
+            self.count += count
+            self.total += total
+            self.negative += negative
+            if min_value is not None:
+                self.min_value = min_value if self.min_value is None else min(self.min_value, min_value)
+                self.max_recorded = max_recorded if self.max_recorded is None else max(self.max_recorded, max_recorded)
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * len(self.counts)
+            self.count = 0
+            self.total = 0
+            self.min_value = None
+            self.max_recorded = None
+            self.negative = 0
+
+    def get_stats(self) -> dict:
+        p50, p90, p99, p999 = self.get_percentiles((0.5, 0.9, 0.99, 0.999))
+        return {
+            "count": self.count,
+            "min_us": self.min_value,
+            "mean_us": round(self.total / self.count, 1) if self.count else None,
+            "p50_us": p50,
+            "p90_us": p90,
+            "p99_us": p99,
+            "p999_us": p999,
+            "max_us": self.max_recorded,
+            "negative": self.negative
+        }
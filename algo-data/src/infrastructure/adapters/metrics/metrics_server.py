@@ -0,0 +1,58 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.infrastructure.adapters.metrics.metrics_registry import MetricsRegistry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """
+    Serves the registry on GET /metrics from a daemon thread, for processes
+    without a web app of their own.
+    """
+    def __init__(self, logger: logging.Logger, port: int, registry: MetricsRegistry = None, host: str = "0.0.0.0"):
+        self.logger = logger
+        self.port = port
+        self.host = host
+        self.registry = registry or MetricsRegistry.get_default()
+        self.server: ThreadingHTTPServer = None
+        self.server_thread: threading.Thread = None
+
+    def build_handler(self):
+        registry = self.registry
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return MetricsHandler
+
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), self.build_handler())
+        self.server.daemon_threads = True
+        # Port 0 binds any free port.
+        self.port = self.server.server_address[1]
+        self.server_thread = threading.Thread(
+            target=self.server.serve_forever,
+            daemon=True
+        )
+        self.server_thread.start()
+        self.logger.info(f"[MetricsServer] Serving metrics on {self.host}:{self.port}/metrics")
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
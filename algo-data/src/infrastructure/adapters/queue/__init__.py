@@ -1 +1,7 @@
-from .redis_adapter import RedisAdapter
\ No newline at end of file
+from .redis_adapter import RedisAdapter, RedisBatchError
+from .handoff_queue import HandoffQueue, OverflowPolicy
+from .local_redis import LocalRedis
+from .redis_stream_writer import RedisStreamWriter
+from .codecs import MessageCodec, ContentType, CodecError
+from .redis_connection_manager import RedisConnectionManager
+from .redis_subscriber import RedisSubscriber
\ No newline at end of file
@@ -0,0 +1,155 @@
+import json
+import math
+import struct
+from enum import Enum
+from typing import Union
+
+import msgpack
+
+# Tagged frames start with a byte that cannot open a JSON text, so untagged
+# legacy JSON payloads can still be told apart and decoded.
+FRAME_MAGIC = 0xC1
+# magic, codec id, codec version
+FRAME_HEADER = struct.Struct("<BBB")
+
+# symbol, inav, amount of underlying asset
+INAV_LAYOUT = struct.Struct("<12sdd")
+INAV_FIELDS = ("symbol", "inav", "amount_of_underlying_asset")
+# Version 2 appends the latency timestamps, NaN when a stage is missing.
+INAV_TIMESTAMPS = ("exchange", "received", "published")
+INAV_TIMESTAMPS_LAYOUT = struct.Struct("<ddd")
+
+
+class ContentType(str, Enum):
+    LEGACY_JSON = "json-legacy"
+    JSON = "json"
+    MSGPACK = "msgpack"
+    INAV_STRUCT = "inav-struct"
+
+
+class Codec:
+    codec_id: int = None
+    version: int = 1
+
+    def encode(self, data) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload: bytes, version: int):
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    codec_id = 1
+
+    def encode(self, data) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    def decode(self, payload: bytes, version: int):
+        return json.loads(payload)
+
+
+class MsgpackCodec(Codec):
+    codec_id = 2
+
+    def encode(self, data) -> bytes:
+        return msgpack.packb(data)
+
+    def decode(self, payload: bytes, version: int):
+        return msgpack.unpackb(payload)
+
+
+class InavStructCodec(Codec):
+    """
+    Fixed 28 byte layout for plain iNAV ticks, 52 bytes (version 2) when
+    they carry latency timestamps. Messages with other fields cannot use it
+    and are sent as msgpack instead.
+    """
+    codec_id = 3
+    version = 2
+
+    def can_encode(self, data) -> bool:
+        if not isinstance(data, dict) or len(data.get("symbol", "")) > 12:
+            return False
+        timestamps = data.get("ts")
+        if timestamps is None:
+            return data.keys() == set(INAV_FIELDS)
+        return (
+            data.keys() == set(INAV_FIELDS) | {"ts"}
+            and set(timestamps) <= set(INAV_TIMESTAMPS)
+        )
+
+    def get_version(self, data) -> int:
+        return 2 if "ts" in data else 1
+
+    def encode(self, data) -> bytes:
+        payload = INAV_LAYOUT.pack(
+            data["symbol"].encode(), data["inav"], data["amount_of_underlying_asset"]
+        )
+        timestamps = data.get("ts")
+        if timestamps is None:
+            return payload
+        return payload + INAV_TIMESTAMPS_LAYOUT.pack(
+            *(timestamps.get(stage) or math.nan for stage in INAV_TIMESTAMPS)
+        )
+
+    def decode(self, payload: bytes, version: int):
+        symbol, inav, amount_of_underlying_asset = INAV_LAYOUT.unpack_from(payload)
+        data = {
+            "symbol": symbol.rstrip(b"\0").decode(),
+            "inav": inav,
+            "amount_of_underlying_asset": amount_of_underlying_asset
+        }
+        if version >= 2:
+            timestamps = INAV_TIMESTAMPS_LAYOUT.unpack_from(payload, INAV_LAYOUT.size)
+            data["ts"] = {
+                stage: timestamp
+                for stage, timestamp in zip(INAV_TIMESTAMPS, timestamps)
+                if not math.isnan(timestamp)
+            }
+        return data
+
+
+class MessageCodec:
+    """
+    Encodes broker payloads with a content type and decodes any of them,
+    including untagged legacy JSON, so publishers and subscribers can switch
+    formats independently. Subscribers must be upgraded before publishers.
+    """
+    def __init__(self, default_content_type: ContentType = ContentType.LEGACY_JSON):
+        self.default_content_type = ContentType(default_content_type)
+        self.json_codec = JsonCodec()
+        self.msgpack_codec = MsgpackCodec()
+        self.inav_codec = InavStructCodec()
+        self.codecs = {
+            codec.codec_id: codec
+            for codec in (self.json_codec, self.msgpack_codec, self.inav_codec)
+        }
+
+    @staticmethod
+    def frame(codec: Codec, payload: bytes, version: int = None) -> bytes:
+        return FRAME_HEADER.pack(FRAME_MAGIC, codec.codec_id, version or codec.version) + payload
+
+    def encode(self, data, content_type: ContentType = None) -> Union[str, bytes]:
+        content_type = content_type or self.default_content_type
+        if content_type == ContentType.LEGACY_JSON:
+            return json.dumps(data)
+        if content_type == ContentType.JSON:
+            return self.frame(self.json_codec, self.json_codec.encode(data))
+        if content_type == ContentType.INAV_STRUCT and self.inav_codec.can_encode(data):
+            return self.frame(self.inav_codec, self.inav_codec.encode(data), self.inav_codec.get_version(data))
+        return self.frame(self.msgpack_codec, self.msgpack_codec.encode(data))
+
+    def decode(self, payload: Union[str, bytes]):
+        if isinstance(payload, (bytes, bytearray)) and payload and payload[0] == FRAME_MAGIC:
+            _, codec_id, version = FRAME_HEADER.unpack_from(payload)
+            codec = self.codecs.get(codec_id)
+            if codec is None:
+                raise CodecError(f"Unknown codec id {codec_id}")
+            if version > codec.version:
+                raise CodecError(f"{type(codec).__name__} version {version} is newer than supported {codec.version}")
+            return codec.decode(payload[FRAME_HEADER.size:], version)
+        return json.loads(payload)
+
+
+class CodecError(Exception):
+    pass
@@ -0,0 +1,121 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import Any, Hashable, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class OverflowPolicy(str, Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop-oldest"
+    CONFLATE = "conflate"
+
+
+class HandoffQueue:
+    """
+    Bounded, thread-safe handoff between a producer stage and a consumer stage.
+
+    BLOCK makes producers wait for room, DROP_OLDEST evicts the oldest pending
+    item and CONFLATE keeps a single pending item per key (evicting the oldest
+    key when the queue is full).
+
+    BLOCK waits on a threading.Condition, so it must not be used when the
+    producer runs on an asyncio event loop: a full queue would stall the
+    whole loop, including its websocket keepalives.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        name: str,
+        maxsize: int = None,
+        overflow_policy: OverflowPolicy = None
+    ) -> None:
+        self.logger = logger
+        self.name = name
+        self.maxsize = maxsize or int(os.environ.get(f"HANDOFF_QUEUE_SIZE_{ENV}", 10000))
+        self.overflow_policy = OverflowPolicy(
+            overflow_policy or os.environ.get(f"HANDOFF_OVERFLOW_POLICY_{ENV}", OverflowPolicy.CONFLATE.value)
+        )
+
+        self._pending_by_key: OrderedDict = OrderedDict()
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+        self.enqueued = 0
+        self.dequeued = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._pending_by_key) + len(self._pending)
+
+    def put(self, key: Hashable, item: Any) -> None:
+        with self._lock:
+            if self.overflow_policy == OverflowPolicy.CONFLATE:
+                if key in self._pending_by_key:
+                    self._pending_by_key[key] = item
+                    self.conflated += 1
+                    return
+                if len(self._pending_by_key) >= self.maxsize:
+                    self._pending_by_key.popitem(last=False)
+                    self.dropped += 1
+                self._pending_by_key[key] = item
+            else:
+                if len(self._pending) >= self.maxsize:
+                    if self.overflow_policy == OverflowPolicy.BLOCK:
+                        while len(self._pending) >= self.maxsize:
+                            self._not_full.wait()
+                    else:
+                        self._pending.popleft()
+                        self.dropped += 1
+                self._pending.append(item)
+
+            self.enqueued += 1
+            self.max_depth = max(self.max_depth, len(self))
+            self._not_empty.notify()
+
+    def get(self, timeout: float = None) -> Optional[Any]:
+        """
+        Pop the oldest pending item, returns None if nothing arrived within timeout.
+        """
+        with self._lock:
+            if not len(self):
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not len(self):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return None
+                    self._not_empty.wait(remaining)
+
+            if self._pending_by_key:
+                _, item = self._pending_by_key.popitem(last=False)
+            else:
+                item = self._pending.popleft()
+            self.dequeued += 1
+            self._not_full.notify()
+            return item
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "depth": len(self),
+                "max_depth": self.max_depth,
+                "enqueued": self.enqueued,
+                "dequeued": self.dequeued,
+                "dropped": self.dropped,
+                "conflated": self.conflated
+            }
+
+    def log_stats(self):
+        self.logger.info(f"[HandoffQueue] {self.name} ({self.overflow_policy.value}): {self.get_stats()}")
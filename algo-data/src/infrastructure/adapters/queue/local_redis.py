@@ -0,0 +1,163 @@
+import itertools
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Iterator
+
+
+class LocalPubSub:
+    def __init__(self, local_redis: "LocalRedis"):
+        self.local_redis = local_redis
+        self.channels: set = set()
+        self.messages: queue.Queue = queue.Queue()
+
+    def subscribe(self, *channels: str):
+        for channel in channels:
+            self.channels.add(channel)
+            self.local_redis.add_subscriber(channel, self)
+
+    def unsubscribe(self, *channels: str):
+        for channel in channels or list(self.channels):
+            self.channels.discard(channel)
+            self.local_redis.remove_subscriber(channel, self)
+
+    def listen(self) -> Iterator[dict]:
+        while True:
+            yield self.messages.get()
+
+    def get_message(self, timeout: float = 0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class LocalPipeline:
+    """
+    Queues commands and runs them against the LocalRedis on execute.
+    """
+    def __init__(self, local_redis: "LocalRedis"):
+        self.local_redis = local_redis
+        self.commands: list = []
+
+    def __getattr__(self, name: str):
+        def queue_command(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue_command
+
+    def reset(self):
+        self.commands = []
+
+    def execute(self, raise_on_error: bool = True) -> list:
+        commands, self.commands = self.commands, []
+        self.local_redis.pipelines_executed += 1
+        results = []
+        for name, args, kwargs in commands:
+            try:
+                results.append(getattr(self.local_redis, name)(*args, **kwargs))
+            except Exception as err:
+                if raise_on_error:
+                    raise
+                # Like redis-py, failed commands leave their error in the results.
+                results.append(err)
+        return results
+
+
+class LocalRedis:
+    """
+    In-process stand-in for the subset of redis.Redis used by RedisAdapter,
+    for replays and benchmarks that must not depend on a running server.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.keys: dict = {}
+        self.expires_at: dict = {}
+        self.streams: dict = defaultdict(list)
+        self.lists: dict = defaultdict(list)
+        self.subscribers: dict = defaultdict(set)
+        self.published: dict = defaultdict(int)
+        self.pipelines_executed = 0
+        self._stream_sequence = itertools.count()
+
+    def ping(self) -> bool:
+        return True
+
+    def pubsub(self) -> LocalPubSub:
+        return LocalPubSub(self)
+
+    def pipeline(self, transaction: bool = True) -> LocalPipeline:
+        return LocalPipeline(self)
+
+    def add_subscriber(self, channel: str, pubsub: LocalPubSub):
+        with self._lock:
+            self.subscribers[channel].add(pubsub)
+
+    def remove_subscriber(self, channel: str, pubsub: LocalPubSub):
+        with self._lock:
+            self.subscribers[channel].discard(pubsub)
+
+    @staticmethod
+    def encode(value) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def set(self, key: str, value, ex: int = None):
+        self.keys[key] = self.encode(value)
+        if ex is None:
+            self.expires_at.pop(key, None)
+        else:
+            self.expires_at[key] = time.monotonic() + ex
+        return True
+
+    def get(self, key: str):
+        expires_at = self.expires_at.get(key)
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self.keys.pop(key, None)
+            self.expires_at.pop(key, None)
+        return self.keys.get(key)
+
+    def ttl(self, key: str) -> int:
+        """
+        Seconds left before key expires, -1 without expiry, -2 when missing.
+        """
+        if self.get(key) is None:
+            return -2
+        expires_at = self.expires_at.get(key)
+        return -1 if expires_at is None else int(round(expires_at - time.monotonic()))
+
+    def publish(self, channel: str, message) -> int:
+        with self._lock:
+            self.published[channel] += 1
+            subscribers = list(self.subscribers.get(channel, ()))
+        for pubsub in subscribers:
+            pubsub.messages.put({
+                "type": "message",
+                "pattern": None,
+                "channel": channel.encode(),
+                "data": self.encode(message)
+            })
+        return len(subscribers)
+
+    def xadd(self, name: str, fields: dict, maxlen: int = None, minid: str = None, **kwargs) -> bytes:
+        entry_id = f"{int(time.time() * 1000)}-{next(self._stream_sequence)}".encode()
+        with self._lock:
+            stream = self.streams[name]
+            stream.append((entry_id, {
+                self.encode(key): self.encode(value) for key, value in fields.items()
+            }))
+            # Trimming is exact here, Redis trims approximately.
+            if maxlen is not None and len(stream) > maxlen:
+                del stream[:len(stream) - maxlen]
+            if minid is not None:
+                min_ms = int(minid.split("-")[0])
+                stream[:] = [entry for entry in stream if int(entry[0].split(b"-")[0]) >= min_ms]
+        return entry_id
+
+    def lpush(self, name: str, *values) -> int:
+        with self._lock:
+            for value in values:
+                self.lists[name].insert(0, self.encode(value))
+            return len(self.lists[name])
@@ -1,60 +1,191 @@
 import logging
 import json
 import os
+import threading
+import time
+from contextlib import contextmanager
 from typing import Callable
 
 import redis
 from dotenv import load_dotenv
 import redis.client
 
+from src.infrastructure.adapters.queue.codecs import ContentType, MessageCodec
+from src.infrastructure.adapters.queue.redis_connection_manager import RedisConnectionManager
+from src.infrastructure.adapters.queue.redis_subscriber import RedisSubscriber
+from src.infrastructure.adapters.metrics.metrics_registry import MetricsRegistry
+
 load_dotenv()
 
 ENV = os.environ.get("ENV", "DEV")
 
 
 class RedisAdapter:
-    def __init__(self, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        redis_db: redis.Redis = None,
+        connection_manager: RedisConnectionManager = None
+    ) -> None:
         self.logger = logger
         self.host = os.environ.get(f"REDIS_HOST_{ENV}")
         self.port = os.environ.get(f"REDIS_PORT_{ENV}")
 
+        self.connection_manager = connection_manager
         self.redis_db = None
         self.pubsub = None
+        # Set for pooled connections, subscriptions then share the process wide pubsub connection.
+        self.subscriber: RedisSubscriber = None
         self.subscriptions = {}
-    
-        self._create_connection()
+        self._unsubscribed_all = threading.Event()
+        self._unsubscribed_all.set()
+
+        # Subscribers decode every content type, so roll new ones out on them first.
+        self.content_type = ContentType(os.environ.get(f"REDIS_CONTENT_TYPE_{ENV}", ContentType.LEGACY_JSON.value))
+        self.inav_content_type = ContentType(os.environ.get(f"REDIS_INAV_CONTENT_TYPE_{ENV}", self.content_type.value))
+        self.codec = MessageCodec(self.content_type)
+
+        # Writes outside an explicit batch are grouped for this many seconds, 0 disables it.
+        self.auto_batch_window = float(os.environ.get(f"REDIS_AUTO_BATCH_WINDOW_{ENV}", 0))
+        self._local = threading.local()
+        self._auto_pipeline = None
+        self._auto_lock = threading.Lock()
+        self._auto_wakeup = threading.Condition(self._auto_lock)
+        self.auto_flusher_thread: threading.Thread = None
+        # Set when the auto flusher fails, raised to the next writer on any thread.
+        self.auto_batch_error: Exception = None
+        self.batches_executed = 0
+        self.batch_errors = 0
+
+        registry = MetricsRegistry.get_default()
+        self.published_total = registry.counter("redis_published_messages_total", "Messages published", ("channel", ))
+        self.received_total = registry.counter(
+            "redis_received_messages_total",
+            "Messages received from subscriptions",
+            ("channel", )
+        )
+        # Looked up once per channel rather than through labels() on every message.
+        self.published_counters: dict = {}
+        self.received_counters: dict = {}
+
+        if redis_db is not None:
+            # Injected clients (e.g. LocalRedis) are already connected.
+            self.redis_db = redis_db
+            self.pubsub = redis_db.pubsub()
+        else:
+            self._create_connection()
+
+        if self.auto_batch_window > 0:
+            self.start_auto_flusher()
 
     def _create_connection(self):
         """
-        Create a connection with database.
+        Take the client of the process wide connection pool. It is never None,
+        commands retry while Redis is down and the manager logs the outage.
         """
-        self.logger.debug("Trying to connect with Redis")
-        try:
-            # Connect to Redis
-            self.redis_db = redis.Redis(
-                    host=self.host,
-                    port=self.port,
-                    ssl=False)
-            
-            # Check connection
-            self.redis_db.ping()
-            self.pubsub = self.redis_db.pubsub()
-            self.logger.info(f"Connection with Redis was established, host: {self.host}:{self.port}")
-            return self.redis_db
-        except Exception as err:
-            self.logger.error(f"Could not connect to Redis: {err}")
+        self.connection_manager = self.connection_manager or RedisConnectionManager.get_instance(
+            self.logger, self.host, self.port
+        )
+        self.redis_db = self.connection_manager.get_client()
+        self.subscriber = self.connection_manager.get_subscriber()
+        self.pubsub = self.subscriber.pubsub
+        return self.redis_db
 
     def get_pubsub(self) -> redis.client.PubSub:
         return self.redis_db.pubsub()
+
+    @contextmanager
+    def batch(self, transaction: bool = False):
+        """
+        Sends the writes issued on this thread inside the block as one
+        pipeline (a MULTI/EXEC block when transaction is True) on exit, and
+        raises if it fails. Nested blocks join the outer one.
+        """
+        if getattr(self._local, "pipeline", None) is not None:
+            yield self._local.pipeline
+            return
+
+        pipeline = self.redis_db.pipeline(transaction=transaction)
+        self._local.pipeline = pipeline
+        try:
+            yield pipeline
+        except Exception:
+            self._local.pipeline = None
+            pipeline.reset()
+            raise
+        self._local.pipeline = None
+        self.execute_pipeline(pipeline)
+
+    def execute_pipeline(self, pipeline):
+        try:
+            pipeline.execute()
+            self.batches_executed += 1
+        except Exception as err:
+            self.batch_errors += 1
+            self.logger.error(f"[RedisAdapter] Could not execute batch, reason: {err}")
+            raise
+
+    def _write(self, command: str, *args, **kwargs):
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is not None:
+            return getattr(pipeline, command)(*args, **kwargs)
+
+        if self.auto_batch_window > 0:
+            with self._auto_lock:
+                if self.auto_batch_error is not None:
+                    err, self.auto_batch_error = self.auto_batch_error, None
+                    raise RedisBatchError(f"Previous auto batch failed: {err}") from err
+                if self._auto_pipeline is None:
+                    self._auto_pipeline = self.redis_db.pipeline(transaction=False)
+                    self._auto_wakeup.notify()
+                return getattr(self._auto_pipeline, command)(*args, **kwargs)
+
+        return getattr(self.redis_db, command)(*args, **kwargs)
+
+    def flush(self):
+        """
+        Send the writes grouped by the auto batch window right away, raising
+        if they fail.
+        """
+        with self._auto_lock:
+            pipeline, self._auto_pipeline = self._auto_pipeline, None
+        if pipeline is not None:
+            self.execute_pipeline(pipeline)
+
+    def run_auto_flusher(self):
+        while True:
+            with self._auto_lock:
+                while self._auto_pipeline is None:
+                    self._auto_wakeup.wait()
+            time.sleep(self.auto_batch_window)
+            self.flush_pending()
+
+    def flush_pending(self):
+        """
+        flush() for callers that are not the writers; a failure is handed to
+        the next write instead of being raised here.
+        """
+        try:
+            self.flush()
+        except Exception as err:
+            with self._auto_lock:
+                self.auto_batch_error = err
+
+    def start_auto_flusher(self):
+        self.auto_flusher_thread = threading.Thread(
+            target=self.run_auto_flusher,
+            daemon=True
+        )
+        self.auto_flusher_thread.start()
     
-    def set_key(self, query, data):
+    def set_key(self, query, data, expire: int = None):
         """
-        Set key to Redis
+        Set key to Redis, expiring after expire seconds when given.
         """
         if self.redis_db:
             try:
-                self.redis_db.set(query, data)
-                self.logger.info(f"Key: {query}, Value: {data}")
+                self._write("set", query, data, ex=expire)
+                self.logger.debug("Key: %s, Value: %s", query, data)
             except Exception as err:
                 self.logger.error(f"Could not add data to query: {err}")
 
@@ -63,23 +194,26 @@ class RedisAdapter:
         Get a key from Redis.
         """
         try:
+            # Writes still waiting in the auto batch window must be visible to the read.
+            self.flush_pending()
             # Execute the Redis command to get the time series value
             search = self.redis_db.get(f"{key}")
-            self.logger.debug(f"Found search: {search}")
+            self.logger.debug("Found search: %s", search)
             
             if search is None:
-                self.logger.info(f"No data found for key: {key}")
+                self.logger.info("No data found for key: %s", key)
                 return None
             
-            return json.loads(search)
+            return self.codec.decode(search)
         except Exception as err:
             self.logger.error(f"Error getting key from Redis: {err}")
             return None
     
     def stream_data(self, channel: str, data: dict):
-        self.redis_db.xadd(channel, data)
+        self._write("xadd", channel, data)
     
     def read_stream(self, channel: str, callback: Callable):
+        self.flush_pending()
         while True:
             new_messages = self.redis_db.xread({channel: '$'}, block=5000)
             if new_messages:
@@ -90,31 +224,71 @@ class RedisAdapter:
     def insert_to_queue(self, message_data, queue):
         message_json = json.dumps(message_data, default=str)
         try:
-            self.redis_db.lpush(queue, message_json)
-            self.logger.debug(f"Inserted data into queue: {queue}, {message_json}")
+            self._write("lpush", queue, message_json)
+            self.logger.debug("Inserted data into queue: %s, %s", queue, message_json)
         except Exception as err:
             self.logger.error(f"Could not insert data into Redis queue, reason: {err}")
 
-    def publish_message(self, channel: str, message_data: dict = None) -> bool:
-        message = json.dumps(message_data)
-        self.redis_db.publish(channel, message)
+    def publish_message(self, channel: str, message_data: dict = None, content_type: ContentType = None) -> bool:
+        if content_type is None and channel.startswith("inav-"):
+            content_type = self.inav_content_type
+        message = self.codec.encode(message_data, content_type)
+        self._write("publish", channel, message)
+        published_counter = self.published_counters.get(channel)
+        if published_counter is None:
+            published_counter = self.published_counters[channel] = self.published_total.labels(channel)
+        published_counter.inc()
     
     def subscribe(self, channel: str, callback: callable):
-        self.pubsub.subscribe(channel)
         self.subscriptions[channel] = callback
+        if self.subscriber is not None:
+            self._unsubscribed_all.clear()
+            self.subscriber.subscribe(channel, self.handle_message)
+            return
+        self.pubsub.subscribe(channel)
     
     def unsubscribe(self, channel: str):
+        self.subscriptions.pop(channel, None)
+        if self.subscriber is not None:
+            self.subscriber.unsubscribe(channel, self.handle_message)
+            if not self.subscriptions:
+                self._unsubscribed_all.set()
+            return
         self.pubsub.unsubscribe(channel)
+
+    def handle_message(self, channel: str, payload: bytes):
+        received_counter = self.received_counters.get(channel)
+        if received_counter is None:
+            received_counter = self.received_counters[channel] = self.received_total.labels(channel)
+        received_counter.inc()
+        data = self.codec.decode(payload)
+        callback = self.subscriptions.get(channel)
+        if callback:
+            callback(data)
     
-    def start_listening(self):
+    def start_listening(self, max_backoff: float = 30):
         self.logger.info(f"[RedisAdapter] Listening to channels: {list(self.subscriptions)}")
-        try:
-            for message in self.pubsub.listen():
-                if message["type"] == "message":
-                    channel = message["channel"].decode()
-                    data = json.loads(message["data"])
-                    callback = self.subscriptions.get(channel)
-                    if callback:
-                        callback(data)
-        except KeyboardInterrupt:
-            self.logger.info("Stopped listening.")
\ No newline at end of file
+        if self.subscriber is not None:
+            # Messages arrive on the subscriber's thread, this blocks until every channel is unsubscribed.
+            self._unsubscribed_all.wait()
+            return
+        backoff = 1
+        while True:
+            try:
+                for message in self.pubsub.listen():
+                    backoff = 1
+                    if message["type"] == "message":
+                        self.handle_message(message["channel"].decode(), message["data"])
+                return
+            except (redis.ConnectionError, redis.TimeoutError) as err:
+                # The pubsub resubscribes to its channels when it reconnects.
+                self.logger.error(f"[RedisAdapter] Lost subscription connection, retrying in {backoff}s: {err}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, max_backoff)
+            except KeyboardInterrupt:
+                self.logger.info("Stopped listening.")
+                return
+
+
+class RedisBatchError(Exception):
+    pass
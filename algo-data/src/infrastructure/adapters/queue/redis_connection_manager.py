@@ -0,0 +1,170 @@
+import logging
+import os
+import threading
+import time
+
+import redis
+from dotenv import load_dotenv
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+
+from src.infrastructure.adapters.queue.redis_subscriber import RedisSubscriber
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class RedisConnectionManager:
+    """
+    One bounded connection pool and client per process and Redis endpoint,
+    shared by every RedisAdapter, plus one RedisSubscriber that multiplexes
+    all of their subscriptions on a single pubsub connection. Commands retry with exponential backoff on
+    connection errors, and a health checker pings the server, logs outages
+    and recoveries and keeps the metrics returned by get_stats.
+
+    Managers are per process: children forked after one was created get a
+    fresh one on first use.
+    """
+    _instances: dict = {}
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        host: str = None,
+        port: int = None,
+        max_connections: int = None,
+        pool_timeout: float = None,
+        health_check_interval: float = None,
+        retries: int = 5,
+        max_backoff: float = 10
+    ):
+        self.logger = logger
+        self.host = host or os.environ.get(f"REDIS_HOST_{ENV}")
+        self.port = port or os.environ.get(f"REDIS_PORT_{ENV}")
+        self.max_connections = int(max_connections or os.environ.get(f"REDIS_MAX_CONNECTIONS_{ENV}", 50))
+        self.pool_timeout = float(pool_timeout or os.environ.get(f"REDIS_POOL_TIMEOUT_{ENV}", 5))
+        self.health_check_interval = float(
+            health_check_interval or os.environ.get(f"REDIS_HEALTH_CHECK_INTERVAL_{ENV}", 15)
+        )
+        self.max_backoff = max_backoff
+
+        self.pool = redis.BlockingConnectionPool(
+            host=self.host,
+            port=self.port,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
+            health_check_interval=self.health_check_interval,
+            socket_keepalive=True,
+            retry=Retry(ExponentialBackoff(cap=max_backoff, base=0.05), retries),
+            retry_on_error=[redis.ConnectionError, redis.TimeoutError]
+        )
+        self.client = redis.Redis(connection_pool=self.pool)
+        self.subscriber: RedisSubscriber = None
+        self._subscriber_lock = threading.Lock()
+
+        self.healthy = False
+        self.health_checks = 0
+        self.failed_health_checks = 0
+        self.reconnects = 0
+        self.last_error: str = None
+        self.unhealthy_since: float = None
+        self.health_thread: threading.Thread = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def get_instance(cls, logger: logging.Logger, host: str = None, port: int = None) -> "RedisConnectionManager":
+        host = host or os.environ.get(f"REDIS_HOST_{ENV}")
+        port = port or os.environ.get(f"REDIS_PORT_{ENV}")
+        key = (host, str(port))
+        with cls._lock:
+            manager = cls._instances.get(key)
+            if manager is None:
+                manager = cls._instances[key] = cls(logger, host, port)
+                manager.check_health()
+                manager.start_health_checker()
+            return manager
+
+    @classmethod
+    def reset_instances(cls):
+        cls._lock = threading.Lock()
+        cls._instances = {}
+
+    def get_client(self) -> redis.Redis:
+        return self.client
+
+    def get_subscriber(self) -> RedisSubscriber:
+        with self._subscriber_lock:
+            if self.subscriber is None:
+                self.subscriber = RedisSubscriber(self.logger, self.client)
+            return self.subscriber
+
+    def check_health(self) -> bool:
+        self.health_checks += 1
+        try:
+            self.client.ping()
+        except Exception as err:
+            self.failed_health_checks += 1
+            self.last_error = str(err)
+            if self.healthy or self.unhealthy_since is None:
+                self.unhealthy_since = time.monotonic()
+                self.logger.error(f"[RedisConnectionManager] Redis at {self.host}:{self.port} is unreachable: {err}")
+            self.healthy = False
+            return False
+
+        if not self.healthy:
+            if self.unhealthy_since is not None:
+                self.reconnects += 1
+                self.logger.info(
+                    f"[RedisConnectionManager] Reconnected to Redis at {self.host}:{self.port} "
+                    f"after {time.monotonic() - self.unhealthy_since:.1f}s"
+                )
+            else:
+                self.logger.info(f"Connection with Redis was established, host: {self.host}:{self.port}")
+            self.unhealthy_since = None
+        self.healthy = True
+        return True
+
+    def get_check_delay(self) -> float:
+        if self.healthy:
+            return self.health_check_interval
+        # Back off while Redis is down, up to the regular interval.
+        outage = time.monotonic() - self.unhealthy_since
+        return min(self.health_check_interval, max(0.5, outage / 2), self.max_backoff)
+
+    def run_health_checker(self):
+        while not self._stop_event.wait(self.get_check_delay()):
+            self.check_health()
+
+    def start_health_checker(self):
+        if self.health_thread and self.health_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.health_thread = threading.Thread(
+            target=self.run_health_checker,
+            daemon=True
+        )
+        self.health_thread.start()
+
+    def close(self):
+        self._stop_event.set()
+        self.pool.disconnect()
+
+    def get_stats(self) -> dict:
+        available = sum(1 for connection in list(self.pool.pool.queue) if connection is not None)
+        created = len(self.pool._connections)
+        return {
+            "healthy": self.healthy,
+            "max_connections": self.max_connections,
+            "created_connections": created,
+            "in_use_connections": created - available,
+            "health_checks": self.health_checks,
+            "failed_health_checks": self.failed_health_checks,
+            "reconnects": self.reconnects,
+            "last_error": self.last_error,
+            "subscribed_channels": self.subscriber.get_stats()["subscribed_channels"] if self.subscriber else 0
+        }
+
+
+os.register_at_fork(after_in_child=RedisConnectionManager.reset_instances)
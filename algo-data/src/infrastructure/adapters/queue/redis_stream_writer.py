@@ -0,0 +1,257 @@
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import redis
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class RedisStreamWriter:
+    """
+    Buffers XADDs and sends them in pipelined micro-batches, once max_batch
+    entries are pending or flush_interval has passed since the first one.
+
+    Streams are trimmed approximately on every write: to entries newer than
+    max_age seconds when it is set, otherwise to about maxlen entries.
+    Batches that fail on connection errors or timeouts stay pending and are
+    retried with exponential backoff up to max_retry_delay, beyond
+    max_pending the oldest entries are dropped. An outage is logged when it
+    starts, every stats_interval while it lasts and when it ends. Entries
+    Redis rejects (e.g. DataError, ResponseError) would fail again, they
+    are dead-lettered: logged, counted and kept in `dead_letters`.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        redis_adapter: RedisAdapter,
+        max_batch: int = None,
+        flush_interval: float = None,
+        maxlen: int = None,
+        max_age: float = None,
+        max_pending: int = 100000,
+        stats_interval: float = 60,
+        max_dead_letters: int = 1000,
+        max_retry_delay: float = 5
+    ):
+        self.logger = logger
+        self.redis_adapter = redis_adapter
+        self.max_batch = int(max_batch or os.environ.get(f"STREAM_MAX_BATCH_{ENV}", 100))
+        self.flush_interval = float(
+            flush_interval if flush_interval is not None
+            else os.environ.get(f"STREAM_FLUSH_INTERVAL_{ENV}", 0.05)
+        )
+        self.maxlen = int(maxlen or os.environ.get(f"STREAM_MAXLEN_{ENV}", 100000))
+        max_age = max_age or os.environ.get(f"STREAM_MAX_AGE_{ENV}")
+        self.max_age = float(max_age) if max_age else None
+
+        self.stats_interval = stats_interval
+        self.max_retry_delay = max_retry_delay
+        self.retry_delay = 0.0
+        self.outage_started_at: float = None
+        self.outage_failures = 0
+        self.last_outage_log_time: float = None
+        self._pending: deque = deque(maxlen=max_pending)
+        self.dead_letters: deque = deque(maxlen=max_dead_letters)
+        self._first_pending_at: float = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stop_event = threading.Event()
+        self.writer_thread: threading.Thread = None
+
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.dead_lettered = 0
+        self.batches = 0
+        self.max_batch_size = 0
+        self.total_flush_time = 0.0
+        self.max_flush_time = 0.0
+
+    def get_trim_args(self) -> dict:
+        if self.max_age:
+            min_id = int((time.time() - self.max_age) * 1000)
+            return {"minid": f"{min_id}-0", "approximate": True}
+        return {"maxlen": self.maxlen, "approximate": True}
+
+    def write(self, stream: str, fields: dict):
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append((stream, fields))
+            if self._first_pending_at is None:
+                # Wake the writer so it arms the flush deadline.
+                self._first_pending_at = time.monotonic()
+                self._wakeup.notify()
+            elif len(self._pending) >= self.max_batch:
+                self._wakeup.notify()
+
+        if self.flush_interval <= 0:
+            self.flush()
+
+    def flush(self) -> int:
+        # One flush at a time, so retried entries keep their order.
+        with self._flush_lock:
+            with self._lock:
+                batch = [self._pending.popleft() for _ in range(min(self.max_batch, len(self._pending)))]
+                self._first_pending_at = time.monotonic() if self._pending else None
+            if not batch:
+                return 0
+
+            started_at = time.perf_counter()
+            trim_args = self.get_trim_args()
+            try:
+                pipeline = self.redis_adapter.redis_db.pipeline(transaction=False)
+                for stream, fields in batch:
+                    pipeline.xadd(stream, fields, **trim_args)
+                results = pipeline.execute(raise_on_error=False)
+            except (redis.ConnectionError, redis.TimeoutError) as err:
+                self.requeue(batch, err)
+                return 0
+            except Exception:
+                # Rejected before anything was sent (e.g. a field redis-py cannot
+                # encode), find the bad entries one by one.
+                results = self.write_entries(batch, trim_args)
+                if results is None:
+                    return 0
+
+            rejected = 0
+            for (stream, fields), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    rejected += 1
+                    self.dead_letter(stream, fields, result)
+
+            if self.outage_started_at is not None:
+                self.end_outage()
+            flush_time = time.perf_counter() - started_at
+            self.written += len(batch) - rejected
+            self.batches += 1
+            self.max_batch_size = max(self.max_batch_size, len(batch))
+            self.total_flush_time += flush_time
+            self.max_flush_time = max(self.max_flush_time, flush_time)
+            return len(batch)
+
+    def write_entries(self, batch: list, trim_args: dict) -> list:
+        """
+        Writes entries one at a time, returning each result or error. Returns
+        None when the connection fails, with the unwritten entries requeued.
+        """
+        results = []
+        for position, (stream, fields) in enumerate(batch):
+            try:
+                results.append(self.redis_adapter.redis_db.xadd(stream, fields, **trim_args))
+            except (redis.ConnectionError, redis.TimeoutError) as err:
+                self.requeue(batch[position:], err)
+                return None
+            except Exception as err:
+                results.append(err)
+        return results
+
+    def requeue(self, batch: list, err: Exception):
+        self.errors += 1
+        with self._lock:
+            # The batch is older than anything written since, so it is what overflows.
+            overflow = len(self._pending) + len(batch) - self._pending.maxlen
+            if overflow > 0:
+                self.dropped += overflow
+                batch = batch[overflow:]
+            self._pending.extendleft(reversed(batch))
+            self._first_pending_at = self._first_pending_at or time.monotonic()
+        self.record_outage(err)
+
+    def record_outage(self, err: Exception):
+        now = time.monotonic()
+        self.outage_failures += 1
+        if self.outage_started_at is None:
+            self.outage_started_at = self.last_outage_log_time = now
+            self.retry_delay = max(self.flush_interval, 0.05)
+            self.logger.error(f"[RedisStreamWriter] Redis unreachable, keeping entries pending and retrying, reason: {err}")
+            return
+        self.retry_delay = min(self.retry_delay * 2, self.max_retry_delay)
+        if now - self.last_outage_log_time >= self.stats_interval:
+            self.last_outage_log_time = now
+            self.logger.error(
+                f"[RedisStreamWriter] Redis still unreachable after {now - self.outage_started_at:.1f}s, "
+                f"{self.outage_failures} failed attempts, {len(self._pending)} pending, {self.dropped} dropped, reason: {err}"
+            )
+
+    def end_outage(self):
+        self.logger.info(
+            f"[RedisStreamWriter] Redis reachable again after {time.monotonic() - self.outage_started_at:.1f}s "
+            f"and {self.outage_failures} failed attempts"
+        )
+        self.outage_started_at = None
+        self.outage_failures = 0
+        self.retry_delay = 0.0
+
+    def dead_letter(self, stream: str, fields: dict, err: Exception):
+        self.dead_lettered += 1
+        self.dead_letters.append((stream, fields, repr(err)))
+        self.logger.error(f"[RedisStreamWriter] Dropping entry rejected by {stream}: {fields}, reason: {err}")
+
+    def get_flush_delay(self) -> float:
+        if not self._pending:
+            return self.stats_interval
+        if len(self._pending) >= self.max_batch:
+            return 0
+        return max(0.0, self._first_pending_at + self.flush_interval - time.monotonic())
+
+    def run_writer(self):
+        last_stats_time = time.monotonic()
+        while not self._stop_event.is_set():
+            if time.monotonic() - last_stats_time >= self.stats_interval:
+                self.log_stats()
+                last_stats_time = time.monotonic()
+
+            with self._lock:
+                delay = min(self.get_flush_delay(), self.stats_interval)
+                if delay > 0:
+                    self._wakeup.wait(delay)
+                ready = self._pending and self.get_flush_delay() == 0
+            if ready and not self.flush() and self.outage_started_at is not None:
+                # Back off instead of spinning while the broker is down.
+                self._stop_event.wait(self.retry_delay)
+
+    def start(self):
+        if self.flush_interval <= 0:
+            return
+        if self.writer_thread and self.writer_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.writer_thread = threading.Thread(
+            target=self.run_writer,
+            daemon=True
+        )
+        self.writer_thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        with self._lock:
+            self._wakeup.notify()
+        while self._pending and self.flush():
+            pass
+
+    def get_stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "dead_lettered": self.dead_lettered,
+            "batches": self.batches,
+            "avg_batch_size": round(self.written / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "avg_flush_ms": round(self.total_flush_time / self.batches * 1000, 3) if self.batches else 0.0,
+            "max_flush_ms": round(self.max_flush_time * 1000, 3)
+        }
+
+    def log_stats(self):
+        self.logger.info(f"[RedisStreamWriter] {self.get_stats()}")
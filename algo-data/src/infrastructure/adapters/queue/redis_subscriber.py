@@ -0,0 +1,86 @@
+import logging
+import threading
+import time
+from typing import Callable
+
+import redis
+
+
+class RedisSubscriber:
+    """
+    One pubsub connection per process, shared by every RedisAdapter of the
+    process. Channels are multiplexed on it: a channel is subscribed on Redis
+    while at least one handler is registered for it, and each message is
+    handed to the handlers of its channel as (channel, payload) from a single
+    listener thread.
+    """
+    def __init__(self, logger: logging.Logger, client: redis.Redis, max_backoff: float = 30):
+        self.logger = logger
+        self.pubsub = client.pubsub()
+        self.max_backoff = max_backoff
+        self.handlers: dict[str, list] = {}
+        self.messages_dispatched = 0
+        self.handler_errors = 0
+        self.listener_thread: threading.Thread = None
+        self._lock = threading.Lock()
+        self._subscribed = threading.Condition(self._lock)
+
+    def subscribe(self, channel: str, handler: Callable):
+        with self._lock:
+            handlers = self.handlers.setdefault(channel, [])
+            if not handlers:
+                self.pubsub.subscribe(channel)
+            handlers.append(handler)
+            self._subscribed.notify()
+        self.start()
+
+    def unsubscribe(self, channel: str, handler: Callable):
+        with self._lock:
+            handlers = self.handlers.get(channel)
+            if not handlers or handler not in handlers:
+                return
+            handlers.remove(handler)
+            if not handlers:
+                del self.handlers[channel]
+                self.pubsub.unsubscribe(channel)
+
+    def dispatch(self, channel: str, payload: bytes):
+        self.messages_dispatched += 1
+        for handler in list(self.handlers.get(channel, ())):
+            try:
+                handler(channel, payload)
+            except Exception as err:
+                self.handler_errors += 1
+                self.logger.error(f"[RedisSubscriber] Handler of {channel} failed, reason: {err}")
+
+    def run(self):
+        backoff = 1
+        while True:
+            with self._lock:
+                while not self.handlers:
+                    self._subscribed.wait()
+            try:
+                # Returns once every channel is unsubscribed.
+                for message in self.pubsub.listen():
+                    backoff = 1
+                    if message["type"] == "message":
+                        self.dispatch(message["channel"].decode(), message["data"])
+            except (redis.ConnectionError, redis.TimeoutError) as err:
+                # The pubsub resubscribes to its channels when it reconnects.
+                self.logger.error(f"[RedisSubscriber] Lost subscription connection, retrying in {backoff}s: {err}")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    def start(self):
+        with self._lock:
+            if self.listener_thread and self.listener_thread.is_alive():
+                return
+            self.listener_thread = threading.Thread(target=self.run, daemon=True)
+            self.listener_thread.start()
+
+    def get_stats(self) -> dict:
+        return {
+            "subscribed_channels": len(self.handlers),
+            "messages_dispatched": self.messages_dispatched,
+            "handler_errors": self.handler_errors
+        }
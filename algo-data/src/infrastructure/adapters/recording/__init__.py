@@ -0,0 +1 @@
+from .tick_journal import TickJournal, TickJournalReader, JournalRecord, FeedId
\ No newline at end of file
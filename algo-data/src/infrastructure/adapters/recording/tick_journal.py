@@ -0,0 +1,183 @@
+import glob
+import heapq
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from enum import IntEnum
+from typing import Iterator, List, NamedTuple, Union
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+JOURNAL_MAGIC = b"TJNL"
+JOURNAL_VERSION = 1
+JOURNAL_SUFFIX = ".tjnl"
+
+# magic, version, flags, created at (epoch ns)
+FILE_HEADER = struct.Struct("<4sHHq")
+# payload length, feed id, flags, received at (epoch ns), received at (monotonic ns)
+RECORD_HEADER = struct.Struct("<IHHqq")
+
+TEXT_FLAG = 1
+
+
+class FeedId(IntEnum):
+    BINANCE_COINM = 1
+    FLOWA_ORDERS = 2
+    FLOWA_TRADES = 3
+    HASHDEX_INAV = 4
+    BINANCE_COINM_DEPTH = 5
+    BINANCE_COINM_DEPTH_SNAPSHOT = 6
+
+
+class JournalRecord(NamedTuple):
+    feed_id: int
+    recv_time_ns: int
+    recv_monotonic_ns: int
+    payload: Union[bytes, str]
+
+
+class TickJournal:
+    """
+    Append-only journal of raw feed frames written through a memory map.
+
+    Files are preallocated to roll_bytes and rolled when full or after
+    roll_seconds. Recording is disabled when no directory is configured.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        name: str,
+        directory: str = None,
+        roll_bytes: int = None,
+        roll_seconds: int = None
+    ):
+        self.logger = logger
+        self.name = name
+        self.directory = directory or os.environ.get(f"TICK_JOURNAL_DIR_{ENV}")
+        self.roll_bytes = int(roll_bytes or os.environ.get(f"TICK_JOURNAL_ROLL_BYTES_{ENV}", 64 * 1024 * 1024))
+        self.roll_seconds = int(roll_seconds or os.environ.get(f"TICK_JOURNAL_ROLL_SECONDS_{ENV}", 3600))
+        self.enabled = bool(self.directory)
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._mmap: mmap.mmap = None
+        self._size = 0
+        self._offset = 0
+        self._opened_at_ns = 0
+        self._sequence = 0
+        self.path: str = None
+        self.records = 0
+
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+            self._open_file(self.roll_bytes)
+
+    def _open_file(self, size: int):
+        self._sequence += 1
+        self.path = os.path.join(
+            self.directory,
+            f"{self.name}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{self._sequence:04d}{JOURNAL_SUFFIX}"
+        )
+        self._file = open(self.path, "w+b")
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._size = size
+        FILE_HEADER.pack_into(self._mmap, 0, JOURNAL_MAGIC, JOURNAL_VERSION, 0, time.time_ns())
+        self._offset = FILE_HEADER.size
+        self._opened_at_ns = time.monotonic_ns()
+        self.logger.info(f"[TickJournal] Recording {self.name} to {self.path}")
+
+    def _close_file(self):
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(self._offset)
+        self._file.close()
+        self._mmap = None
+
+    def record(self, feed_id: int, message: Union[bytes, str]):
+        if not self.enabled:
+            return
+        recv_time_ns = time.time_ns()
+        recv_monotonic_ns = time.monotonic_ns()
+
+        if isinstance(message, str):
+            payload = message.encode()
+            flags = TEXT_FLAG
+        else:
+            payload = message
+            flags = 0
+        record_size = RECORD_HEADER.size + len(payload)
+
+        with self._lock:
+            if self._mmap is None:
+                return
+            if (
+                self._offset + record_size > self._size
+                or recv_monotonic_ns - self._opened_at_ns > self.roll_seconds * 1_000_000_000
+            ):
+                self._close_file()
+                self._open_file(max(self.roll_bytes, FILE_HEADER.size + record_size))
+
+            RECORD_HEADER.pack_into(
+                self._mmap, self._offset, len(payload), feed_id, flags, recv_time_ns, recv_monotonic_ns
+            )
+            payload_offset = self._offset + RECORD_HEADER.size
+            self._mmap[payload_offset:payload_offset + len(payload)] = payload
+            self._offset += record_size
+            self.records += 1
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._close_file()
+
+
+class TickJournalReader:
+    def __init__(self, paths: List[str], feed_ids: List[int] = None):
+        self.paths = sorted(paths)
+        self.feed_ids = set(feed_ids) if feed_ids else None
+
+    @classmethod
+    def from_directory(cls, directory: str, feed_ids: List[int] = None) -> "TickJournalReader":
+        return cls(glob.glob(os.path.join(directory, f"*{JOURNAL_SUFFIX}")), feed_ids)
+
+    def read_file(self, path: str) -> Iterator[JournalRecord]:
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, _, _ = FILE_HEADER.unpack_from(data, 0)
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+            raise ValueError(f"{path} is not a version {JOURNAL_VERSION} tick journal")
+
+        offset = FILE_HEADER.size
+        while offset + RECORD_HEADER.size <= len(data):
+            length, feed_id, flags, recv_time_ns, recv_monotonic_ns = RECORD_HEADER.unpack_from(data, offset)
+            # Preallocated space that was never written is zero filled.
+            if feed_id == 0:
+                return
+            payload_offset = offset + RECORD_HEADER.size
+            payload = data[payload_offset:payload_offset + length]
+            offset = payload_offset + length
+
+            if self.feed_ids and feed_id not in self.feed_ids:
+                continue
+            yield JournalRecord(
+                feed_id,
+                recv_time_ns,
+                recv_monotonic_ns,
+                payload.decode() if flags & TEXT_FLAG else payload
+            )
+
+    def __iter__(self) -> Iterator[JournalRecord]:
+        # Each process writes its own files, merge them back in receive order.
+        return heapq.merge(
+            *(self.read_file(path) for path in self.paths),
+            key=lambda record: record.recv_time_ns
+        )
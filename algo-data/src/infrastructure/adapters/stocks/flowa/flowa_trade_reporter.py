@@ -9,6 +9,7 @@ from dotenv import load_dotenv
 
 from src.infrastructure.adapters.websocket_adapter import WebsocketAdapter
 from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.recording.tick_journal import TickJournal, FeedId
 
 load_dotenv()
 
@@ -19,7 +20,8 @@ class FlowaTradeReporter(WebsocketAdapter):
     def __init__(
             self,
             channel: str,
-            logger: logging.Logger = LoggerAdapter().get_logger()
+            logger: logging.Logger = LoggerAdapter().get_logger(),
+            recorder: TickJournal = None
         ) -> None:
         self.api_secret: str = os.environ.get(f"FLOWA_API_SECRET_{ENV}")
         self.client_id: str = os.environ.get(f"FLOWA_CLIENT_ID_{ENV}")
@@ -29,6 +31,8 @@ class FlowaTradeReporter(WebsocketAdapter):
         self.logger = logger
         self.channel = channel
         self.provider = "Flowa"
+        self.recorder = recorder
+        self.feed_id = FeedId.FLOWA_ORDERS if channel == "orders" else FeedId.FLOWA_TRADES
 
     def process_order_message_data(self, msg_data: dict):
         return {
@@ -47,10 +51,12 @@ class FlowaTradeReporter(WebsocketAdapter):
         if message == b'\xff':
             ws.send(b'1')
             return
-        
+
+        if self.recorder:
+            self.recorder.record(self.feed_id, message)
         try:
             msg_data = msgpack.unpackb(message)
-            self.logger.info(f"{self.provider}-{self.channel} | Received: {msg_data}")
+            self.logger.info("%s-%s | Received: %s", self.provider, self.channel, msg_data)
             processed_msg = self.process_order_message_data(msg_data)
             self.on_event(processed_msg)
         except Exception as err:
@@ -1,11 +1,15 @@
+import json
 import os
+import threading
 from datetime import datetime
 
 import requests
 from dotenv import load_dotenv
 
 from src.infrastructure.adapters.inav_md_adapter import InavMDAdapter
+from src.infrastructure.adapters.http.async_http_client import AsyncHttpClient, HttpStatusError
 from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.recording.tick_journal import TickJournal, FeedId
 
 load_dotenv()
 
@@ -14,12 +18,33 @@ ENV = os.environ.get("ENV", "DEV")
 
 
 class HashdexMDAdapter(InavMDAdapter):
-    def __init__(self, logger = LoggerAdapter().get_logger()):
+    def __init__(
+        self,
+        logger = LoggerAdapter().get_logger(),
+        recorder: TickJournal = None,
+        http_client: AsyncHttpClient = None,
+        timeout: float = None
+    ):
         self.endpoint = os.environ.get(f"HASHDEX_MD_ENDPOINT_{ENV}")
         self.logger = logger
+        self.recorder = recorder
+        self.timeout = float(timeout or os.environ.get(f"HTTP_TIMEOUT_{ENV}", 5))
+        # requests.Session is not thread safe and PCF refreshes run on the poll scheduler threads.
+        self._local = threading.local()
+        self.http_client = http_client or AsyncHttpClient(logger, self.endpoint, timeout=self.timeout)
         self.crypto_quantity_on_onshore_etf_dict = {}
         self.last_updated_date_dict = {}
 
+    def get_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def record_response(self, content: bytes):
+        if self.recorder:
+            self.recorder.record(FeedId.HASHDEX_INAV, content)
+
     def check_should_refresh_quantity(self, onshore_ticker: str) -> bool:
         if not (
             self.crypto_quantity_on_onshore_etf_dict.get(onshore_ticker)
@@ -35,40 +60,84 @@ class HashdexMDAdapter(InavMDAdapter):
     def fetch_price(self, ticker: str) -> float:
         suffix = f"inav"
 
-        response = requests.get(
-            url=f"{self.endpoint}/{suffix}/{ticker}"
+        response = self.get_session().get(
+            url=f"{self.endpoint}/{suffix}/{ticker}",
+            timeout=self.timeout
         )
+        self.record_response(response.content)
         price_data = response.json()
         price = float(price_data["inavPerShare"])
         self.logger.debug(f"New inav fetched for {ticker}: {price}")
         return price
+
+    async def fetch_price_async(self, ticker: str) -> float:
+        status, content = await self.http_client.get(f"/inav/{ticker}")
+        self.record_response(content)
+        if status != 200:
+            raise HttpStatusError(f"Hashdex returned {status} for {ticker}")
+        price = float(json.loads(content)["inavPerShare"])
+        self.logger.debug(f"New inav fetched for {ticker}: {price}")
+        return price
+
+    async def close(self):
+        await self.http_client.close()
     
     def get_underlying_asset_quantity(self, price_data: dict) -> float:
         for underlying_asset in price_data["pcf"]:
             if underlying_asset["symbol"] != "Cash":
                 return underlying_asset["quantity"]
 
+    def get_holdings(self, price_data: dict) -> dict:
+        """
+        Quantity of every non Cash holding of the PCF, by symbol.
+        """
+        return {
+            holding["symbol"]: holding["quantity"]
+            for holding in price_data["pcf"]
+            if holding["symbol"] != "Cash"
+        }
+
+    def fetch_pcf(self, onshore_ticker: str, offshore_ticker: str) -> dict:
+        suffix = f"inav"
+
+        onshore_request = self.get_session().get(
+            url=f"{self.endpoint}/{suffix}/{onshore_ticker}",
+            timeout=self.timeout
+        )
+        self.record_response(onshore_request.content)
+        onshore_data = onshore_request.json()
+        onshore_shares_quantity_per_creation = onshore_data["info"]["numberOfSharesPerCreationUnit"]
+        offshore_quantity_on_onshore = self.get_underlying_asset_quantity(onshore_data)
+
+        offshore_request = self.get_session().get(
+            url=f"{self.endpoint}/{suffix}/{offshore_ticker}",
+            timeout=self.timeout
+        )
+        self.record_response(offshore_request.content)
+        offshore_data = offshore_request.json()
+        crypto_quantity_on_offshore = self.get_underlying_asset_quantity(offshore_data)
+
+        amount_of_crypto_on_onshore = (
+            (offshore_quantity_on_onshore * crypto_quantity_on_offshore) 
+            / onshore_shares_quantity_per_creation
+        )
+        # Every crypto the offshore fund holds, per onshore share, for multi-asset ETFs.
+        basket = {
+            symbol: offshore_quantity_on_onshore * quantity / onshore_shares_quantity_per_creation
+            for symbol, quantity in self.get_holdings(offshore_data).items()
+        }
+        return {
+            "offshore_symbol": offshore_ticker,
+            "shares_per_creation_unit": onshore_shares_quantity_per_creation,
+            "offshore_quantity_on_onshore": offshore_quantity_on_onshore,
+            "crypto_quantity_on_offshore": crypto_quantity_on_offshore,
+            "amount_of_underlying_asset": amount_of_crypto_on_onshore,
+            "basket": basket
+        }
+
     def get_crypto_quantity_on_onshore_etf(self, onshore_ticker: str, offshore_ticker: str) -> float:
         if self.check_should_refresh_quantity(onshore_ticker):
-            suffix = f"inav"
-
-            onshore_request = requests.get(
-                url=f"{self.endpoint}/{suffix}/{onshore_ticker}"
-            )
-            onshore_data = onshore_request.json()
-            onshore_shares_quantity_per_creation = onshore_data["info"]["numberOfSharesPerCreationUnit"]
-            offshore_quantity_on_onshore = self.get_underlying_asset_quantity(onshore_data)
-
-            offshore_request = requests.get(
-                url=f"{self.endpoint}/{suffix}/{offshore_ticker}"
-            )
-            offshore_data = offshore_request.json()
-            crypto_quantity_on_offshore = self.get_underlying_asset_quantity(offshore_data)
-
-            amount_of_crypto_on_onshore = (
-                (offshore_quantity_on_onshore * crypto_quantity_on_offshore) 
-                / onshore_shares_quantity_per_creation
-            )
+            amount_of_crypto_on_onshore = self.fetch_pcf(onshore_ticker, offshore_ticker)["amount_of_underlying_asset"]
                     
             self.logger.info(f"New crypto quantity fetched for {onshore_ticker}: {amount_of_crypto_on_onshore}")
             self.crypto_quantity_on_onshore_etf_dict[onshore_ticker] = amount_of_crypto_on_onshore
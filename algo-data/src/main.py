@@ -1,4 +1,6 @@
-from multiprocessing import Process
+import os
+
+from dotenv import load_dotenv
 
 from src.application.data_collectors import (
     InavDataCollector,
@@ -7,13 +9,23 @@ from src.application.data_collectors import (
     MdDataCollector,
     DollarCollector
 )
+from src.application.supervisor import ProcessSupervisor, ProcessSpec, load_supervisor_config
 from src.infrastructure.adapters.crypto.coinbase.coinbase_dollar_adapter import CoinbaseDollarAdapter
 from src.infrastructure.adapters.stocks.hashdex.hashdex_md_adapter import HashdexMDAdapter
 from src.infrastructure.adapters.stocks.flowa.flowa_trade_reporter import FlowaTradeReporter
 from src.infrastructure.adapters.crypto.binance.binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+from src.infrastructure.adapters.crypto.binance.binance_spot_fx_adapter import BinanceSpotFxAdapter
+from src.infrastructure.adapters.crypto.binance.binance_coinm_depth_adapter import BinanceCoinMDepthAdapter
+from src.infrastructure.adapters.crypto.binance.binance_coinm_stream_engine import BinanceCoinMStreamEngine
+from src.infrastructure.adapters.crypto.order_book import PriceSource
+from src.infrastructure.adapters.cache import SharedValueCache
 from src.infrastructure.adapters.logger_adapter import LoggerAdapter
 from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+from src.infrastructure.adapters.recording.tick_journal import TickJournal
+
+load_dotenv()
 
+ENV = os.environ.get("ENV", "DEV")
 
 
 def start_inav_collector_process(logger):
@@ -21,7 +33,8 @@ def start_inav_collector_process(logger):
         logger=logger,
         collector_adapter=HashdexMDAdapter(logger),
         redis_adapter=RedisAdapter(logger),
-        assets_list=["BITH11", "ETHE11", "SOLH11"]
+        assets_list=["BITH11", "ETHE11", "SOLH11"],
+        shared_cache=SharedValueCache(logger, create=True)
     )
     inav_collector.run()
 
@@ -29,17 +42,27 @@ def start_dollar_collector_process(logger):
     dollar_collector = DollarCollector(
         logger=logger,
         redis_adapter=RedisAdapter(logger),
-        dollar_adapter=CoinbaseDollarAdapter(logger)
+        dollar_adapter=CoinbaseDollarAdapter(logger),
+        stream_adapter=BinanceSpotFxAdapter(logger),
+        shared_cache=SharedValueCache(logger, create=True)
     )
     dollar_collector.run()
 
 def start_binance_md_collector(logger):
+    recorder = TickJournal(logger, "binance-coinm")
+    price_source = PriceSource(os.environ.get(f"BINANCE_COINM_PRICE_SOURCE_{ENV}", PriceSource.LAST.value))
+    if price_source == PriceSource.LAST:
+        websocket_adapter = BinanceCoinMWebsocketAdapter(logger, recorder=recorder)
+    else:
+        websocket_adapter = BinanceCoinMDepthAdapter(logger, recorder=recorder, price_source=price_source)
     binance_md_collector = MdDataCollector(
         logger=logger,
-        websocket_adapter=BinanceCoinMWebsocketAdapter(logger),
-        inav_adapter=HashdexMDAdapter(logger),
+        websocket_adapter=websocket_adapter,
+        inav_adapter=HashdexMDAdapter(logger, recorder=recorder),
         message_broker=RedisAdapter(logger),
-        retry_time=2
+        retry_time=2,
+        stream_engine=BinanceCoinMStreamEngine(logger, websocket_adapter),
+        shared_cache=SharedValueCache(logger, create=True)
     )
     binance_md_collector.run()
 
@@ -48,7 +71,8 @@ def start_order_reporter_process(logger):
         logger=logger,
         reporter_adapter=FlowaTradeReporter(
             channel="orders",
-            logger=logger
+            logger=logger,
+            recorder=TickJournal(logger, "flowa-orders")
         ),
         redis_adapter=RedisAdapter(logger)
     )
@@ -59,7 +83,8 @@ def start_trade_streamer_process(logger):
         logger=logger,
         reporter_adapter=FlowaTradeReporter(
             channel="trades",
-            logger=logger
+            logger=logger,
+            recorder=TickJournal(logger, "flowa-trades")
         ),
         redis_adapter=RedisAdapter(logger),
         provider="Flowa"
@@ -67,25 +92,38 @@ def start_trade_streamer_process(logger):
     trade_streamer.run()
 
 
-if __name__ == '__main__':
-    logger = LoggerAdapter().get_logger()
-
-    process_list: list[Process] = [
-        Process(target=start_dollar_collector_process, args=(logger, )),
-        Process(target=start_order_reporter_process, args=(logger, )),
-        Process(target=start_binance_md_collector, args=(logger, )),
+def build_process_specs(logger) -> list:
+    """
+    Latency-critical feeds and background pollers get separate cores once
+    SUPERVISOR_CONFIG assigns them, the inav and trade streamer processes
+    are opt-in.
+    """
+    specs = [
+        ProcessSpec("dollar", start_dollar_collector_process, (logger, )),
+        ProcessSpec("order-reporter", start_order_reporter_process, (logger, )),
+        ProcessSpec("binance-md", start_binance_md_collector, (logger, ), min_backoff=0.5, max_backoff=10),
+        ProcessSpec("inav", start_inav_collector_process, (logger, ), enabled=False),
+        ProcessSpec("trade-streamer", start_trade_streamer_process, (logger, ), enabled=False),
     ]
+    # The supervisor serves METRICS_PORT, each process the ports after it.
+    metrics_port = os.environ.get(f"METRICS_PORT_{ENV}")
+    if metrics_port:
+        for index, spec in enumerate(specs, start=1):
+            spec.metrics_port = int(metrics_port) + index
+    config = load_supervisor_config()
+    unknown = set(config) - {spec.name for spec in specs}
+    if unknown:
+        raise ValueError(f"Unknown processes in supervisor config: {sorted(unknown)}")
+    return [spec.apply_config(config.get(spec.name, {})) for spec in specs]
 
-    try:
-        for p in process_list:
-            p.start()
-    except KeyboardInterrupt:
-        print("KeyboardInterrupt received. Terminating child processes...")
 
-        for p in process_list:
-            p.terminate()
-        
-        for p in process_list:
-            p.join()
-        
-        print("All processes terminated.")
+if __name__ == '__main__':
+    logger = LoggerAdapter().get_logger()
+
+    metrics_port = os.environ.get(f"METRICS_PORT_{ENV}")
+    supervisor = ProcessSupervisor(
+        logger,
+        build_process_specs(logger),
+        metrics_port=int(metrics_port) if metrics_port else None
+    )
+    supervisor.run()
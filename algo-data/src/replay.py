@@ -0,0 +1,101 @@
+import argparse
+import logging
+from typing import Iterable
+
+from src.application.data_collectors import (
+    MdDataCollector,
+    OrderReporter,
+    TradeStreamer,
+    InavConflator
+)
+from src.application.replay import ReplayEngine, StaticInavAdapter
+from src.infrastructure.adapters.crypto.binance.binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+from src.infrastructure.adapters.stocks.flowa.flowa_trade_reporter import FlowaTradeReporter
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.queue import RedisAdapter, RedisStreamWriter, LocalRedis
+from src.infrastructure.adapters.metrics import LatencyTracker
+from src.infrastructure.adapters.recording import TickJournalReader, JournalRecord, FeedId
+
+
+
+def build_replay_engine(
+        logger: logging.Logger,
+        records: Iterable[JournalRecord],
+        speed: float,
+        usd_brl: float,
+        quantities: dict[str, float]
+    ) -> tuple[ReplayEngine, LocalRedis]:
+    local_redis = LocalRedis()
+    local_redis.set("USD:BRL", usd_brl)
+    message_broker = RedisAdapter(logger, redis_db=local_redis)
+
+    # Collectors run synchronously on the replay thread so runs are deterministic.
+    md_collector = MdDataCollector(
+        logger=logger,
+        websocket_adapter=BinanceCoinMWebsocketAdapter(logger, streams=[], host=""),
+        inav_adapter=StaticInavAdapter(quantities),
+        message_broker=message_broker,
+        retry_time=0,
+        # Wall clock stamps would make replayed payloads differ run to run.
+        latency_tracker=LatencyTracker(logger, "replay", enabled=False)
+    )
+    md_collector.inav_conflator = InavConflator(logger, md_collector.dispatch_inav, flush_interval=0)
+    md_collector.fx_cache.warm_up()
+    md_collector.pcf_cache.refresh_all()
+    md_collector.websocket_adapter.on_event = md_collector.publish_data
+
+    order_reporter = OrderReporter(
+        logger=logger,
+        reporter_adapter=FlowaTradeReporter(channel="orders", logger=logger),
+        redis_adapter=message_broker
+    )
+    order_reporter.reporter_adapter.on_event = order_reporter.dispatch_order_report_event
+
+    trade_streamer = TradeStreamer(
+        logger=logger,
+        reporter_adapter=FlowaTradeReporter(channel="trades", logger=logger),
+        redis_adapter=message_broker,
+        provider="Flowa"
+    )
+    trade_streamer.stream_writer = RedisStreamWriter(logger, message_broker, flush_interval=0)
+    trade_streamer.reporter_adapter.on_event = trade_streamer.dispatch_trade_report_event
+
+    replay_engine = ReplayEngine(
+        logger=logger,
+        records=records,
+        speed=speed
+    )
+    replay_engine.register(FeedId.BINANCE_COINM, md_collector.websocket_adapter.on_message)
+    replay_engine.register(FeedId.FLOWA_ORDERS, order_reporter.reporter_adapter.on_message)
+    replay_engine.register(FeedId.FLOWA_TRADES, trade_streamer.reporter_adapter.on_message)
+    return replay_engine, local_redis
+
+
+def parse_quantities(values: list[str]) -> dict[str, float]:
+    quantities = {}
+    for value in values:
+        symbol, quantity = value.split("=")
+        quantities[symbol] = float(quantity)
+    return quantities
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay recorded algo-data feeds through the collectors.")
+    parser.add_argument("journal_dir", help="Directory with .tjnl tick journal files")
+    parser.add_argument("--speed", type=float, default=0, help="1 = real time, N = N times faster, 0 = as fast as possible")
+    parser.add_argument("--usd-brl", type=float, required=True, help="USD:BRL rate seeded in the local broker")
+    parser.add_argument("--quantity", action="append", default=[], help="Underlying quantity per ETF share, e.g. BITH11=0.00028")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logger = LoggerAdapter(level=args.log_level).get_logger()
+    replay_engine, local_redis = build_replay_engine(
+        logger=logger,
+        records=TickJournalReader.from_directory(args.journal_dir),
+        speed=args.speed,
+        usd_brl=args.usd_brl,
+        quantities=parse_quantities(args.quantity)
+    )
+    stats = replay_engine.run()
+    print(f"Replay stats: {stats}")
+    print(f"Published messages per channel: {dict(local_redis.published)}")
@@ -1,6 +1,19 @@
 from .binance import (
-    TestBinanceMDAdapter
+    TestBinanceMDAdapter,
+    TestBinanceCoinMStreamEngine,
+    TestL2OrderBook,
+    TestBinanceCoinMDepthAdapter
 )
 from .coinbase import CoinbaseDollarAdapter
 from .hashdex import TestHashdexMDAdapter
-from .data_collectors import TestInavDataCollector, TestFlowaTradeReporter
\ No newline at end of file
+from .data_collectors import TestInavDataCollector, TestFlowaTradeReporter, TestInavConflator, TestAdaptivePollScheduler, TestFxAggregator, TestMdDataCollector
+from .queue import TestHandoffQueue, TestRedisStreamWriter, TestRedisAdapterBatch, TestMessageCodec, TestRedisConnectionManager
+from .cache import TestFxCache, TestPcfCache, TestSharedValueCache
+from .recording import TestTickJournal
+from .replay import TestReplayEngine
+
+from .http import TestAsyncHttpClient
+from .market_data import TestBasketInavEngine
+from .logger import TestLoggerAdapter
+from .supervisor import TestProcessSupervisor
+from .metrics import TestLatencyHistogram, TestLatencyTracker, TestMetricsRegistry, TestMetricsServer
\ No newline at end of file
@@ -1 +1,3 @@
-from .test_binance_md_adapter import TestBinanceMDAdapter
\ No newline at end of file
+from .test_binance_md_adapter import TestBinanceMDAdapter
+from .test_binance_coinm_stream_engine import TestBinanceCoinMStreamEngine
+from .test_binance_coinm_depth_adapter import TestL2OrderBook, TestBinanceCoinMDepthAdapter
\ No newline at end of file
@@ -0,0 +1,135 @@
+import json
+
+from src.infrastructure.adapters.crypto.binance.binance_coinm_depth_adapter import BinanceCoinMDepthAdapter
+from src.infrastructure.adapters.crypto.order_book import L2OrderBook, PriceSource
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+SYMBOL = "BTCUSD_PERP"
+
+
+class SnapshotDepthAdapter(BinanceCoinMDepthAdapter):
+    """
+    Serves snapshots from memory and loads them inline instead of on a thread.
+    """
+    def __init__(self, snapshots: list, **kwargs):
+        super().__init__(logger, streams=["btcusd_perp@depth@100ms"], host="ws://127.0.0.1:0", **kwargs)
+        self.snapshots = snapshots
+        self.snapshot_calls = 0
+
+    def fetch_snapshot(self, symbol: str) -> dict:
+        self.snapshot_calls += 1
+        return self.snapshots.pop(0)
+
+    def request_snapshot(self, symbol: str):
+        if not self.snapshot_requested.get(symbol):
+            self.pending_snapshot = symbol
+            self.snapshot_requested[symbol] = True
+
+    def complete_snapshot(self):
+        self.snapshot_requested[self.pending_snapshot] = False
+        self.load_snapshot(self.pending_snapshot)
+
+
+def depth_frame(first_id: int, final_id: int, previous_id: int, bids: list = (), asks: list = ()) -> str:
+    return json.dumps({
+        "stream": "btcusd_perp@depth@100ms",
+        "data": {
+            "e": "depthUpdate", "s": SYMBOL,
+            "U": first_id, "u": final_id, "pu": previous_id,
+            "b": list(bids), "a": list(asks)
+        }
+    })
+
+
+SNAPSHOT = {
+    "lastUpdateId": 100,
+    "bids": [["60000.0", "10"], ["59990.0", "20"]],
+    "asks": [["60010.0", "5"], ["60020.0", "30"]]
+}
+
+
+class TestL2OrderBook:
+    def setup_method(self):
+        self.book = L2OrderBook(SYMBOL)
+        self.book.load_snapshot(SNAPSHOT["bids"], SNAPSHOT["asks"], SNAPSHOT["lastUpdateId"])
+
+    def test_best_levels_and_mid(self):
+        assert self.book.best_bid() == 60000.0
+        assert self.book.best_ask() == 60010.0
+        assert self.book.mid_price() == 60005.0
+
+    def test_apply_diff_inserts_updates_and_removes_levels(self):
+        self.book.apply_diff([["60005.0", "1"], ["60000.0", "0"]], [["60010.0", "7"]], 101)
+
+        assert self.book.best_bid() == 60005.0
+        assert self.book.get_depth()["bids"] == [[60005.0, 1.0], [59990.0, 20.0]]
+        assert self.book.get_depth()["asks"][0] == [60010.0, 7.0]
+        assert self.book.last_update_id == 101
+
+    def test_depth_weighted_price(self):
+        # Bids: 10 @ 60000 + 5 @ 59990, asks: 5 @ 60010 + 10 @ 60020.
+        bid = (10 * 60000.0 + 5 * 59990.0) / 15
+        ask = (5 * 60010.0 + 10 * 60020.0) / 15
+        assert self.book.get_price(PriceSource.DEPTH_WEIGHTED, 15) == (bid + ask) / 2
+        assert self.book.depth_weighted_price(1000) is None
+
+
+class TestBinanceCoinMDepthAdapter:
+    def setup_method(self):
+        self.adapter = SnapshotDepthAdapter([dict(SNAPSHOT), dict(SNAPSHOT, lastUpdateId=200)], price_source=PriceSource.BID)
+
+    def test_buffers_until_snapshot_then_applies_diffs(self):
+        assert self.adapter.parse_message(depth_frame(95, 99, 94, bids=[["1", "1"]])) is None
+        assert self.adapter.parse_message(depth_frame(100, 102, 99, bids=[["60001.0", "1"]])) is None
+        self.adapter.complete_snapshot()
+
+        book = self.adapter.get_book(SYMBOL)
+        assert book.best_bid() == 60001.0
+        assert book.last_update_id == 102
+
+        assert self.adapter.parse_message(depth_frame(103, 104, 102, bids=[["60002.0", "1"]])) == (SYMBOL, 60002.0, None)
+        # Unchanged best bid is not emitted again.
+        assert self.adapter.parse_message(depth_frame(105, 106, 104, asks=[["60015.0", "1"]])) is None
+
+    def test_sequence_gap_triggers_resync(self):
+        self.adapter.parse_message(depth_frame(100, 101, 99))
+        self.adapter.complete_snapshot()
+
+        assert self.adapter.parse_message(depth_frame(110, 111, 109)) is None
+        assert self.adapter.get_stats()[SYMBOL]["synced"] is False
+        assert self.adapter.resyncs[SYMBOL] == 1
+
+        self.adapter.parse_message(depth_frame(199, 201, 198, bids=[["60003.0", "1"]]))
+        self.adapter.complete_snapshot()
+
+        assert self.adapter.snapshot_calls == 2
+        assert self.adapter.get_book(SYMBOL).best_bid() == 60003.0
+        assert self.adapter.get_stats()[SYMBOL]["synced"] is True
+
+    def test_buffered_event_that_fails_is_counted_and_rest_kept(self):
+        self.adapter.parse_message(depth_frame(100, 101, 99, bids=[["not-a-price", "1"]]))
+        self.adapter.parse_message(depth_frame(102, 103, 101))
+        self.adapter.complete_snapshot()
+
+        assert self.adapter.get_stats()[SYMBOL]["failed_events"] == 1
+        assert self.adapter.get_stats()[SYMBOL]["synced"] is False
+        assert [event["u"] for event in self.adapter.pending_events[SYMBOL]] == [101, 103]
+
+    def test_lost_shard_only_resets_its_own_books(self):
+        self.adapter.parse_message(depth_frame(100, 101, 99))
+        self.adapter.complete_snapshot()
+        self.adapter.parse_message(depth_frame(102, 103, 101, bids=[["60001.0", "1"]]))
+        self.adapter.synced["ETHUSD_PERP"] = True
+        self.adapter.last_prices["ETHUSD_PERP"] = 3000.0
+
+        self.adapter.on_connection_lost(["ethusd_perp@depth@100ms"])
+
+        assert self.adapter.get_stats()[SYMBOL]["synced"] is True
+        assert self.adapter.last_prices[SYMBOL] == 60001.0
+        assert self.adapter.synced["ETHUSD_PERP"] is False
+        assert "ETHUSD_PERP" not in self.adapter.last_prices
+        assert self.adapter.snapshot_calls == 1
@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+import pytest
+import websockets
+
+from src.infrastructure.adapters.crypto.binance.binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+from src.infrastructure.adapters.crypto.binance.binance_coinm_stream_engine import BinanceCoinMStreamEngine
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+STREAMS = ["btcusd_perp@markPrice", "ethusd_perp@markPrice", "solusd_perp@markPrice"]
+
+
+class TestBinanceCoinMStreamEngine:
+    def setup_method(self):
+        self.websocket_adapter = BinanceCoinMWebsocketAdapter(
+            logger, streams=STREAMS, host="ws://127.0.0.1:0"
+        )
+
+    @pytest.mark.parametrize(("shard_count", "expected_shards"), [(1, 1), (2, 2), (10, 3)])
+    def test_split_streams(self, shard_count: int, expected_shards: int):
+        shards = BinanceCoinMStreamEngine.split_streams(STREAMS, shard_count)
+        assert len(shards) == expected_shards
+        assert sorted(stream for shard in shards for stream in shard) == sorted(STREAMS)
+
+    def test_shards_dispatch_ticks(self):
+        received = []
+
+        async def handler(ws):
+            streams = ws.request.path.split("streams=")[1].split("/")
+            for stream in streams:
+                symbol = stream.split("@")[0].upper()
+                await ws.send(json.dumps({"stream": stream, "data": {"s": symbol, "p": "100.5"}}))
+            await ws.wait_closed()
+
+        async def run():
+            async with websockets.serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                self.websocket_adapter.host = f"ws://127.0.0.1:{port}"
+                engine = BinanceCoinMStreamEngine(logger, self.websocket_adapter, shard_count=2)
+                task = asyncio.create_task(engine.run(lambda *tick: received.append(tick)))
+                while len(received) < len(STREAMS):
+                    await asyncio.sleep(0.01)
+                task.cancel()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=10))
+        assert sorted(asset for _, asset, _, _, _ in received) == ["BTCUSD_PERP", "ETHUSD_PERP", "SOLUSD_PERP"]
+        assert all(provider == "binance" and price == 100.5 for provider, _, price, _, _ in received)
+        assert all(event_time is None and received_at > 0 for _, _, _, event_time, received_at in received)
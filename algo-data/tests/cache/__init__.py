@@ -0,0 +1,3 @@
+from .test_fx_cache import TestFxCache
+from .test_pcf_cache import TestPcfCache
+from .test_shared_value_cache import TestSharedValueCache
\ No newline at end of file
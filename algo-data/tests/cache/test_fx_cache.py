@@ -0,0 +1,42 @@
+import pytest
+
+from src.infrastructure.adapters.cache.fx_cache import FxCache, FxUnavailableError
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+class BrokerStandIn:
+    def __init__(self, snapshot=None):
+        self.snapshot = snapshot
+
+    def get_key(self, key):
+        return self.snapshot
+
+
+class TestFxCache:
+    def test_rate_is_unavailable_before_first_update(self):
+        fx_cache = FxCache(logger, BrokerStandIn())
+        fx_cache.warm_up()
+        with pytest.raises(FxUnavailableError):
+            fx_cache.get_rate()
+
+    def test_warm_up_reads_snapshot(self):
+        fx_cache = FxCache(logger, BrokerStandIn(5.4321))
+        fx_cache.warm_up()
+        assert fx_cache.get_rate() == 5.4321
+        assert not fx_cache.is_stale()
+
+    def test_update_event_replaces_rate(self):
+        fx_cache = FxCache(logger, BrokerStandIn(5.4321))
+        fx_cache.warm_up()
+        fx_cache.on_fx_update({"symbol": "USD:BRL", "price": 5.5})
+        assert fx_cache.get_rate() == 5.5
+
+    def test_rate_goes_stale_after_max_age(self):
+        fx_cache = FxCache(logger, BrokerStandIn(), max_age=0.001)
+        fx_cache.on_fx_update({"price": 5.5})
+        fx_cache.updated_at -= 1
+        assert fx_cache.is_stale()
+        assert fx_cache.get_rate() == 5.5
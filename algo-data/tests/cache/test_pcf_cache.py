@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from src.application.replay.stand_ins import StaticInavAdapter
+from src.infrastructure.adapters.cache.pcf_cache import PcfCache, PcfUnavailableError
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis
+
+
+
+logger = LoggerAdapter().get_logger()
+
+ETF_MAPPING = {"BITH11": "HBTC.BH"}
+
+
+class TestPcfCache:
+    def setup_method(self):
+        self.local_redis = LocalRedis()
+        self.store = RedisAdapter(logger, redis_db=self.local_redis)
+        self.pcf_source = StaticInavAdapter({"BITH11": 0.0002})
+
+    def build_cache(self) -> PcfCache:
+        return PcfCache(logger, self.pcf_source, self.store, ETF_MAPPING)
+
+    def test_quantity_is_unavailable_before_refresh(self):
+        with pytest.raises(PcfUnavailableError):
+            self.build_cache().get_quantity("BITH11")
+
+    def test_refresh_persists_versioned_entry(self):
+        pcf_cache = self.build_cache()
+        pcf_cache.refresh_all()
+        pcf_cache.refresh_all()
+
+        entry = json.loads(self.local_redis.get("pcf:BITH11"))
+        assert pcf_cache.get_quantity("BITH11") == 0.0002
+        assert entry["amount_of_underlying_asset"] == 0.0002
+        assert entry["version"] == 1
+        assert self.local_redis.published["pcf-BITH11"] == 1
+
+        self.pcf_source.quantities["BITH11"] = 0.00021
+        pcf_cache.refresh_all()
+
+        assert pcf_cache.get_quantity("BITH11") == 0.00021
+        assert json.loads(self.local_redis.get("pcf:BITH11"))["version"] == 2
+        assert self.local_redis.published["pcf-BITH11"] == 2
+
+    def test_restart_warms_up_from_store(self):
+        self.build_cache().refresh_all()
+        self.pcf_source.quantities.clear()
+
+        restarted = self.build_cache()
+        restarted.warm_up()
+
+        assert restarted.get_quantity("BITH11") == 0.0002
+        assert restarted.entries["BITH11"]["version"] == 1
+
+
+    def test_basket_change_bumps_version(self):
+        self.pcf_source.baskets["BITH11"] = {"BTC": 0.0002}
+        pcf_cache = self.build_cache()
+        pcf_cache.refresh_all()
+
+        self.pcf_source.baskets["BITH11"] = {"BTC": 0.0002, "ETH": 0.001}
+        pcf_cache.refresh_all()
+
+        assert pcf_cache.entries["BITH11"]["basket"] == {"BTC": 0.0002, "ETH": 0.001}
+        assert pcf_cache.entries["BITH11"]["version"] == 2
\ No newline at end of file
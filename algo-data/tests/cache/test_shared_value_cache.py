@@ -0,0 +1,85 @@
+import math
+import multiprocessing
+import uuid
+
+import pytest
+
+from src.application.replay.stand_ins import StaticInavAdapter
+from src.infrastructure.adapters.cache import FxCache, PcfCache, SharedValueCache, SharedCacheFullError
+from src.infrastructure.adapters.cache.shared_value_cache import SEQ
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis
+
+
+
+logger = LoggerAdapter().get_logger()
+
+
+def write_from_child(name: str):
+    SharedValueCache(logger, name=name, create=True).put("pcf:BITH11", 0.0002)
+
+
+class TestSharedValueCache:
+    def setup_method(self):
+        self.name = f"test-lvc-{uuid.uuid4().hex[:8]}"
+        self.writer = SharedValueCache(logger, name=self.name, slots=8, create=True)
+        self.reader = SharedValueCache(logger, name=self.name)
+
+    def teardown_method(self):
+        self.reader.close()
+        self.writer.unlink()
+
+    def test_reader_sees_latest_write(self):
+        self.writer.put("inav:BITH11", 50.1, 0.0001)
+        self.writer.put("inav:BITH11", 50.2, 0.0001)
+
+        cached = self.reader.get("inav:BITH11")
+        assert (cached.value, cached.quantity) == (50.2, 0.0001)
+
+    def test_missing_key_and_segment_return_none(self):
+        assert self.reader.get("USD:BRL") is None
+        assert SharedValueCache(logger, name=f"{self.name}-missing").get("USD:BRL") is None
+
+    def test_stale_value_is_ignored(self):
+        self.writer.put("USD:BRL", 5.43)
+
+        assert math.isnan(self.reader.get("USD:BRL").quantity)
+
+        assert self.reader.get("USD:BRL", max_age=60).value == 5.43
+        assert self.reader.get("USD:BRL", max_age=-1) is None
+
+    def test_read_during_write_is_retried_then_given_up(self):
+        self.writer.put("USD:BRL", 5.43)
+        offset = self.writer.slot_index[b"USD:BRL"]
+        SEQ.pack_into(self.writer.buffer, offset, SEQ.unpack_from(self.writer.buffer, offset)[0] + 1)
+
+        assert self.reader.get("USD:BRL") is None
+        assert self.reader.torn_reads == 1
+
+        self.writer.put("USD:BRL", 5.44)
+        assert self.reader.get("USD:BRL").value == 5.44
+
+    def test_other_process_writes_are_visible(self):
+        process = multiprocessing.get_context("fork").Process(target=write_from_child, args=(self.name,))
+        process.start()
+        process.join()
+
+        assert self.reader.get("pcf:BITH11").value == 0.0002
+
+    def test_full_cache_raises(self):
+        for index in range(8):
+            self.writer.put(f"key-{index}", index)
+
+        with pytest.raises(SharedCacheFullError):
+            self.writer.put("key-8", 8)
+
+    def test_caches_write_and_prefer_shared_values(self):
+        store = RedisAdapter(logger, redis_db=LocalRedis())
+        pcf_cache = PcfCache(logger, StaticInavAdapter({"BITH11": 0.0002}), store, {"BITH11": "HBTC.BH"}, shared_cache=self.writer)
+        pcf_cache.refresh("BITH11")
+        fx_cache = FxCache(logger, store, shared_cache=self.reader)
+        fx_cache.on_fx_update({"price": 5.40})
+        self.writer.put("USD:BRL", 5.43)
+
+        assert self.reader.get("pcf:BITH11").value == 0.0002
+        assert fx_cache.get_rate() == 5.43
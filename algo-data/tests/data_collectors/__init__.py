@@ -1,2 +1,6 @@
 from .test_inav_data_collector import TestInavDataCollector
-from .test_flowa_trade_reporter import TestFlowaTradeReporter
\ No newline at end of file
+from .test_flowa_trade_reporter import TestFlowaTradeReporter
+from .test_inav_conflator import TestInavConflator
+from .test_poll_scheduler import TestAdaptivePollScheduler
+from .test_fx_aggregator import TestFxAggregator
+from .test_md_data_collector import TestMdDataCollector
\ No newline at end of file
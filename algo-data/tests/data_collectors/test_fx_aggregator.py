@@ -0,0 +1,99 @@
+import json
+import threading
+
+from src.application.data_collectors.dollar_collector import DollarCollector
+from src.application.data_collectors.fx_aggregator import FxAggregator
+from src.infrastructure.adapters.crypto.binance.binance_spot_fx_adapter import BinanceSpotFxAdapter
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis
+
+
+
+logger = LoggerAdapter().get_logger()
+
+def book_ticker(symbol: str, bid: float, ask: float) -> str:
+    return json.dumps({"stream": f"{symbol.lower()}@bookTicker", "data": {"s": symbol, "b": str(bid), "a": str(ask)}})
+
+
+class TestFxAggregator:
+    def setup_method(self):
+        self.published = []
+        self.aggregator = FxAggregator(
+            logger,
+            lambda rate, sources: self.published.append((rate, sources)),
+            max_age=15,
+            outlier_threshold=0.005
+        )
+
+    def test_publishes_median_of_sources(self):
+        self.aggregator.on_quote("coinbase", 5.50, 0.05)
+        self.aggregator.on_quote("binance-usdtbrl", 5.52)
+        self.aggregator.on_quote("binance-btc-cross", 5.505)
+
+        assert self.published[-1] == (5.505, ["binance-btc-cross", "binance-usdtbrl", "coinbase"])
+        assert self.aggregator.get_stats()["coinbase"]["avg_latency_ms"] == 50.0
+
+    def test_rejects_outliers(self):
+        self.aggregator.on_quote("coinbase", 5.50)
+        self.aggregator.on_quote("binance-usdtbrl", 5.51)
+        self.aggregator.on_quote("binance-btc-cross", 6.20)
+
+        assert self.published[-1] == (5.505, ["binance-usdtbrl", "coinbase"])
+        assert self.aggregator.get_stats()["binance-btc-cross"]["rejections"] == 1
+
+    def test_ignores_stale_sources_and_unchanged_rates(self):
+        self.aggregator.on_quote("coinbase", 5.40)
+        self.aggregator.sources["coinbase"].updated_at -= 60
+        self.aggregator.on_quote("binance-usdtbrl", 5.50)
+        self.aggregator.on_quote("binance-usdtbrl", 5.50)
+
+        assert self.published == [(5.40, ["coinbase"]), (5.50, ["binance-usdtbrl"])]
+        assert self.aggregator.get_stats()["coinbase"]["stale"] is True
+
+    def test_spot_adapter_derives_cross_rate(self):
+        adapter = BinanceSpotFxAdapter(logger, host="ws://127.0.0.1:0")
+        adapter.on_quote = self.aggregator.on_quote
+
+        adapter.handle_message(book_ticker("BTCBRL", 549000, 551000))
+        assert self.published == []
+        adapter.handle_message(book_ticker("BTCUSDT", 99990, 100010))
+        adapter.handle_message(book_ticker("USDTBRL", 5.49, 5.51))
+
+        assert self.aggregator.sources["binance-btc-cross"].rate == 5.5
+        assert self.aggregator.sources["binance-usdtbrl"].rate == 5.5
+        # The second source agrees, so the published rate does not move.
+        assert self.published == [(5.5, ["binance-btc-cross"])]
+
+    def test_two_diverging_sources_keep_the_one_near_last_rate(self):
+        self.aggregator.on_quote("coinbase", 5.50)
+        self.aggregator.on_quote("binance-usdtbrl", 5.51)
+        self.aggregator.on_quote("binance-usdtbrl", 6.20)
+
+        assert self.published == [(5.5, ["coinbase"]), (5.505, ["binance-usdtbrl", "coinbase"]), (5.5, ["coinbase"])]
+        assert self.aggregator.get_stats()["binance-usdtbrl"]["rejections"] == 1
+
+    def test_stale_rate_is_not_published_after_newer_one(self):
+        self.aggregator.publish(2, 5.51, ["coinbase"])
+        self.aggregator.publish(1, 5.50, ["coinbase"])
+
+        assert self.published == [(5.51, ["coinbase"])]
+
+    def test_spot_adapter_reports_ping_latency(self):
+        adapter = BinanceSpotFxAdapter(logger, host="ws://127.0.0.1:0")
+        adapter.on_quote = self.aggregator.on_quote
+        adapter.latency = 0.02
+
+        adapter.handle_message(book_ticker("USDTBRL", 5.49, 5.51))
+
+        assert self.aggregator.get_stats()["binance-usdtbrl"]["avg_latency_ms"] == 20.0
+
+    def test_dollar_collector_publishes_off_the_quote_thread(self):
+        redis_adapter = RedisAdapter(logger, redis_db=LocalRedis())
+        collector = DollarCollector(logger, redis_adapter, dollar_adapter=None)
+
+        collector.aggregator.on_quote("binance-usdtbrl", 5.5)
+        assert redis_adapter.get_key("USD:BRL") is None
+
+        threading.Thread(target=collector.run_publisher, daemon=True).start()
+        collector.rates.join()
+        assert float(redis_adapter.get_key("USD:BRL")) == 5.5
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from src.application.data_collectors.inav_conflator import InavConflator
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+class TestInavConflator:
+    def setup_method(self):
+        self.flushed = []
+        self.conflator = InavConflator(
+            logger=logger,
+            on_flush=lambda *flush: self.flushed.append(flush),
+            flush_interval=60,
+            deadband=0.5
+        )
+
+    def offer(self, inav: float):
+        self.conflator.offer("inav-BITH11-binance", inav, {"symbol": "BITH11", "inav": inav})
+
+    def test_first_value_is_flushed_immediately(self):
+        self.offer(50.0)
+        assert self.flushed == [("inav-BITH11-binance", {"symbol": "BITH11", "inav": 50.0}, 0)]
+
+    def test_small_moves_are_coalesced_until_flush(self):
+        self.offer(50.0)
+        for inav in (50.1, 50.2, 50.3):
+            self.offer(inav)
+        assert len(self.flushed) == 1
+
+        self.conflator.flush()
+        assert self.flushed[-1] == ("inav-BITH11-binance", {"symbol": "BITH11", "inav": 50.3}, 2)
+        assert self.conflator.get_stats()["coalesced_updates"] == 2
+
+    def test_move_beyond_deadband_flushes_immediately(self):
+        self.offer(50.0)
+        self.offer(50.1)
+        self.offer(50.7)
+        assert [flush[1]["inav"] for flush in self.flushed] == [50.0, 50.7]
+        assert self.flushed[-1][2] == 1
+
+    def test_value_back_to_last_flushed_is_not_republished(self):
+        self.offer(50.0)
+        self.offer(50.1)
+        self.offer(50.0)
+        self.conflator.flush()
+        assert len(self.flushed) == 1
+
+
+    def test_concurrent_flushes_keep_key_order(self):
+        first_flush_started = threading.Event()
+        release_first_flush = threading.Event()
+
+        def slow_first_flush(*flush):
+            if not first_flush_started.is_set():
+                first_flush_started.set()
+                release_first_flush.wait(timeout=5)
+            self.flushed.append(flush)
+
+        self.conflator.on_flush = slow_first_flush
+        flusher = threading.Thread(target=self.offer, args=(50.0, ))
+        flusher.start()
+        first_flush_started.wait(timeout=5)
+
+        publisher = threading.Thread(target=self.offer, args=(51.0, ))
+        publisher.start()
+        time.sleep(0.05)
+        release_first_flush.set()
+        flusher.join()
+        publisher.join()
+
+        assert [flush[1]["inav"] for flush in self.flushed] == [50.0, 51.0]
\ No newline at end of file
@@ -0,0 +1,95 @@
+import pytest
+
+from src.application.data_collectors import MdDataCollector, InavConflator
+from src.application.replay import StaticInavAdapter
+from src.infrastructure.adapters.crypto.binance.binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+from src.infrastructure.adapters.crypto.binance.binance_coinm_stream_engine import BinanceCoinMStreamEngine
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.metrics import LatencyTracker
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis, HandoffQueue, OverflowPolicy
+
+
+
+logger = LoggerAdapter().get_logger()
+
+ETF_BASKETS = {
+    "BITH11": {"offshore": "HBTC.BH", "underlyings": {"BTC": "BTCUSD_PERP"}},
+    "HASH11": {"offshore": "HDEX.BH", "underlyings": {"BTC": "BTCUSD_PERP", "ETH": "ETHUSD_PERP"}},
+    "BAD11": {"offshore": "HBAD.BH", "underlyings": {"BTC": "BTCUSD_PERP", "XRP": "XRPUSD_PERP"}}
+}
+
+
+class TestMdDataCollector:
+    def setup_method(self):
+        local_redis = LocalRedis()
+        local_redis.set("USD:BRL", 5.0)
+        self.published = []
+        self.pcf_source = StaticInavAdapter(
+            {"BITH11": 0.0002, "HASH11": 0.0001, "BAD11": 0.0001},
+            baskets={"HASH11": {"BTC": 0.0001, "ETH": 0.002}, "BAD11": {"BTC": 0.0001, "DOGE": 1.0}}
+        )
+        self.collector = MdDataCollector(
+            logger=logger,
+            websocket_adapter=BinanceCoinMWebsocketAdapter(logger, streams=[], host=""),
+            inav_adapter=self.pcf_source,
+            message_broker=RedisAdapter(logger, redis_db=local_redis),
+            retry_time=0,
+            latency_tracker=LatencyTracker(logger, "md-test", enabled=False),
+            etf_baskets=ETF_BASKETS
+        )
+        self.collector.inav_conflator = InavConflator(
+            logger, lambda channel, message_data, coalesced: self.published.append(message_data), flush_interval=0
+        )
+        self.collector.fx_cache.warm_up()
+        self.collector.pcf_cache.refresh_all()
+
+    def get_inavs(self) -> dict:
+        return {message["symbol"]: message["inav"] for message in self.published}
+
+    def test_multi_asset_etf_is_priced_from_its_pcf_basket(self):
+        self.collector.publish_data("binance", "BTCUSD_PERP", 60000.0)
+        assert self.get_inavs() == {"BITH11": 60.0}
+
+        self.collector.publish_data("binance", "ETHUSD_PERP", 3000.0)
+        assert self.get_inavs()["HASH11"] == pytest.approx((6 + 6) * 5.0)
+        assert self.published[-1]["basket"] == {"BTCUSD_PERP": 0.0001, "ETHUSD_PERP": 0.002}
+
+    def test_basket_that_fails_to_load_does_not_block_the_others(self):
+        self.collector.publish_data("binance", "BTCUSD_PERP", 60000.0)
+        self.collector.publish_data("binance", "ETHUSD_PERP", 3000.0)
+
+        assert set(self.get_inavs()) == {"BITH11", "HASH11"}
+        assert self.collector.basket_generation == self.collector.pcf_cache.generation
+
+    def test_basket_change_reloads_weights(self):
+        self.collector.publish_data("binance", "BTCUSD_PERP", 60000.0)
+        self.pcf_source.quantities["BITH11"] = 0.0003
+        self.collector.pcf_cache.refresh_all()
+
+        self.collector.publish_data("binance", "BTCUSD_PERP", 60000.0)
+
+        assert self.get_inavs()["BITH11"] == pytest.approx(90.0)
+
+    def test_tick_counter_child_is_reused(self):
+        ticks_before = self.collector.ticks_total.get_value("binance", "BTCUSD_PERP")
+        self.collector.publish_data("binance", "BTCUSD_PERP", 60000.0)
+        tick_counter = self.collector.tick_counters[("binance", "BTCUSD_PERP")]
+        self.collector.publish_data("binance", "BTCUSD_PERP", 60100.0)
+
+        assert self.collector.tick_counters[("binance", "BTCUSD_PERP")] is tick_counter
+        assert self.collector.ticks_total.get_value("binance", "BTCUSD_PERP") == ticks_before + 2
+
+    def test_block_policy_is_rejected_with_stream_engine(self):
+        websocket_adapter = BinanceCoinMWebsocketAdapter(logger, streams=["btcusd_perp@ticker"], host="")
+        with pytest.raises(ValueError):
+            MdDataCollector(
+                logger=logger,
+                websocket_adapter=websocket_adapter,
+                inav_adapter=self.pcf_source,
+                message_broker=self.collector.message_broker,
+                retry_time=0,
+                stream_engine=BinanceCoinMStreamEngine(logger, websocket_adapter),
+                handoff_queue=HandoffQueue(logger, "md-test", overflow_policy=OverflowPolicy.BLOCK),
+                latency_tracker=LatencyTracker(logger, "md-test", enabled=False),
+                etf_baskets=ETF_BASKETS
+            )
@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+
+from src.application.data_collectors.poll_scheduler import AdaptivePollScheduler
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+# Wednesday 15:00 UTC is 12:00 in Sao Paulo, Sunday is always closed.
+MARKET_HOURS = datetime(2025, 7, 23, 15, 0, tzinfo=timezone.utc)
+WEEKEND = datetime(2025, 7, 27, 15, 0, tzinfo=timezone.utc)
+
+
+class TestAdaptivePollScheduler:
+    def setup_method(self):
+        self.scheduler = AdaptivePollScheduler(
+            logger,
+            market_interval=1,
+            off_hours_interval=30,
+            volatile_interval=0.25,
+            volatility_threshold=0.01,
+            volatile_polls=2,
+            max_backoff=8
+        )
+
+    def test_market_hours_interval(self):
+        assert self.scheduler.next_interval("BITH11", MARKET_HOURS) == 1
+        assert self.scheduler.next_interval("BITH11", WEEKEND) == 30
+
+    def test_volatility_speeds_up_polling(self):
+        self.scheduler.record_success("BITH11", 100.0, 0.01)
+        self.scheduler.record_success("BITH11", 102.0, 0.01)
+
+        intervals = [self.scheduler.next_interval("BITH11", MARKET_HOURS) for _ in range(3)]
+        assert intervals == [0.25, 0.25, 1]
+
+    def test_errors_back_off(self):
+        intervals = []
+        for _ in range(4):
+            self.scheduler.record_error("BITH11", 0.5)
+            intervals.append(self.scheduler.next_interval("BITH11", MARKET_HOURS))
+        assert intervals == [2, 4, 8, 8]
+
+        self.scheduler.record_success("BITH11", 100.0, 0.01)
+        assert self.scheduler.next_interval("BITH11", MARKET_HOURS) == 1
+
+    def test_stats_per_asset(self):
+        self.scheduler.record_success("BITH11", 100.0, 0.01)
+        self.scheduler.record_error("BITH11", 0.03)
+        self.scheduler.record_success("ETHE11", 50.0, 0.02)
+
+        stats = self.scheduler.get_stats()
+        assert stats["BITH11"]["requests"] == 2
+        assert stats["BITH11"]["errors"] == 1
+        assert stats["BITH11"]["avg_latency_ms"] == 20.0
+        assert stats["ETHE11"]["max_latency_ms"] == 20.0
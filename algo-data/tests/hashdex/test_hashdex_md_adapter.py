@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from src.infrastructure import HashdexMDAdapter
@@ -30,3 +32,12 @@ class TestHashdexMDAdapter:
             onshore_ticker, offshore_ticker
         )
         assert isinstance(quantity, float)
+
+    def test_each_thread_gets_its_own_session(self):
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(self.hashdex_md_adapter.get_session()))
+        thread.start()
+        thread.join()
+
+        assert self.hashdex_md_adapter.get_session() is self.hashdex_md_adapter.get_session()
+        assert sessions[0] is not self.hashdex_md_adapter.get_session()
@@ -0,0 +1 @@
+from .test_async_http_client import TestAsyncHttpClient
\ No newline at end of file
@@ -0,0 +1,41 @@
+import asyncio
+
+from aiohttp import web
+
+from src.infrastructure.adapters.http.async_http_client import AsyncHttpClient
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+
+class TestAsyncHttpClient:
+    def test_requests_reuse_pooled_connections(self):
+        peers = set()
+
+        async def handler(request: web.Request):
+            peers.add(request.transport.get_extra_info("peername"))
+            return web.json_response({"inavPerShare": 50.1})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/inav/{ticker}", handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+
+            client = AsyncHttpClient(logger, f"http://127.0.0.1:{port}", pool_size=2, timeout=5)
+            try:
+                responses = [await client.get("/inav/BITH11") for _ in range(5)]
+            finally:
+                await client.close()
+                await runner.cleanup()
+            return responses
+
+        responses = asyncio.run(run())
+
+        assert all(status == 200 for status, _ in responses)
+        assert len(peers) == 1
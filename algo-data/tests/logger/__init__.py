@@ -0,0 +1 @@
+from .test_logger_adapter import TestLoggerAdapter
\ No newline at end of file
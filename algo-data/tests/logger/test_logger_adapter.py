@@ -0,0 +1,88 @@
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+
+from src.infrastructure.adapters.logger_adapter import (
+    CallSiteRateLimitFilter,
+    DeferredQueueHandler,
+    JsonLinesFormatter,
+    LoggerAdapter
+)
+
+
+
+logger = LoggerAdapter().get_logger()
+
+def make_record(created: float, lineno: int = 10, level: int = logging.INFO) -> logging.LogRecord:
+    record = logging.LogRecord("test", level, "hot_path.py", lineno, "tick %s %s", ("BITH11", {"price": 1.0}), None)
+    record.created = created
+    return record
+
+
+class TestLoggerAdapter:
+    def test_rate_limit_samples_per_call_site(self):
+        rate_filter = CallSiteRateLimitFilter(rate_limit=2, sample_every=3)
+        passed = [rate_filter.filter(make_record(100.0 + index * 0.01)) for index in range(9)]
+
+        assert passed == [True, True, False, False, True, False, False, True, False]
+        assert rate_filter.filter(make_record(100.5, lineno=11))
+
+        next_window = make_record(101.5)
+        assert rate_filter.filter(next_window)
+        assert next_window.suppressed == 1
+
+    def test_warnings_are_never_suppressed(self):
+        rate_filter = CallSiteRateLimitFilter(rate_limit=0, sample_every=0)
+        assert not rate_filter.filter(make_record(100.0))
+        assert rate_filter.filter(make_record(100.0, level=logging.WARNING))
+
+    def test_queue_handler_defers_formatting(self):
+        record_queue = queue.Queue()
+        handler = DeferredQueueHandler(record_queue)
+        handler.handle(make_record(100.0))
+
+        record = record_queue.get_nowait()
+        assert record.msg == "tick %s %s"
+        assert record.args == ("BITH11", {"price": 1.0})
+
+    def test_json_lines_formatter(self):
+        entry = json.loads(JsonLinesFormatter().format(make_record(100.0)))
+        assert entry["message"] == "tick BITH11 {'price': 1.0}"
+        assert entry["level"] == "INFO"
+        assert entry["line"] == 10
+
+    def test_logger_goes_through_queue(self):
+        assert isinstance(logger.handlers[0], DeferredQueueHandler)
+        logger.info("queued %s", "record")
+        LoggerAdapter.flush()
+        assert LoggerAdapter.listener.queue.empty()
+
+    def test_stop_with_full_queue_drains_and_joins(self):
+        handled = []
+        release = threading.Event()
+
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                if threading.current_thread() is listener._thread:
+                    release.wait()
+                handled.append(record.lineno)
+
+        listener = logging.handlers.QueueListener(queue.Queue(2), SlowHandler())
+        listener.start()
+        listener.queue.put(make_record(100.0, lineno=1))
+        while not listener.queue.empty():
+            pass
+        listener.queue.put(make_record(100.0, lineno=2))
+        listener.queue.put(make_record(100.0, lineno=3))
+
+        previous, LoggerAdapter.listener = LoggerAdapter.listener, listener
+        try:
+            threading.Timer(0.2, release.set).start()
+            LoggerAdapter.stop(timeout=0.05)
+        finally:
+            LoggerAdapter.listener = previous
+
+        assert listener._thread is None
+        assert sorted(handled) == [1, 2, 3]
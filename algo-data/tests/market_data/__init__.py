@@ -0,0 +1 @@
+from .test_basket_inav_engine import TestBasketInavEngine
\ No newline at end of file
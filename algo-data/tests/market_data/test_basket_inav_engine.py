@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+from src.domain.market_data.basket_inav_engine import BasketInavEngine
+
+
+
+class TestBasketInavEngine:
+    def setup_method(self):
+        self.engine = BasketInavEngine(
+            etfs=["BITH11", "ETHE11", "HASH11"],
+            underlyings=["BTCUSD_PERP", "ETHUSD_PERP", "SOLUSD_PERP"]
+        )
+        self.engine.set_weights("BITH11", {"BTCUSD_PERP": 0.0002})
+        self.engine.set_weights("ETHE11", {"ETHUSD_PERP": 0.004})
+        self.engine.set_weights("HASH11", {"BTCUSD_PERP": 0.0001, "ETHUSD_PERP": 0.001, "SOLUSD_PERP": 0.01}, cash=0.5)
+
+    def test_tick_only_touches_etfs_holding_the_underlying(self):
+        rows = self.engine.update_price("ETHUSD_PERP", 3000.0)
+        assert sorted(self.engine.etfs[row] for row in rows) == ["ETHE11", "HASH11"]
+        assert self.engine.get_inav("ETHE11") == pytest.approx(12.0)
+        assert math.isnan(self.engine.get_inav("BITH11"))
+
+    def test_basket_waits_for_every_underlying(self):
+        self.engine.update_price("BTCUSD_PERP", 60000.0)
+        self.engine.update_price("ETHUSD_PERP", 3000.0)
+        assert math.isnan(self.engine.get_inav("HASH11"))
+
+        self.engine.update_price("SOLUSD_PERP", 150.0)
+        assert self.engine.get_inav("HASH11") == pytest.approx(6.0 + 3.0 + 1.5 + 0.5)
+
+    def test_incremental_updates_match_full_recompute(self):
+        for price in (60000.0, 61000.0, 59500.5, 60250.25):
+            self.engine.update_price("BTCUSD_PERP", price)
+            self.engine.update_price("ETHUSD_PERP", price / 20)
+            self.engine.update_price("SOLUSD_PERP", price / 400)
+
+        incremental = self.engine.inavs.copy()
+        self.engine.recompute()
+        assert incremental == pytest.approx(self.engine.inavs)
+
+    def test_set_weights_replaces_basket(self):
+        self.engine.update_price("BTCUSD_PERP", 60000.0)
+        self.engine.set_weights("BITH11", {"BTCUSD_PERP": 0.0003})
+
+        assert self.engine.get_weights("BITH11") == {"BTCUSD_PERP": 0.0003}
+        assert self.engine.get_inav("BITH11") == pytest.approx(18.0)
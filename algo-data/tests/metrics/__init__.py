@@ -0,0 +1,2 @@
+from .test_latency_histogram import TestLatencyHistogram, TestLatencyTracker
+from .test_metrics_registry import TestMetricsRegistry, TestMetricsServer
\ No newline at end of file
@@ -0,0 +1,111 @@
+import json
+import random
+import time
+
+from src.application.data_collectors import MdDataCollector, InavConflator
+from src.application.replay import StaticInavAdapter
+from src.infrastructure.adapters.crypto.binance.binance_futures_md_adapter import BinanceCoinMWebsocketAdapter
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.metrics import LatencyHistogram, LatencyTracker
+from src.infrastructure.adapters.metrics.latency_histogram import get_bucket_index, get_bucket_value
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis, ContentType
+
+
+logger = LoggerAdapter().get_logger()
+
+
+class TestLatencyHistogram:
+    def test_buckets_are_contiguous_and_precise(self):
+        previous = get_bucket_index(0)
+        for value in range(1, 200_000):
+            index = get_bucket_index(value)
+            assert index - previous in (0, 1)
+            assert abs(get_bucket_value(index) - value) <= max(1, value / 64)
+            previous = index
+
+    def test_percentiles_match_exact_values(self):
+        rng = random.Random(3)
+        values = sorted(rng.lognormvariate(5, 1) for _ in range(20_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for fraction in (0.5, 0.9, 0.99, 0.999):
+            exact = values[round(fraction * len(values)) - 1]
+            assert abs(histogram.get_percentile(fraction) - exact) <= exact / 32 + 1
+
+    def test_out_of_range_values_are_clamped(self):
+        histogram = LatencyHistogram(max_value=1000)
+        histogram.record(-5)
+        histogram.record(10_000)
+
+        stats = histogram.get_stats()
+        assert (stats["min_us"], stats["max_us"], stats["negative"]) == (0, 1000, 1)
+
+    def test_merge_and_reset(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(10)
+        second.record(1000)
+
+        first.merge(second)
+        assert first.get_stats()["count"] == 2
+        assert first.get_percentile(1.0) == 1000
+
+        first.reset()
+        assert first.get_stats()["count"] == 0
+        assert first.get_percentile(0.5) is None
+
+
+class TestLatencyTracker:
+    def build_collector(self, local_redis: LocalRedis) -> MdDataCollector:
+        local_redis.set("USD:BRL", 5.0)
+        message_broker = RedisAdapter(logger, redis_db=local_redis)
+        message_broker.inav_content_type = ContentType.INAV_STRUCT
+        collector = MdDataCollector(
+            logger=logger,
+            websocket_adapter=BinanceCoinMWebsocketAdapter(logger, streams=[], host=""),
+            inav_adapter=StaticInavAdapter({"BITH11": 0.0002}),
+            message_broker=message_broker,
+            retry_time=0,
+            latency_tracker=LatencyTracker(logger, "md-test", store=message_broker, enabled=True)
+        )
+        collector.inav_conflator = InavConflator(logger, collector.dispatch_inav, flush_interval=0)
+        collector.fx_cache.warm_up()
+        collector.pcf_cache.refresh_all()
+        return collector
+
+    def test_timestamps_travel_with_the_inav(self):
+        local_redis = LocalRedis()
+        collector = self.build_collector(local_redis)
+        subscriber = RedisAdapter(logger, redis_db=local_redis)
+        subscriber.subscribe("inav-BITH11-binance", lambda data: None)
+        frame = json.dumps({"stream": "btcusd_perp@ticker", "data": {"E": 1700000000000, "s": "BTCUSD_PERP", "p": "60000.0"}})
+
+        collector.websocket_adapter.on_event = collector.publish_data
+        collector.websocket_adapter.on_message(None, frame)
+
+        message = subscriber.codec.decode(subscriber.pubsub.get_message(timeout=1)["data"])
+        timestamps = message["ts"]
+        assert timestamps["exchange"] == 1700000000.0
+        assert timestamps["exchange"] < timestamps["received"] <= timestamps["published"] <= time.time()
+        stats = collector.latency_tracker.get_stats()
+        assert {"exchange_to_receive", "receive_to_dequeue", "receive_to_publish"} <= set(stats)
+
+        collector.latency_tracker.report()
+        assert json.loads(local_redis.get("latency:md-test"))["receive_to_publish"]["count"] == 1
+
+    def test_reported_stats_expire(self):
+        local_redis = LocalRedis()
+        tracker = LatencyTracker(logger, "spread-test", store=RedisAdapter(logger, redis_db=local_redis), enabled=True, ttl=120)
+        tracker.record("stage", 1.0, 1.001)
+        tracker.report()
+
+        assert 0 < local_redis.ttl("latency:spread-test") <= 120
+        local_redis.expires_at["latency:spread-test"] = time.monotonic()
+        assert local_redis.get("latency:spread-test") is None
+
+    def test_disabled_tracker_leaves_payload_alone(self):
+        tracker = LatencyTracker(logger, "off", enabled=False)
+        tracker.record("stage", 1.0, 2.0)
+
+        assert tracker.get_stats() == {}
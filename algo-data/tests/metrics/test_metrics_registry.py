@@ -0,0 +1,126 @@
+import os
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.application.data_collectors import FxAggregator
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.metrics import LatencyTracker, MetricsRegistry, MetricsServer
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis
+
+
+logger = LoggerAdapter().get_logger()
+
+
+class TestMetricsRegistry:
+    def test_renders_counters_and_gauges(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("orders_total", "Orders sent", ("exchange", ))
+        counter.labels("binance").inc()
+        counter.labels("binance").inc(2)
+        counter.labels("flowa").inc()
+        registry.gauge("queue_depth", "Queued ticks").set(4.5)
+
+        lines = registry.render().splitlines()
+
+        assert lines[:2] == ["# HELP orders_total Orders sent", "# TYPE orders_total counter"]
+        assert 'orders_total{exchange="binance"} 3' in lines
+        assert 'orders_total{exchange="flowa"} 1' in lines
+        assert "# TYPE queue_depth gauge" in lines
+        assert "queue_depth 4.5" in lines
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("request_seconds", "Requests", ("operation", ), buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.labels("send").observe(value)
+
+        lines = registry.render().splitlines()
+
+        assert 'request_seconds_bucket{operation="send",le="0.1"} 2' in lines
+        assert 'request_seconds_bucket{operation="send",le="1"} 3' in lines
+        assert 'request_seconds_bucket{operation="send",le="+Inf"} 4' in lines
+        assert 'request_seconds_sum{operation="send"} 2.65' in lines
+        assert 'request_seconds_count{operation="send"} 4' in lines
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("events_total", "Events", ("channel", )).labels('a"b\\c\nd').inc()
+        assert 'events_total{channel="a\\"b\\\\c\\nd"} 1' in registry.render().splitlines()
+
+    def test_series_past_the_limit_share_the_overflow_series(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("ticks_total", "Ticks", ("asset", ), max_series=3)
+        for asset in ("BTC", "ETH", "SOL", "ADA"):
+            counter.labels(asset).inc()
+
+        lines = registry.render().splitlines()
+
+        assert 'ticks_total{asset="BTC"} 1' in lines
+        assert 'ticks_total{asset="ETH"} 1' in lines
+        assert 'ticks_total{asset="other"} 2' in lines
+
+    def test_register_returns_existing_metric(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("ticks_total", "Ticks", ("asset", ))
+        assert registry.counter("ticks_total", "Ticks", ("asset", )) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("ticks_total", "Ticks", ("asset", ))
+        with pytest.raises(ValueError):
+            counter.labels("BTC", "extra")
+
+    def test_latency_trackers_are_exported_as_summaries(self):
+        tracker = LatencyTracker(logger, "test-export", enabled=True)
+        for value in (0.001, 0.002, 0.003):
+            tracker.record("stage", 0, value)
+
+        lines = MetricsRegistry.get_default().render().splitlines()
+
+        assert "# TYPE latency_stage_microseconds summary" in lines
+        assert 'latency_stage_microseconds_count{tracker="test-export",stage="stage"} 3' in lines
+        assert any(line.startswith('latency_stage_microseconds{tracker="test-export",stage="stage",quantile="0.5"}') for line in lines)
+
+    def test_default_registry_is_reset_in_forked_children(self):
+        MetricsRegistry.get_default().counter("parent_total", "Parent only").inc()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, MetricsRegistry.get_default().render().encode())
+            os._exit(0)
+        os.close(write_fd)
+        rendered = os.read(read_fd, 65536).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert "parent_total" not in rendered
+
+    def test_adapters_count_messages(self):
+        registry = MetricsRegistry.get_default()
+        redis_adapter = RedisAdapter(logger, redis_db=LocalRedis())
+        aggregator = FxAggregator(logger, lambda rate, sources: None)
+        published = registry.counter("redis_published_messages_total", "Messages published", ("channel", ))
+        quotes = registry.counter("fx_quotes_total", "FX quotes received", ("source", ))
+        published_before = published.get_value("fx-test")
+        quotes_before = quotes.get_value("test")
+
+        redis_adapter.publish_message("fx-test", {"price": 5.0})
+        aggregator.on_quote("test", 5.0)
+
+        assert published.get_value("fx-test") == published_before + 1
+        assert quotes.get_value("test") == quotes_before + 1
+
+class TestMetricsServer:
+    def test_serves_metrics(self):
+        registry = MetricsRegistry()
+        registry.counter("served_total", "Served").inc()
+        server = MetricsServer(logger, 0, registry, host="127.0.0.1")
+        server.start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert "served_total 1" in response.read().decode().splitlines()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://127.0.0.1:{server.port}/other", timeout=5)
+        finally:
+            server.stop()
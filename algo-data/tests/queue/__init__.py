@@ -0,0 +1,5 @@
+from .test_handoff_queue import TestHandoffQueue
+from .test_redis_stream_writer import TestRedisStreamWriter
+from .test_redis_adapter_batch import TestRedisAdapterBatch
+from .test_codecs import TestMessageCodec
+from .test_redis_connection_manager import TestRedisConnectionManager
\ No newline at end of file
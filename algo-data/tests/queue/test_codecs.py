@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis, MessageCodec, ContentType, CodecError
+from src.infrastructure.adapters.queue.codecs import FRAME_HEADER, FRAME_MAGIC
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+logger = LoggerAdapter().get_logger()
+
+INAV_TICK = {"symbol": "BITH11", "inav": 50.12, "amount_of_underlying_asset": 0.0001}
+
+
+class TestMessageCodec:
+    def setup_method(self):
+        self.codec = MessageCodec()
+
+    def test_legacy_json_is_untagged(self):
+        payload = self.codec.encode(INAV_TICK)
+
+        assert json.loads(payload) == INAV_TICK
+        assert self.codec.decode(payload.encode()) == INAV_TICK
+
+    @pytest.mark.parametrize("content_type", [ContentType.JSON, ContentType.MSGPACK, ContentType.INAV_STRUCT])
+    def test_round_trip(self, content_type):
+        payload = self.codec.encode(INAV_TICK, content_type)
+
+        assert payload[0] == FRAME_MAGIC
+        assert self.codec.decode(payload) == INAV_TICK
+
+    def test_struct_layout_is_fixed_size(self):
+        payload = self.codec.encode(INAV_TICK, ContentType.INAV_STRUCT)
+
+        assert len(payload) == FRAME_HEADER.size + 28
+
+    def test_struct_carries_latency_timestamps(self):
+        message = dict(INAV_TICK, ts={"exchange": 1700000000.0, "received": 1700000000.01})
+        payload = self.codec.encode(message, ContentType.INAV_STRUCT)
+
+        assert (payload[1], payload[2]) == (self.codec.inav_codec.codec_id, 2)
+        assert self.codec.decode(payload) == message
+
+    def test_struct_falls_back_to_msgpack_for_other_messages(self):
+        message = dict(INAV_TICK, basket={"BTC": 0.0001})
+        payload = self.codec.encode(message, ContentType.INAV_STRUCT)
+
+        assert payload[1] == self.codec.msgpack_codec.codec_id
+        assert self.codec.decode(payload) == message
+
+    def test_rejects_newer_versions(self):
+        payload = bytearray(self.codec.encode(INAV_TICK, ContentType.MSGPACK))
+        payload[2] = 9
+
+        with pytest.raises(CodecError):
+            self.codec.decode(bytes(payload))
+
+    def test_subscriber_decodes_publisher_content_type(self):
+        local_redis = LocalRedis()
+        publisher = RedisAdapter(logger, redis_db=local_redis)
+        publisher.inav_content_type = ContentType.INAV_STRUCT
+        subscriber = RedisAdapter(logger, redis_db=local_redis)
+        subscriber.subscribe("inav-BITH11", lambda data: None)
+        subscriber.subscribe("fx-USDBRL", lambda data: None)
+
+        publisher.publish_message("inav-BITH11", INAV_TICK)
+        publisher.publish_message("fx-USDBRL", {"rate": 5.43})
+
+        messages = [subscriber.pubsub.get_message(timeout=1) for _ in range(2)]
+        decoded = {message["channel"].decode(): subscriber.codec.decode(message["data"]) for message in messages}
+        assert messages[0]["data"][0] == FRAME_MAGIC
+        assert decoded == {"inav-BITH11": INAV_TICK, "fx-USDBRL": {"rate": 5.43}}
@@ -0,0 +1,58 @@
+import threading
+
+from src.infrastructure.adapters.queue.handoff_queue import HandoffQueue, OverflowPolicy
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+class TestHandoffQueue:
+    def make_queue(self, overflow_policy: OverflowPolicy, maxsize: int = 2) -> HandoffQueue:
+        return HandoffQueue(logger, "test", maxsize=maxsize, overflow_policy=overflow_policy)
+
+    def test_get_returns_none_on_timeout(self):
+        queue = self.make_queue(OverflowPolicy.BLOCK)
+        assert queue.get(timeout=0.01) is None
+
+    def test_drop_oldest_evicts_first_item(self):
+        queue = self.make_queue(OverflowPolicy.DROP_OLDEST)
+        for price in (1, 2, 3):
+            queue.put("BTCUSD_PERP", price)
+
+        assert [queue.get(), queue.get()] == [2, 3]
+        assert queue.get_stats()["dropped"] == 1
+
+    def test_conflate_keeps_latest_per_key(self):
+        queue = self.make_queue(OverflowPolicy.CONFLATE)
+        queue.put("BTCUSD_PERP", 1)
+        queue.put("ETHUSD_PERP", 10)
+        queue.put("BTCUSD_PERP", 2)
+
+        assert [queue.get(), queue.get()] == [2, 10]
+        stats = queue.get_stats()
+        assert stats["conflated"] == 1
+        assert stats["dropped"] == 0
+
+    def test_conflate_drops_oldest_key_when_full(self):
+        queue = self.make_queue(OverflowPolicy.CONFLATE)
+        for key in ("A", "B", "C"):
+            queue.put(key, key)
+
+        assert [queue.get(), queue.get()] == ["B", "C"]
+        assert queue.get_stats()["dropped"] == 1
+
+    def test_block_waits_for_consumer(self):
+        queue = self.make_queue(OverflowPolicy.BLOCK, maxsize=1)
+        queue.put("A", 1)
+
+        producer = threading.Thread(target=queue.put, args=("A", 2))
+        producer.start()
+        producer.join(timeout=0.05)
+        assert producer.is_alive()
+
+        assert queue.get() == 1
+        producer.join(timeout=1)
+        assert not producer.is_alive()
+        assert queue.get() == 2
+        assert queue.get_stats()["dropped"] == 0
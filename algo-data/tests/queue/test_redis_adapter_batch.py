@@ -0,0 +1,90 @@
+import json
+import time
+
+import pytest
+import redis
+
+from src.infrastructure.adapters.queue import RedisAdapter, LocalRedis, RedisBatchError
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+def broken_command(*args, **kwargs):
+    raise redis.ConnectionError("Connection reset by peer")
+
+
+class TestRedisAdapterBatch:
+    def setup_method(self):
+        self.local_redis = LocalRedis()
+        self.redis_adapter = RedisAdapter(logger, redis_db=self.local_redis)
+
+    def test_batch_sends_one_pipeline(self):
+        with self.redis_adapter.batch():
+            self.redis_adapter.set_key("inav:BITH11", json.dumps({"inav": 50.1}))
+            self.redis_adapter.publish_message("inav-BITH11", {"inav": 50.1})
+            self.redis_adapter.insert_to_queue({"id": 1}, "orders")
+            assert self.local_redis.get("inav:BITH11") is None
+
+        assert self.local_redis.pipelines_executed == 1
+        assert self.redis_adapter.get_key("inav:BITH11") == {"inav": 50.1}
+        assert self.local_redis.published["inav-BITH11"] == 1
+        assert len(self.local_redis.lists["orders"]) == 1
+
+    def test_nested_batches_join_the_outer_one(self):
+        with self.redis_adapter.batch():
+            self.redis_adapter.set_key("a", 1)
+            with self.redis_adapter.batch():
+                self.redis_adapter.set_key("b", 2)
+
+        assert self.local_redis.pipelines_executed == 1
+        assert self.local_redis.get("b") == b"2"
+
+    def test_failed_block_discards_writes(self):
+        with pytest.raises(RuntimeError):
+            with self.redis_adapter.batch():
+                self.redis_adapter.set_key("a", 1)
+                raise RuntimeError("boom")
+
+        self.redis_adapter.set_key("b", 2)
+        assert self.local_redis.get("a") is None
+        assert self.local_redis.get("b") == b"2"
+
+    def test_auto_batch_window_groups_writes(self):
+        self.redis_adapter.auto_batch_window = 0.02
+        self.redis_adapter.start_auto_flusher()
+        for index in range(10):
+            self.redis_adapter.publish_message("fx-USD:BRL", {"price": index})
+
+        deadline = time.monotonic() + 2
+        while self.local_redis.published["fx-USD:BRL"] < 10 and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        assert self.local_redis.published["fx-USD:BRL"] == 10
+        assert self.local_redis.pipelines_executed == 1
+
+    def test_failed_batch_raises_on_exit(self):
+        self.local_redis.set = broken_command
+        with pytest.raises(redis.ConnectionError):
+            with self.redis_adapter.batch():
+                self.redis_adapter.set_key("a", 1)
+
+        assert self.redis_adapter.batch_errors == 1
+
+    def test_failed_auto_batch_is_raised_to_next_write(self):
+        self.redis_adapter.auto_batch_window = 0.02
+        self.local_redis.publish = broken_command
+        self.redis_adapter.publish_message("fx-USD:BRL", {"price": 5.5})
+        self.redis_adapter.flush_pending()
+
+        with pytest.raises(RedisBatchError):
+            self.redis_adapter.publish_message("fx-USD:BRL", {"price": 5.6})
+        assert self.redis_adapter.auto_batch_error is None
+
+    def test_reads_see_pending_auto_batch_writes(self):
+        self.redis_adapter.auto_batch_window = 60
+        self.redis_adapter.set_key("inav:BITH11", json.dumps({"inav": 50.1}))
+        assert self.local_redis.get("inav:BITH11") is None
+
+        assert self.redis_adapter.get_key("inav:BITH11") == {"inav": 50.1}
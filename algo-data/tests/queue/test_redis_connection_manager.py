@@ -0,0 +1,97 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import redis
+
+from src.infrastructure.adapters.queue import RedisAdapter, RedisConnectionManager, LocalRedis
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+logger = LoggerAdapter().get_logger()
+
+
+class TestRedisConnectionManager:
+    def setup_method(self):
+        RedisConnectionManager.reset_instances()
+        self.manager = RedisConnectionManager(logger, "localhost", 6399, max_connections=4, retries=0)
+        self.manager.client = MagicMock()
+
+    def teardown_method(self):
+        RedisConnectionManager.reset_instances()
+
+    def test_adapters_share_one_client(self, monkeypatch):
+        monkeypatch.setattr(RedisConnectionManager, "check_health", lambda self: True)
+        monkeypatch.setattr(RedisConnectionManager, "start_health_checker", lambda self: None)
+
+        first = RedisAdapter(logger)
+        second = RedisAdapter(logger)
+
+        assert first.connection_manager is second.connection_manager
+        assert first.redis_db is second.redis_db
+
+    def test_injected_manager_is_used(self):
+        adapter = RedisAdapter(logger, connection_manager=self.manager)
+
+        assert adapter.redis_db is self.manager.client
+
+    def test_outage_and_reconnect_are_tracked(self):
+        self.manager.client.ping.side_effect = [True, redis.ConnectionError("refused"), redis.ConnectionError("refused"), True]
+
+        results = [self.manager.check_health() for _ in range(4)]
+
+        assert results == [True, False, False, True]
+        stats = self.manager.get_stats()
+        assert stats["healthy"] is True
+        assert stats["failed_health_checks"] == 2
+        assert stats["reconnects"] == 1
+        assert stats["last_error"] == "refused"
+
+    def test_checks_back_off_while_unhealthy(self):
+        self.manager.client.ping.side_effect = redis.ConnectionError("refused")
+        self.manager.check_health()
+
+        assert self.manager.get_check_delay() < self.manager.health_check_interval
+
+    def test_pool_is_bounded(self):
+        stats = self.manager.get_stats()
+
+        assert stats["max_connections"] == 4
+        assert stats["created_connections"] == 0
+        assert stats["in_use_connections"] == 0
+
+    def test_adapters_multiplex_one_pubsub(self):
+        local_redis = LocalRedis()
+        self.manager.client = local_redis
+        first = RedisAdapter(logger, connection_manager=self.manager)
+        second = RedisAdapter(logger, connection_manager=self.manager)
+        received = []
+        first.subscribe("fx-USD:BRL", lambda data: received.append(("first", data["price"])))
+        second.subscribe("fx-USD:BRL", lambda data: received.append(("second", data["price"])))
+
+        local_redis.publish("fx-USD:BRL", '{"price": 5.5}')
+        deadline = time.monotonic() + 2
+        while len(received) < 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        assert first.pubsub is second.pubsub
+        assert len(local_redis.subscribers["fx-USD:BRL"]) == 1
+        assert sorted(received) == [("first", 5.5), ("second", 5.5)]
+
+        second.unsubscribe("fx-USD:BRL")
+        assert self.manager.get_stats()["subscribed_channels"] == 1
+        first.unsubscribe("fx-USD:BRL")
+        assert self.manager.get_stats()["subscribed_channels"] == 0
+        assert not local_redis.subscribers["fx-USD:BRL"]
+
+    def test_start_listening_returns_once_unsubscribed(self):
+        self.manager.client = LocalRedis()
+        adapter = RedisAdapter(logger, connection_manager=self.manager)
+        adapter.subscribe("order-1", lambda data: None)
+        listener = threading.Thread(target=adapter.start_listening, daemon=True)
+        listener.start()
+
+        adapter.unsubscribe("order-1")
+        listener.join(timeout=2)
+
+        assert not listener.is_alive()
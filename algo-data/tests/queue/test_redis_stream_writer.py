@@ -0,0 +1,160 @@
+import time
+
+import redis
+
+from src.infrastructure.adapters.queue import RedisAdapter, RedisStreamWriter, LocalRedis
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+
+class TestRedisStreamWriter:
+    def setup_method(self):
+        self.local_redis = LocalRedis()
+        self.redis_adapter = RedisAdapter(logger, redis_db=self.local_redis)
+
+    def test_writes_in_pipelined_batches(self):
+        writer = RedisStreamWriter(logger, self.redis_adapter, max_batch=10, flush_interval=60, maxlen=1000)
+        writer.start()
+        for index in range(25):
+            writer.write("Flowa-trade-MTB_1", {"TradeId": index})
+
+        deadline = time.monotonic() + 2
+        while writer.get_stats()["written"] < 20 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        writer.stop()
+
+        stats = writer.get_stats()
+        assert stats["written"] == 25
+        assert stats["max_batch_size"] == 10
+        assert self.local_redis.pipelines_executed == 3
+        assert [fields[b"TradeId"] for _, fields in self.local_redis.streams["Flowa-trade-MTB_1"]] == [str(index).encode() for index in range(25)]
+
+    def test_flushes_after_deadline(self):
+        writer = RedisStreamWriter(logger, self.redis_adapter, max_batch=100, flush_interval=0.02)
+        writer.start()
+        writer.write("Flowa-trade-MTB_1", {"TradeId": 1})
+
+        deadline = time.monotonic() + 2
+        while not writer.get_stats()["written"] and time.monotonic() < deadline:
+            time.sleep(0.005)
+        writer.stop()
+
+        assert writer.get_stats()["batches"] == 1
+
+    def test_trims_streams_by_length(self):
+        writer = RedisStreamWriter(logger, self.redis_adapter, flush_interval=0, maxlen=5)
+        for index in range(20):
+            writer.write("Flowa-trade-MTB_1", {"TradeId": index})
+
+        assert len(self.local_redis.streams["Flowa-trade-MTB_1"]) == 5
+        assert writer.get_trim_args() == {"maxlen": 5, "approximate": True}
+
+    def test_failed_batches_are_retried(self):
+        writer = RedisStreamWriter(logger, self.redis_adapter, flush_interval=0, maxlen=100)
+        pipeline = self.local_redis.pipeline
+
+        def broken_pipeline(*args, **kwargs):
+            raise redis.ConnectionError("Connection refused")
+
+        self.local_redis.pipeline = broken_pipeline
+        writer.write("Flowa-trade-MTB_1", {"TradeId": 1})
+        assert writer.get_stats()["pending"] == 1
+
+        self.local_redis.pipeline = pipeline
+        writer.write("Flowa-trade-MTB_1", {"TradeId": 2})
+        assert writer.get_stats()["written"] == 2
+        assert writer.get_stats()["errors"] == 1
+
+
+    def test_requeue_past_max_pending_drops_the_oldest(self):
+        writer = RedisStreamWriter(logger, self.redis_adapter, max_batch=3, flush_interval=60, max_pending=4)
+        for index in range(3):
+            writer.write("Flowa-trade-MTB_1", {"TradeId": index})
+        with writer._lock:
+            batch = [writer._pending.popleft() for _ in range(3)]
+        for index in range(3, 6):
+            writer.write("Flowa-trade-MTB_1", {"TradeId": index})
+
+        writer.requeue(batch, redis.ConnectionError("Connection refused"))
+
+        assert [fields["TradeId"] for _, fields in writer._pending] == [2, 3, 4, 5]
+        assert writer.get_stats()["dropped"] == 2
+
+    def test_outage_backs_off_and_logs_once(self, monkeypatch):
+        writer = RedisStreamWriter(logger, self.redis_adapter, flush_interval=0, maxlen=100, max_retry_delay=0.4)
+        errors = []
+        monkeypatch.setattr(writer.logger, "error", lambda message, *args: errors.append(message))
+        pipeline = self.local_redis.pipeline
+
+        def broken_pipeline(*args, **kwargs):
+            raise redis.ConnectionError("Connection refused")
+
+        self.local_redis.pipeline = broken_pipeline
+        delays = []
+        for index in range(5):
+            writer.write("Flowa-trade-MTB_1", {"TradeId": index})
+            delays.append(writer.retry_delay)
+
+        assert len(errors) == 1
+        assert delays == [0.05, 0.1, 0.2, 0.4, 0.4]
+
+        self.local_redis.pipeline = pipeline
+        writer.write("Flowa-trade-MTB_1", {"TradeId": 5})
+        assert writer.retry_delay == 0.0
+        assert writer.outage_started_at is None
+
+    def test_rejected_entries_are_dead_lettered(self):
+        writer = RedisStreamWriter(logger, self.redis_adapter, flush_interval=0, maxlen=100)
+        xadd = self.local_redis.xadd
+
+        def strict_xadd(name, fields, **kwargs):
+            if fields["TradeId"] is None:
+                raise redis.DataError("Invalid input of type: 'NoneType'")
+            return xadd(name, fields, **kwargs)
+
+        self.local_redis.xadd = strict_xadd
+        writer.write("Flowa-trade-MTB_1", {"TradeId": None})
+        writer.write("Flowa-trade-MTB_1", {"TradeId": 2})
+
+        stats = writer.get_stats()
+        assert stats["pending"] == 0
+        assert stats["written"] == 1
+        assert stats["dead_lettered"] == 1
+        assert writer.dead_letters[0][:2] == ("Flowa-trade-MTB_1", {"TradeId": None})
+        assert [fields[b"TradeId"] for _, fields in self.local_redis.streams["Flowa-trade-MTB_1"]] == [b"2"]
+
+    def test_unencodable_batch_is_written_entry_by_entry(self):
+        writer = RedisStreamWriter(logger, self.redis_adapter, max_batch=10, flush_interval=60, maxlen=100)
+        pipeline = self.local_redis.pipeline
+        xadd = self.local_redis.xadd
+
+        def packing_pipeline(*args, **kwargs):
+            local_pipeline = pipeline(*args, **kwargs)
+            execute = local_pipeline.execute
+
+            def execute_or_reject(raise_on_error=True):
+                if any(command[1][1]["TradeId"] is None for command in local_pipeline.commands):
+                    local_pipeline.reset()
+                    raise redis.DataError("Invalid input of type: 'NoneType'")
+                return execute(raise_on_error)
+
+            local_pipeline.execute = execute_or_reject
+            return local_pipeline
+
+        def strict_xadd(name, fields, **kwargs):
+            if fields["TradeId"] is None:
+                raise redis.DataError("Invalid input of type: 'NoneType'")
+            return xadd(name, fields, **kwargs)
+
+        self.local_redis.pipeline = packing_pipeline
+        self.local_redis.xadd = strict_xadd
+        for trade_id in (1, None, 3):
+            writer.write("Flowa-trade-MTB_1", {"TradeId": trade_id})
+        writer.flush()
+
+        assert writer.get_stats()["written"] == 2
+        assert writer.get_stats()["dead_lettered"] == 1
+        assert [fields[b"TradeId"] for _, fields in self.local_redis.streams["Flowa-trade-MTB_1"]] == [b"1", b"3"]
\ No newline at end of file
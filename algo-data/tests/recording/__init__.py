@@ -0,0 +1 @@
+from .test_tick_journal import TestTickJournal
\ No newline at end of file
@@ -0,0 +1,45 @@
+from src.infrastructure.adapters.recording.tick_journal import TickJournal, TickJournalReader, FeedId
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+class TestTickJournal:
+    def test_disabled_without_directory(self, monkeypatch):
+        monkeypatch.delenv("TICK_JOURNAL_DIR_DEV", raising=False)
+        journal = TickJournal(logger, "test")
+        journal.record(FeedId.BINANCE_COINM, "ignored")
+        assert not journal.enabled
+        assert journal.records == 0
+
+    def test_records_round_trip(self, tmp_path):
+        journal = TickJournal(logger, "test", directory=str(tmp_path))
+        journal.record(FeedId.BINANCE_COINM, '{"data": {"s": "BTCUSD_PERP", "p": "1"}}')
+        journal.record(FeedId.FLOWA_ORDERS, b"\x81\xa6Status\xa3New")
+        journal.close()
+
+        records = list(TickJournalReader.from_directory(str(tmp_path)))
+        assert [record.feed_id for record in records] == [FeedId.BINANCE_COINM, FeedId.FLOWA_ORDERS]
+        assert records[0].payload == '{"data": {"s": "BTCUSD_PERP", "p": "1"}}'
+        assert records[1].payload == b"\x81\xa6Status\xa3New"
+        assert records[0].recv_time_ns <= records[1].recv_time_ns
+
+    def test_rolls_when_file_is_full(self, tmp_path):
+        journal = TickJournal(logger, "test", directory=str(tmp_path), roll_bytes=256)
+        for index in range(20):
+            journal.record(FeedId.BINANCE_COINM, f"frame-{index:02d}")
+        journal.close()
+
+        assert len(list(tmp_path.iterdir())) > 1
+        payloads = [record.payload for record in TickJournalReader.from_directory(str(tmp_path))]
+        assert payloads == [f"frame-{index:02d}" for index in range(20)]
+
+    def test_reader_filters_feeds(self, tmp_path):
+        journal = TickJournal(logger, "test", directory=str(tmp_path))
+        journal.record(FeedId.BINANCE_COINM, "tick")
+        journal.record(FeedId.HASHDEX_INAV, b"{}")
+        journal.close()
+
+        reader = TickJournalReader.from_directory(str(tmp_path), feed_ids=[FeedId.HASHDEX_INAV])
+        assert [record.payload for record in reader] == [b"{}"]
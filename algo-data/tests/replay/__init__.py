@@ -0,0 +1 @@
+from .test_replay_engine import TestReplayEngine
\ No newline at end of file
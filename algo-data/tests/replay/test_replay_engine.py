@@ -0,0 +1,71 @@
+import json
+
+import msgpack
+
+from src.replay import build_replay_engine
+from src.infrastructure.adapters.recording.tick_journal import TickJournal, TickJournalReader, FeedId
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+logger = LoggerAdapter().get_logger()
+
+def binance_frame(price: float) -> str:
+    return json.dumps({"stream": "btcusd_perp@markPrice", "data": {"s": "BTCUSD_PERP", "p": str(price)}})
+
+def flowa_order_frame(exec_qty: int) -> bytes:
+    return msgpack.packb({
+        "StrategyId": "MTB_1",
+        "Symbol": "BITH11",
+        "Side": "BUY",
+        "Quantity": 100,
+        "Price": 50.1,
+        "OrderType": "LIMIT",
+        "ExecutedQuantity": exec_qty,
+        "TimeInForce": "DAY",
+        "Status": "PartiallyFilled"
+    })
+
+
+class TestReplayEngine:
+    def record_session(self, journal_dir: str):
+        journal = TickJournal(logger, "test", directory=journal_dir)
+        for price in (60000, 60000, 61000):
+            journal.record(FeedId.BINANCE_COINM, binance_frame(price))
+        journal.record(FeedId.FLOWA_ORDERS, flowa_order_frame(10))
+        journal.close()
+
+    def test_replays_through_collectors(self, tmp_path):
+        self.record_session(str(tmp_path))
+        replay_engine, local_redis = build_replay_engine(
+            logger=logger,
+            records=TickJournalReader.from_directory(str(tmp_path)),
+            speed=0,
+            usd_brl=5.0,
+            quantities={"BITH11": 0.0002}
+        )
+        stats = replay_engine.run()
+
+        assert stats["frames_per_feed"] == {FeedId.BINANCE_COINM: 3, FeedId.FLOWA_ORDERS: 1}
+        assert stats["errors"] == 0
+        # The repeated price does not move the iNAV, so only two publishes go out.
+        assert local_redis.published["inav-BITH11-binance"] == 2
+        assert local_redis.published["order-MTB_1"] == 1
+
+    def test_replay_is_deterministic(self, tmp_path):
+        self.record_session(str(tmp_path))
+        runs = []
+        for _ in range(2):
+            replay_engine, local_redis = build_replay_engine(
+                logger=logger,
+                records=TickJournalReader.from_directory(str(tmp_path)),
+                speed=0,
+                usd_brl=5.0,
+                quantities={"BITH11": 0.0002}
+            )
+            pubsub = local_redis.pubsub()
+            pubsub.subscribe("inav-BITH11-binance")
+            replay_engine.run()
+            runs.append([pubsub.get_message()["data"] for _ in range(2)])
+
+        assert runs[0] == runs[1]
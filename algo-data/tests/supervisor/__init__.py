@@ -0,0 +1 @@
+from .test_process_supervisor import TestProcessSupervisor
\ No newline at end of file
@@ -0,0 +1,105 @@
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import pytest
+
+from src.application.supervisor import ProcessSupervisor, ProcessSpec, RestartPolicy, load_supervisor_config
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+logger = LoggerAdapter().get_logger()
+
+
+def exit_with(code: int):
+    sys.exit(code)
+
+
+def report_affinity(results):
+    results.put(sorted(os.sched_getaffinity(0)))
+
+
+def sleep_forever():
+    while True:
+        time.sleep(1)
+
+
+def wait_until(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestProcessSupervisor:
+    def run_checks(self, supervisor: ProcessSupervisor, duration: float):
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            supervisor.check_processes()
+            time.sleep(0.01)
+
+    def test_crashed_process_is_restarted_with_backoff(self):
+        spec = ProcessSpec("crasher", exit_with, (1, ), min_backoff=0.1, max_backoff=0.2)
+        supervisor = ProcessSupervisor(logger, [spec])
+        supervisor.start()
+
+        self.run_checks(supervisor, 1)
+        supervisor.shutdown()
+
+        stats = supervisor.get_stats()["crasher"]
+        assert 2 <= stats["restarts"] <= 8
+        assert stats["last_exit_code"] == 1
+
+    def test_on_failure_policy_leaves_clean_exits(self):
+        spec = ProcessSpec("oneshot", exit_with, (0, ), restart=RestartPolicy.ON_FAILURE, min_backoff=0.01)
+        supervisor = ProcessSupervisor(logger, [spec])
+        supervisor.start()
+
+        self.run_checks(supervisor, 0.5)
+
+        stats = supervisor.get_stats()["oneshot"]
+        assert stats["alive"] is False
+        assert stats["restarts"] == 0
+        assert stats["last_exit_code"] == 0
+
+    def test_backoff_grows_until_max(self):
+        supervisor = ProcessSupervisor(logger, [ProcessSpec("feed", exit_with, min_backoff=1, max_backoff=5)])
+        supervised = supervisor.processes["feed"]
+
+        backoffs = []
+        for failures in range(1, 6):
+            supervised.consecutive_failures = failures
+            backoffs.append(supervisor.get_backoff(supervised))
+
+        assert backoffs == [1, 2, 4, 5, 5]
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity is Linux only")
+    def test_process_is_pinned_to_its_cpus(self):
+        cpu = min(os.sched_getaffinity(0))
+        results = multiprocessing.Queue()
+        spec = ProcessSpec("pinned", report_affinity, (results, ), cpus=[cpu], restart=RestartPolicy.NEVER)
+        supervisor = ProcessSupervisor(logger, [spec])
+        supervisor.start()
+
+        assert results.get(timeout=5) == [cpu]
+
+    def test_shutdown_terminates_processes(self):
+        supervisor = ProcessSupervisor(logger, [ProcessSpec("worker", sleep_forever)], stop_timeout=2)
+        supervisor.start()
+        wait_until(lambda: supervisor.get_stats()["worker"]["alive"])
+
+        supervisor.shutdown()
+
+        assert supervisor.get_stats()["worker"]["alive"] is False
+
+    def test_config_overrides_specs(self, tmp_path):
+        config_path = tmp_path / "supervisor.json"
+        config_path.write_text(json.dumps({"inav": {"enabled": True, "cpus": [1], "restart": "never"}}))
+        spec = ProcessSpec("inav", exit_with, enabled=False)
+
+        spec.apply_config(load_supervisor_config(str(config_path))["inav"])
+
+        assert (spec.enabled, spec.cpus, spec.restart) == (True, [1], RestartPolicy.NEVER)
+        assert load_supervisor_config('{"dollar": {"enabled": false}}') == {"dollar": {"enabled": False}}
+        assert ProcessSupervisor(logger, [ProcessSpec("dollar", exit_with, enabled=False)]).processes == {}
@@ -0,0 +1,243 @@
+import asyncio
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+
+import msgpack
+from aiohttp import web, WSMsgType
+
+
+# Just enough of /fapi/v1/exchangeInfo for ccxt to load the linear markets the algos hedge on.
+def make_futures_symbol(symbol: str, base: str) -> dict:
+    return {
+        "symbol": symbol,
+        "pair": symbol,
+        "contractType": "PERPETUAL",
+        "deliveryDate": 4133404800000,
+        "onboardDate": 1569398400000,
+        "status": "TRADING",
+        "baseAsset": base,
+        "quoteAsset": "USDT",
+        "marginAsset": "USDT",
+        "pricePrecision": 2,
+        "quantityPrecision": 3,
+        "baseAssetPrecision": 8,
+        "quotePrecision": 8,
+        "underlyingType": "COIN",
+        "triggerProtect": "0.0500",
+        "filters": [
+            {"filterType": "PRICE_FILTER", "minPrice": "0.01", "maxPrice": "1000000", "tickSize": "0.01"},
+            {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+            {"filterType": "MARKET_LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+            {"filterType": "MIN_NOTIONAL", "notional": "5"}
+        ],
+        "orderTypes": ["LIMIT", "MARKET"],
+        "timeInForce": ["GTC", "IOC", "FOK", "GTX"]
+    }
+
+
+FUTURES_EXCHANGE_INFO = {
+    "timezone": "UTC",
+    "serverTime": 0,
+    "rateLimits": [],
+    "exchangeFilters": [],
+    "assets": [],
+    "symbols": [
+        make_futures_symbol("BTCUSDT", "BTC"),
+        make_futures_symbol("ETHUSDT", "ETH"),
+        make_futures_symbol("SOLUSDT", "SOL")
+    ]
+}
+
+
+class StandInEvent:
+    """
+    A request or frame seen by a stand-in, stamped with perf_counter when it
+    arrived so it can be compared with the harness send times.
+    """
+    def __init__(self, kind: str, payload: dict):
+        self.received_at = time.perf_counter()
+        self.kind = kind
+        self.payload = payload
+
+
+class ExchangeStandIns:
+    """
+    Local stand-ins for the venues the spread algo talks to, served from one
+    event loop thread:
+
+    - Binance Coin-M market stream (websocket), pushes markPriceUpdate frames
+    - Flowa REST (token and simple-order CRUD) and strategies websocket
+    - Binance futures REST (exchangeInfo and order placement)
+
+    Amends and hedge orders land in `amends` and `hedges` as StandInEvents.
+    """
+    def __init__(self, logger: logging.Logger, host: str = "127.0.0.1"):
+        self.logger = logger
+        self.host = host
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread: threading.Thread = None
+        self.runners: list = []
+        self.urls: dict = {}
+
+        self.coinm_clients: set = set()
+        self.flowa_clients: set = set()
+        self.flowa_orders: dict = {}
+        self.amends: queue.Queue = queue.Queue()
+        self.hedges: queue.Queue = queue.Queue()
+        self.order_ids = itertools.count(1)
+
+    def build_apps(self) -> dict:
+        coinm = web.Application()
+        coinm.router.add_get("/stream", self.handle_coinm_stream)
+
+        flowa = web.Application()
+        flowa.router.add_post("/connect/token", self.handle_flowa_token)
+        flowa.router.add_post("/api/simple-order", self.handle_flowa_send)
+        flowa.router.add_get("/api/simple-order/{order_id}", self.handle_flowa_get)
+        flowa.router.add_put("/api/simple-order/{order_id}", self.handle_flowa_update)
+        flowa.router.add_delete("/api/simple-order/{order_id}", self.handle_flowa_cancel)
+        flowa.router.add_get("/ws/strategies", self.handle_flowa_strategies)
+
+        binance_futures = web.Application()
+        binance_futures.router.add_get("/fapi/v1/exchangeInfo", self.handle_exchange_info)
+        binance_futures.router.add_post("/fapi/v1/order", self.handle_futures_order)
+
+        return {"coinm": coinm, "flowa": flowa, "binance-futures": binance_futures}
+
+    async def start_servers(self):
+        for name, app in self.build_apps().items():
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, self.host, 0)
+            await site.start()
+            self.runners.append(runner)
+            port = runner.addresses[0][1]
+            self.urls[name] = f"http://{self.host}:{port}"
+
+    def start(self):
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+        asyncio.run_coroutine_threadsafe(self.start_servers(), self.loop).result()
+        self.logger.info(f"[ExchangeStandIns] Serving {self.urls}")
+
+    async def cleanup(self):
+        for ws in list(self.coinm_clients) + list(self.flowa_clients):
+            await ws.close()
+        for runner in self.runners:
+            await runner.cleanup()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+
+    async def serve_websocket(self, request: web.Request, clients: set) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        clients.add(ws)
+        try:
+            async for message in ws:
+                if message.type == WSMsgType.ERROR:
+                    break
+        finally:
+            clients.discard(ws)
+        return ws
+
+    async def broadcast(self, clients: set, frame) -> float:
+        sent_at = time.perf_counter()
+        for ws in list(clients):
+            if isinstance(frame, bytes):
+                await ws.send_bytes(frame)
+            else:
+                await ws.send_str(frame)
+        return sent_at
+
+    def push(self, clients: set, frame) -> float:
+        """
+        Sends frame to every connected client and returns the perf_counter it
+        was sent at.
+        """
+        return asyncio.run_coroutine_threadsafe(self.broadcast(clients, frame), self.loop).result()
+
+    # Binance Coin-M
+
+    async def handle_coinm_stream(self, request: web.Request):
+        return await self.serve_websocket(request, self.coinm_clients)
+
+    def push_mark_price(self, symbol: str, price: float) -> float:
+        frame = json.dumps({
+            "stream": f"{symbol.lower()}@markPrice",
+            "data": {"e": "markPriceUpdate", "E": int(time.time() * 1000), "s": symbol, "p": f"{price:.2f}"}
+        })
+        return self.push(self.coinm_clients, frame)
+
+    # Flowa
+
+    async def handle_flowa_token(self, request: web.Request):
+        return web.json_response({"access_token": "stand-in", "expires_in": 28800, "token_type": "Bearer"})
+
+    async def handle_flowa_send(self, request: web.Request):
+        order = await request.json()
+        order_id = f"STAND_IN_{next(self.order_ids):05d}"
+        self.flowa_orders[order_id] = {**order, "StrategyId": order_id, "ExecutedQuantity": 0, "Status": "NEW"}
+        return web.json_response({"Success": True, "StrategyId": order_id})
+
+    async def handle_flowa_get(self, request: web.Request):
+        order = self.flowa_orders.get(request.match_info["order_id"])
+        if order is None:
+            return web.json_response({"Success": False, "Error": "Unknown order"}, status=404)
+        return web.json_response(order)
+
+    async def handle_flowa_update(self, request: web.Request):
+        event = StandInEvent("amend", await request.json())
+        order_id = request.match_info["order_id"]
+        if order_id not in self.flowa_orders:
+            return web.json_response({"Success": False, "Error": "Unknown order"})
+        self.flowa_orders[order_id].update(event.payload)
+        self.amends.put(event)
+        return web.json_response({"Success": True})
+
+    async def handle_flowa_cancel(self, request: web.Request):
+        order = self.flowa_orders.get(request.match_info["order_id"])
+        if order is not None:
+            order["Status"] = "CANCELED"
+        return web.json_response({"Success": order is not None})
+
+    async def handle_flowa_strategies(self, request: web.Request):
+        return await self.serve_websocket(request, self.flowa_clients)
+
+    def push_fill(self, order_id: str, exec_qty: int) -> float:
+        order = self.flowa_orders[order_id]
+        order.update(ExecutedQuantity=exec_qty, Status="PARTIALLY_FILLED")
+        return self.push(self.flowa_clients, msgpack.packb(order))
+
+    # Binance futures
+
+    async def handle_exchange_info(self, request: web.Request):
+        return web.json_response({**FUTURES_EXCHANGE_INFO, "serverTime": int(time.time() * 1000)})
+
+    async def handle_futures_order(self, request: web.Request):
+        event = StandInEvent("hedge", dict(await request.post()) or dict(request.query))
+        self.hedges.put(event)
+        params = event.payload
+        now = int(time.time() * 1000)
+        return web.json_response({
+            "orderId": next(self.order_ids),
+            "symbol": params.get("symbol"),
+            "status": "FILLED",
+            "clientOrderId": params.get("newClientOrderId", "stand-in"),
+            "price": "0",
+            "avgPrice": "0",
+            "origQty": params.get("quantity"),
+            "executedQty": params.get("quantity"),
+            "cumQuote": "0",
+            "timeInForce": "GTC",
+            "type": params.get("type"),
+            "reduceOnly": False,
+            "side": params.get("side"),
+            "updateTime": now
+        })
@@ -0,0 +1,315 @@
+"""
+Tick-to-trade harness for the spread algo, against local exchange stand-ins.
+
+    python -m benchmarks.tick_to_trade                       # 200 rounds after 20 warmup rounds
+    python -m benchmarks.tick_to_trade --rounds 1000 --output results.json
+
+Each round pushes a Coin-M mark price that moves the iNAV past the amend
+threshold and waits for the Flowa amend, then pushes a Flowa fill and waits
+for the Binance futures hedge. Both legs are timed on the stand-ins' clock:
+
+- tick_to_amend: Coin-M frame sent -> Flowa PUT received
+- fill_to_hedge: Flowa strategies frame sent -> Binance futures order received
+
+The order API runs in process on a local port and the algo talks to it over
+HTTP as in production. The relays take algo-data's place between the
+websockets and the broker: they price the iNAV and forward order reports on
+an in-process LocalRedis.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+
+import aiohttp
+import msgpack
+from dotenv import load_dotenv
+from werkzeug.serving import make_server
+
+from benchmarks.exchange_stand_ins import ExchangeStandIns
+from src.application.algorithms.spread_crypto_etf import SpreadCryptoETFAdapter
+from src.domain.algorithms.entities import SpreadCryptoETF
+from src.enums import ExchangeEnum
+from src.infrastructure.adapters.cache import SharedValueCache
+from src.infrastructure.adapters.clients.order_service_client import OrderServiceClient
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.metrics import LatencyHistogram, LatencyTracker
+from src.infrastructure.adapters.queue import LocalRedis, RedisAdapter
+from src.interface.api import create_app
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+ETF_SYMBOL = "BITH11"
+COINM_SYMBOL = "BTCUSD_PERP"
+START_PRICE = 60000.0
+USD_BRL = 5.5
+# BTC per ETF share, large enough for single share fills to clear the 0.001 lot size.
+QUANTITY_PER_SHARE = 0.01
+
+
+class FeedRelays:
+    """
+    algo-data's part of the path, reduced to what the algo consumes: Coin-M
+    marks become `inav-{symbol}-binance` events and Flowa strategy frames
+    become `order-{id}` reports, both published through RedisAdapter.
+    """
+    def __init__(self, logger: logging.Logger, stand_ins: ExchangeStandIns, message_broker: RedisAdapter):
+        self.logger = logger
+        self.stand_ins = stand_ins
+        self.message_broker = message_broker
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread: threading.Thread = None
+        self.connections: list = []
+
+    def publish_inav(self, frame: str):
+        received_at = time.time()
+        data = json.loads(frame)["data"]
+        inav = round(float(data["p"]) * QUANTITY_PER_SHARE * USD_BRL, 2)
+        self.message_broker.publish_message(f"inav-{ETF_SYMBOL}-{ExchangeEnum.BINANCE.value}", {
+            "symbol": ETF_SYMBOL,
+            "inav": inav,
+            "amount_of_underlying_asset": QUANTITY_PER_SHARE,
+            "ts": {"exchange": data["E"] / 1000, "received": received_at, "published": time.time()}
+        })
+
+    def publish_order_report(self, frame: bytes):
+        order = msgpack.unpackb(frame)
+        self.message_broker.publish_message(f"order-{order['StrategyId']}", {
+            "order_id": order["StrategyId"],
+            "symbol": order["Symbol"],
+            "side": order["Side"],
+            "quantity": order["Quantity"],
+            "price": order["Price"],
+            "order_type": order["OrderType"],
+            "exec_qty": order["ExecutedQuantity"],
+            "time_in_force": order["TimeInForce"],
+            "status": order["Status"]
+        })
+
+    async def relay(self, url: str, handler, first_message: str = None):
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(url) as ws:
+                self.connections.append(ws)
+                if first_message:
+                    await ws.send_str(first_message)
+                async for message in ws:
+                    if message.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        handler(message.data)
+
+    def start(self):
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+        ws_url = lambda name, path: self.stand_ins.urls[name].replace("http://", "ws://") + path
+        asyncio.run_coroutine_threadsafe(self.relay(ws_url("coinm", "/stream"), self.publish_inav), self.loop)
+        asyncio.run_coroutine_threadsafe(
+            self.relay(ws_url("flowa", "/ws/strategies"), self.publish_order_report, first_message="stand-in"),
+            self.loop
+        )
+
+    async def close(self):
+        for ws in self.connections:
+            await ws.close()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+class OrderApiServer:
+    """
+    The order-manager Flask app on a local port, in a background thread.
+    """
+    def __init__(self, host: str = "127.0.0.1"):
+        self.app = create_app()
+        self.server = make_server(host, 0, self.app, threaded=True)
+        self.url = f"http://{host}:{self.server.server_port}"
+        self.server_thread: threading.Thread = None
+
+    def start(self):
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+
+
+def configure_endpoints(stand_ins: ExchangeStandIns, api_url: str) -> dict:
+    """
+    Points the order adapters and the algo's client at the stand-ins, read
+    when they are constructed. Returns the previous values for restore_environment.
+    """
+    overrides = {
+        f"FLOWA_ENDPOINT_{ENV}": f"{stand_ins.urls['flowa']}/api",
+        f"FLOWA_TOKEN_ENDPOINT_{ENV}": f"{stand_ins.urls['flowa']}/connect/token",
+        f"FLOWA_CLIENT_ID_{ENV}": "stand-in",
+        f"FLOWA_API_SECRET_{ENV}": "stand-in",
+        f"BINANCE_FUTURES_ENDPOINT_{ENV}": f"{stand_ins.urls['binance-futures']}/fapi",
+        f"BINANCE_FUTURES_API_KEY_{ENV}": "stand-in",
+        f"BINANCE_FUTURES_API_SECRET_{ENV}": "stand-in",
+        f"ORDER_SERVICE_URL_{ENV}": f"{api_url}/api/v1"
+    }
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    return previous
+
+
+def restore_environment(previous: dict):
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def prepare_order_service(api: OrderApiServer):
+    order_service = api.app.container.order_service()
+    client = order_service.order_adapter_dict[ExchangeEnum.BINANCE.value]["futures"].client
+    # The stand-in only serves the linear futures markets.
+    client.options["fetchMarkets"] = {"types": ["linear"]}
+    client.options["fetchCurrencies"] = False
+    client.load_markets()
+
+
+def wait_for(condition, timeout: float, description: str):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Timed out waiting for {description}")
+        time.sleep(0.001)
+
+
+def take_event(events: queue.Queue, timeout: float, description: str):
+    try:
+        return events.get(timeout=timeout)
+    except queue.Empty:
+        raise TimeoutError(f"Timed out waiting for {description}")
+
+
+def run_rounds(stand_ins: ExchangeStandIns, order_id: str, rounds: int, warmup: int, timeout: float) -> dict:
+    histograms = {"tick_to_amend": LatencyHistogram(), "fill_to_hedge": LatencyHistogram()}
+    for index in range(warmup + rounds):
+        # Alternate 1% above and at the start price, past the algo's amend threshold every time.
+        price = START_PRICE * (1.01 if index % 2 == 0 else 1)
+        tick_sent_at = stand_ins.push_mark_price(COINM_SYMBOL, price)
+        amend = take_event(stand_ins.amends, timeout, f"the amend of round {index}")
+
+        fill_sent_at = stand_ins.push_fill(order_id, index + 1)
+        hedge = take_event(stand_ins.hedges, timeout, f"the hedge of round {index}")
+
+        if index >= warmup:
+            histograms["tick_to_amend"].record((amend.received_at - tick_sent_at) * 1_000_000)
+            histograms["fill_to_hedge"].record((hedge.received_at - fill_sent_at) * 1_000_000)
+    return {stage: histogram.get_stats() for stage, histogram in histograms.items()}
+
+
+def stop_algo(algo: SpreadCryptoETFAdapter, stand_ins: ExchangeStandIns, timeout: float):
+    """
+    A finished algo has already unsubscribed, an interrupted one cancels its
+    stock order through the API, which must still be up for it.
+    """
+    if algo.is_finished() or algo.stock_order_id is None:
+        return
+    algo.cancel_event.set()
+    try:
+        wait_for(
+            lambda: stand_ins.flowa_orders[algo.stock_order_id]["Status"] == "CANCELED",
+            timeout,
+            "the stock order cancel"
+        )
+    except TimeoutError as err:
+        algo.logger.error(f"[TickToTrade] {err}")
+
+
+def run_harness(logger: logging.Logger, rounds: int, warmup: int, timeout: float) -> dict:
+    stand_ins = ExchangeStandIns(logger)
+    stand_ins.start()
+    api = OrderApiServer()
+    previous_environment = configure_endpoints(stand_ins, api.url)
+    api.start()
+    prepare_order_service(api)
+
+    local_redis = LocalRedis()
+    local_redis.set(f"inav:{ETF_SYMBOL}", json.dumps({
+        "symbol": ETF_SYMBOL,
+        "inav": round(START_PRICE * QUANTITY_PER_SHARE * USD_BRL, 2),
+        "amount_of_underlying_asset": QUANTITY_PER_SHARE
+    }))
+    relays = FeedRelays(logger, stand_ins, RedisAdapter(logger, redis_db=local_redis))
+    relays.start()
+
+    algo = SpreadCryptoETFAdapter(
+        logger=logger,
+        algo=SpreadCryptoETF(id="tick-to-trade", algo_data={
+            "broker": "935",
+            "account": "1001",
+            "symbol": ETF_SYMBOL,
+            "side": "BUY",
+            "quantity": warmup + rounds,
+            "spread_threshold": 0.02
+        }),
+        order_service_client=OrderServiceClient(logger),
+        cancel_event=threading.Event(),
+        # A segment nobody writes, so fair prices come from the broker like on a remote host.
+        shared_cache=SharedValueCache(logger, name=f"tick-to-trade-{os.getpid()}"),
+        latency_tracker=LatencyTracker(logger, "tick-to-trade", enabled=True),
+        message_service=RedisAdapter(logger, redis_db=local_redis)
+    )
+    threading.Thread(target=algo.run_algo, daemon=True).start()
+
+    try:
+        wait_for(lambda: algo.stock_order_id is not None, timeout, "the initial stock order")
+        wait_for(
+            lambda: all(local_redis.subscribers.get(channel) for channel in (
+                f"inav-{ETF_SYMBOL}-{ExchangeEnum.BINANCE.value}", f"order-{algo.stock_order_id}"
+            )),
+            timeout,
+            "the algo subscriptions"
+        )
+        wait_for(lambda: stand_ins.coinm_clients and stand_ins.flowa_clients, timeout, "the feed relays")
+        results = run_rounds(stand_ins, algo.stock_order_id, rounds, warmup, timeout)
+        # The last fill completes the algo once its hedge is acknowledged.
+        wait_for(algo.is_finished, timeout, "the algo to finish")
+        # Stages measured inside the algo, e.g. receive_to_submit and submit_to_ack.
+        results["algo"] = algo.latency_tracker.get_stats()
+        return results
+    finally:
+        stop_algo(algo, stand_ins, timeout)
+        relays.stop()
+        api.stop()
+        stand_ins.stop()
+        restore_environment(previous_environment)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=10, help="Seconds to wait for each amend or hedge")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logger = LoggerAdapter().get_logger()
+    logger.setLevel(args.log_level)
+    logging.getLogger("werkzeug").setLevel(args.log_level)
+
+    results = run_harness(logger, args.rounds, args.warmup, args.timeout)
+    for stage, stats in results.items():
+        print(f"{stage}: {json.dumps(stats)}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+            file.write("\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,2 +1,2 @@
-from .orders import OrderService
+from .orders import OrderService, AsyncOrderService
 from .algorithms import AlgoService, BaseAlgorithm, SpreadCryptoETFAdapter
\ No newline at end of file
@@ -1,15 +1,23 @@
 import logging
+import os
 import threading
 import multiprocessing
 import time
 
+from dotenv import load_dotenv
+
 from src.decorators import retry_decorator
 from src.enums import ExchangeEnum, StrategyEnum
 from src.domain.algorithms.entities import SpreadCryptoETF
 from src.application.algorithms.base_algorithm import BaseAlgorithm
 from src.infrastructure.adapters.clients.order_service_client import OrderServiceClient
 from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
+from src.infrastructure.adapters.cache.shared_value_cache import SharedValueCache
+from src.infrastructure.adapters.metrics import LatencyTracker, TS_EXCHANGE, TS_RECEIVED, TS_PUBLISHED
+
+load_dotenv()
 
+ENV = os.environ.get("ENV", "DEV")
 
 
 class SpreadCryptoETFAdapter(BaseAlgorithm):
@@ -18,12 +26,24 @@ class SpreadCryptoETFAdapter(BaseAlgorithm):
             logger: logging.Logger,
             algo: SpreadCryptoETF,
             order_service_client: OrderServiceClient,
-            cancel_event: multiprocessing.Event # type: ignore
+            cancel_event: multiprocessing.Event, # type: ignore
+            shared_cache: SharedValueCache = None,
+            latency_tracker: LatencyTracker = None,
+            message_service: RedisAdapter = None,
+            inav_max_age: float = None,
+            pcf_max_age: float = None
         ):
         self.logger = logger
         self.algo = algo
         self.order_service_client = order_service_client
-        self.message_service = RedisAdapter(self.logger)
+        self.message_service = message_service or RedisAdapter(self.logger)
+        self.shared_cache = shared_cache or SharedValueCache(self.logger)
+        self.latency_tracker = latency_tracker or LatencyTracker(
+            self.logger, f"spread-{self.algo.id}", store=self.message_service
+        )
+        # Past these ages the shared cache entry is treated as missing and Redis is read instead.
+        self.inav_max_age = float(inav_max_age or os.environ.get(f"INAV_MAX_AGE_{ENV}", 5))
+        self.pcf_max_age = float(pcf_max_age or os.environ.get(f"PCF_MAX_AGE_{ENV}", 7200))
         self.cancel_event = cancel_event
         self.stop_cancellation_event_thread = threading.Event()
 
@@ -34,11 +54,29 @@ class SpreadCryptoETFAdapter(BaseAlgorithm):
         self.retry_time: int = 1
         self.price_dif_threshold: float = 0.0015
 
+    def get_fair_price_snapshot(self, etf_symbol: str) -> tuple:
+        """
+        Latest iNAV and underlying quantity per share, from the host shared
+        cache when algo-data runs on this host and the entries are fresh,
+        otherwise from Redis.
+        """
+        inav = self.shared_cache.get(f"inav:{etf_symbol}", max_age=self.inav_max_age)
+        if inav is not None:
+            inav_value, inav_quantity = inav.value, inav.quantity
+        else:
+            inav_data = self.message_service.get_key(f"inav:{etf_symbol}")
+            inav_value, inav_quantity = float(inav_data["inav"]), float(inav_data["amount_of_underlying_asset"])
+
+        pcf = self.shared_cache.get(f"pcf:{etf_symbol}", max_age=self.pcf_max_age)
+        if pcf is not None:
+            return inav_value, pcf.value
+        # algo-data keeps the PCF quantity under pcf:{symbol}, older deployments only have it on the iNAV key.
+        pcf_data = self.message_service.get_key(f"pcf:{etf_symbol}")
+        return inav_value, float(pcf_data["amount_of_underlying_asset"]) if pcf_data else inav_quantity
+
     def run_algo(self):
         etf_symbol = self.algo.algo_data["symbol"]
-        inav_data = self.message_service.get_key(f"inav:{etf_symbol}")
-        stock_fair_price = float(inav_data["inav"])
-        self.quantity_crypto_per_stock_share = float(inav_data["amount_of_underlying_asset"])
+        stock_fair_price, self.quantity_crypto_per_stock_share = self.get_fair_price_snapshot(etf_symbol)
         stock_order_placement_price = self.get_order_placement_price(
             stock_fair_price=stock_fair_price,
             side=self.algo.algo_data["side"],
@@ -111,11 +149,25 @@ class SpreadCryptoETFAdapter(BaseAlgorithm):
     def is_finished(self):
         return self.stocks_exec_qty == self.algo.algo_data["quantity"]
     
+    def record_tick_to_trade(self, timestamps: dict, received_at: float, submitted_at: float, acked_at: float):
+        """
+        Stages from the exchange event to the order update ack. exchange_to_submit
+        spans hosts and includes their clock skew.
+        """
+        tracker = self.latency_tracker
+        tracker.record("exchange_to_submit", timestamps.get(TS_EXCHANGE), submitted_at)
+        tracker.record("tick_to_trade", timestamps.get(TS_RECEIVED), submitted_at)
+        tracker.record("receive_to_submit", received_at, submitted_at)
+        tracker.record("submit_to_ack", submitted_at, acked_at)
+        tracker.maybe_report()
+
     def handle_inav_price_update(self, data: dict, order_id: str):
+        received_at = time.time()
         if self.is_finished():
             return
         
         if data["symbol"] == self.algo.algo_data["symbol"]:
+            self.latency_tracker.record("publish_to_receive", (data.get("ts") or {}).get(TS_PUBLISHED), received_at)
             self.logger.info(f"[{data['symbol']}] Received INAV update: {data}")
 
             stock_fair_price = data["inav"]
@@ -135,7 +187,9 @@ class SpreadCryptoETFAdapter(BaseAlgorithm):
             price_dif_range = self.stock_order_price * self.price_dif_threshold
             if abs(stock_order_placement_price - self.stock_order_price) > price_dif_range:
                 try:
+                    submitted_at = time.time()
                     self.update_stock_order(self.stock_order_id, stock_order_placement_price)
+                    self.record_tick_to_trade(data.get("ts") or {}, received_at, submitted_at, time.time())
                     # Update the current price of the order
                     self.stock_order_price = stock_order_placement_price
                 except Exception as err:
@@ -197,7 +251,7 @@ class SpreadCryptoETFAdapter(BaseAlgorithm):
 
     def stop_listeners(self):
         self.logger.info(f"Unsubscribing channels on pubsub...")
-        self.message_service.unsubscribe(f"inav-{self.algo.algo_data['symbol']}")
+        self.message_service.unsubscribe(f"inav-{self.algo.algo_data['symbol']}-{ExchangeEnum.BINANCE.value}")
         self.message_service.unsubscribe(f"order-{self.stock_order_id}")
 
     def start_cancellation_event_thread(self):
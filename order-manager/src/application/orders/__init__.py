@@ -1 +1,2 @@
-from .order_service import OrderService
\ No newline at end of file
+from .order_service import OrderService
+from .async_order_service import AsyncOrderService
\ No newline at end of file
@@ -0,0 +1,71 @@
+import logging
+
+from src.application.orders.order_service import OrderService
+from src.infrastructure.adapters.stocks.flowa.flowa_async_adapter import FlowaAsyncAdapter
+from src.infrastructure.adapters.crypto.binance.binance_async_adapter import BinanceAsyncAdapter
+from src.infrastructure.adapters.crypto.async_session_manager import AsyncSessionManager
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+class AsyncOrderService(OrderService):
+    """
+    OrderService for the ASGI app, same exchanges, strategies and metrics
+    but every adapter call is awaited. Flowa goes through httpx.AsyncClient
+    and Binance through ccxt.async_support on the shared aiohttp session.
+    """
+    def __init__(self, logger: logging.Logger = LoggerAdapter().get_logger()):
+        super().__init__(logger=logger)
+        self.order_adapter_dict = {
+            "binance": {
+                strategy: BinanceAsyncAdapter(adapter, logger=self.logger)
+                for strategy, adapter in self.order_adapter_dict["binance"].items()
+            },
+            "flowa": {
+                "simple-order": FlowaAsyncAdapter(self.order_adapter_dict["flowa"]["simple-order"], logger=self.logger)
+            }
+        }
+
+    async def send_order(self, exchange_name: str, strategy: str, order_data: dict):
+        try:
+            order = self.order_creation_manager.create_order(strategy, order_data)
+            order_adapter = self.get_order_adapter(exchange_name, strategy)
+            with self.track_request("send", exchange_name, strategy):
+                response = await order_adapter.send_order(order.to_dict())
+            return response
+        except Exception as err:
+            self.logger.error(err)
+            raise
+
+    async def get_order(self, exchange_name: str, strategy: str, order_id: str, **kwargs) -> dict:
+        try:
+            order_adapter = self.get_order_adapter(exchange_name, strategy)
+            return await order_adapter.get_order(order_id, **kwargs)
+        except Exception as err:
+            self.logger.error(f"Could not get order, reason: {err}")
+            raise
+
+    async def update_order(self, exchange_name: str, strategy: str, order_id: str, **kwargs) -> dict:
+        try:
+            order_adapter = self.get_order_adapter(exchange_name, strategy)
+            with self.track_request("update", exchange_name, strategy):
+                order = await order_adapter.update_order(order_id, **kwargs)
+            return order
+        except Exception as err:
+            self.logger.error(f"Could not update order, reason: {err}")
+            raise
+
+    async def cancel_order(self, exchange_name: str, strategy: str, order_id: str, **kwargs) -> bool:
+        try:
+            order_adapter = self.get_order_adapter(exchange_name, strategy)
+            with self.track_request("cancel", exchange_name, strategy):
+                return await order_adapter.cancel_order(order_id, **kwargs)
+        except Exception as err:
+            self.logger.error(f"Could not cancel order, reason: {err}")
+            raise
+
+    async def close(self):
+        for adapters in self.order_adapter_dict.values():
+            for adapter in adapters.values():
+                await adapter.close()
+        await AsyncSessionManager.close_session()
@@ -1,10 +1,14 @@
 import logging
 import json
+import time
+from contextlib import contextmanager
 
 from src.infrastructure.adapters.crypto.binance import BinanceSimpleOrderAdapter, BinanceFuturesOrderAdapter
 from src.infrastructure.adapters.stocks.flowa.flowa_simple_order import FlowaSimpleOrderAdapter
 from src.infrastructure.adapters.logger_adapter import LoggerAdapter
 from src.infrastructure.adapters.order_adapter import OrderAdapter
+from src.infrastructure.adapters.metrics import MetricsRegistry
+from src.infrastructure.adapters.cache.market_metadata_cache import MarketMetadataCache
 
 from src.domain.orders.order_creation_manager import OrderCreationManager
 
@@ -23,8 +27,43 @@ class OrderService:
                 "simple-order": FlowaSimpleOrderAdapter(logger=self.logger)
             }
         }
+        self.market_clients = [adapter.client for adapter in self.order_adapter_dict["binance"].values()]
+        self.market_cache: MarketMetadataCache = None
+        registry = MetricsRegistry.get_default()
+        self.requests_total = registry.counter(
+            "order_requests_total",
+            "Order requests by exchange, operation and result",
+            ("exchange", "strategy", "operation", "status")
+        )
+        self.request_duration = registry.histogram(
+            "order_request_duration_seconds",
+            "Order request round trip to the exchange",
+            ("exchange", "strategy", "operation")
+        )
         self.logger.info(f"Order service has successfully started")
 
+    def load_markets(self):
+        """
+        Loads exchange markets up front from the shared market cache and
+        keeps them refreshed, so no order pays for ccxt's lazy load_markets.
+        """
+        if self.market_cache is None:
+            self.market_cache = MarketMetadataCache(logger=self.logger)
+        for client in self.market_clients:
+            self.market_cache.register(client)
+
+    @contextmanager
+    def track_request(self, operation: str, exchange_name: str, strategy: str):
+        started_at = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.requests_total.labels(exchange_name, strategy, operation, "error").inc()
+            raise
+        finally:
+            self.request_duration.labels(exchange_name, strategy, operation).observe(time.perf_counter() - started_at)
+        self.requests_total.labels(exchange_name, strategy, operation, "success").inc()
+
     def get_order_adapter(self, exchange_name: str, strategy: str) -> OrderAdapter:
         try:
             return self.order_adapter_dict[exchange_name][strategy]
@@ -36,7 +75,8 @@ class OrderService:
         try:
             order = self.order_creation_manager.create_order(strategy, order_data)
             order_adapter = self.get_order_adapter(exchange_name, strategy)
-            response = order_adapter.send_order(order.to_dict())
+            with self.track_request("send", exchange_name, strategy):
+                response = order_adapter.send_order(order.to_dict())
             return response
         except Exception as err:
             self.logger.error(err)
@@ -54,7 +94,8 @@ class OrderService:
     def update_order(self, exchange_name: str, strategy: str, order_id: str, **kwargs) -> dict:
         try:
             order_adapter = self.get_order_adapter(exchange_name, strategy)
-            order = order_adapter.update_order(order_id, **kwargs)
+            with self.track_request("update", exchange_name, strategy):
+                order = order_adapter.update_order(order_id, **kwargs)
             return order
         except Exception as err:
             self.logger.error(f"Could not update order, reason: {err}")
@@ -63,7 +104,8 @@ class OrderService:
     def cancel_order(self, exchange_name: str, strategy: str, order_id: str, **kwargs) -> bool:
         try:
             order_adapter = self.get_order_adapter(exchange_name, strategy)
-            return order_adapter.cancel_order(order_id, **kwargs)
+            with self.track_request("cancel", exchange_name, strategy):
+                return order_adapter.cancel_order(order_id, **kwargs)
         except Exception as err:
             self.logger.error(f"Could not cancel order, reason: {err}")
             raise
@@ -2,10 +2,14 @@ from .crypto import (
     BinanceAdapter, 
     BinanceSimpleOrderAdapter, 
     BinanceFuturesOrderAdapter, 
-    BinanceFuturesAdapter
+    BinanceFuturesAdapter,
+    BinanceAsyncAdapter,
+    AsyncSessionManager
 )
-from .stocks import FlowaAdapter, FlowaSimpleOrderAdapter
+from .stocks import FlowaAdapter, FlowaSimpleOrderAdapter, FlowaAsyncAdapter
 from .logger_adapter import LoggerAdapter
-from .order_adapter import OrderAdapter, CancelOrderError, SendOrderError, GetOrderError
+from .order_adapter import OrderAdapter, AsyncOrderAdapter, CancelOrderError, SendOrderError, GetOrderError
 from .queue import RedisAdapter
+from .cache import SharedValueCache, MarketMetadataCache
+from .metrics import LatencyHistogram, LatencyTracker
 from .clients import OrderServiceClient
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .file_lock import FileLock
+from .shared_value_cache import SharedValueCache, CachedValue, SharedCacheFullError
+from .market_metadata_cache import MarketMetadataCache
\ No newline at end of file
@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import zlib
+
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.cache.file_lock import FileLock
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class MarketMetadataCache:
+    """
+    ccxt markets and currencies persisted as one JSON file per exchange
+    client under MARKET_CACHE_DIR_{ENV}, so processes and restarts skip the
+    multi-second load_markets that ccxt would otherwise run inside the first
+    order.
+
+    Files younger than the TTL are used as is. Older ones are fetched again
+    by one process at a time, under a file lock, the others pick up its
+    result. When a fetch fails a stale file is still better than nothing.
+    Registered clients are refreshed in the background once half the TTL
+    has passed. A TTL of 0 turns the cache off: every load fetches and
+    nothing is refreshed in the background.
+    """
+    def __init__(self, logger: logging.Logger, directory: str = None, ttl: float = None):
+        self.logger = logger
+        self.directory = directory or os.environ.get(
+            f"MARKET_CACHE_DIR_{ENV}", os.path.join(tempfile.gettempdir(), "market-cache")
+        )
+        self.ttl = float(ttl if ttl is not None else os.environ.get(f"MARKET_CACHE_TTL_{ENV}", 3600))
+        self.refresh_interval = self.ttl / 2
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.clients: list = []
+        self.applied: dict = {}
+        self.refresh_thread: threading.Thread = None
+        self.stop_event = threading.Event()
+
+    @staticmethod
+    def get_name(client) -> str:
+        """
+        Clients pointed at other urls (sandbox, stand-ins) or filtering other
+        market types get their own file.
+        """
+        scope = json.dumps([client.urls["api"], client.options.get("fetchMarkets")], sort_keys=True, default=str)
+        default_type = client.options.get("defaultType", "spot")
+        return f"{client.id}-{default_type}-{zlib.crc32(scope.encode()):08x}"
+
+    def get_path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.json")
+
+    def read(self, name: str) -> dict:
+        try:
+            with open(self.get_path(name)) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            self.logger.warning(f"[MarketMetadataCache] Ignoring unreadable {name}, reason: {err}")
+            return None
+
+    def write(self, name: str, client):
+        data = {"fetched_at": time.time(), "markets": client.markets, "currencies": client.currencies}
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{name}.")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(data, file, default=str)
+            os.replace(temp_path, self.get_path(name))
+        except Exception:
+            os.remove(temp_path)
+            raise
+        self.applied[id(client)] = data["fetched_at"]
+
+    def apply(self, client, data: dict):
+        if self.applied.get(id(client)) == data["fetched_at"]:
+            return
+        client.set_markets(data["markets"], data["currencies"] or None)
+        self.applied[id(client)] = data["fetched_at"]
+
+    def is_fresh(self, data: dict, max_age: float) -> bool:
+        return data is not None and time.time() - data["fetched_at"] < max_age
+
+    def load(self, client, max_age: float = None):
+        """
+        Sets the client's markets from the cache, fetching and saving them
+        first when the file is missing or older than max_age (the TTL).
+        """
+        max_age = self.ttl if max_age is None else max_age
+        name = self.get_name(client)
+        data = self.read(name)
+        if self.is_fresh(data, max_age):
+            return self.apply(client, data)
+
+        with FileLock(os.path.join(self.directory, f"{name}.lock")):
+            data = self.read(name)
+            if self.is_fresh(data, max_age):
+                return self.apply(client, data)
+            started_at = time.perf_counter()
+            try:
+                client.load_markets(reload=True)
+            except Exception as err:
+                if data is None:
+                    raise
+                self.logger.warning(f"[MarketMetadataCache] Could not refresh {name}, using stale markets, reason: {err}")
+                return self.apply(client, data)
+            self.write(name, client)
+        self.logger.info(
+            f"[MarketMetadataCache] Fetched {len(client.markets)} markets for {name} "
+            f"in {time.perf_counter() - started_at:.2f}s"
+        )
+
+    def register(self, client):
+        """
+        Loads the client's markets now and keeps them refreshed.
+        """
+        try:
+            self.load(client)
+        except Exception as err:
+            self.logger.error(f"[MarketMetadataCache] Could not load markets for {client.id}, reason: {err}")
+        self.clients.append(client)
+        if self.refresh_thread is None and self.refresh_interval > 0:
+            self.refresh_thread = threading.Thread(target=self.refresh_loop, daemon=True)
+            self.refresh_thread.start()
+
+    def refresh_loop(self):
+        while not self.stop_event.wait(self.refresh_interval):
+            for client in list(self.clients):
+                try:
+                    self.load(client, max_age=self.refresh_interval)
+                except Exception as err:
+                    self.logger.error(f"[MarketMetadataCache] Could not refresh markets for {client.id}, reason: {err}")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.refresh_thread is not None:
+            self.refresh_thread.join()
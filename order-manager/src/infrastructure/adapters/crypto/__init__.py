@@ -2,5 +2,7 @@ from .binance import (
     BinanceAdapter, 
     BinanceSimpleOrderAdapter, 
     BinanceFuturesAdapter,
-    BinanceFuturesOrderAdapter
-)
\ No newline at end of file
+    BinanceFuturesOrderAdapter,
+    BinanceAsyncAdapter
+)
+from .async_session_manager import AsyncSessionManager
\ No newline at end of file
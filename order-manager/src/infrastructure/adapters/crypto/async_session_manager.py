@@ -0,0 +1,40 @@
+import asyncio
+import os
+import ssl
+import weakref
+
+import aiohttp
+import certifi
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class AsyncSessionManager:
+    """
+    One aiohttp session per event loop, shared by every async exchange
+    client on it so they reuse one connection pool (and its keep-alive
+    connections to the venue) instead of opening their own.
+    """
+    _sessions = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get_session(cls) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = cls._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=ssl.create_default_context(cafile=certifi.where()),
+                limit=int(os.environ.get(f"EXCHANGE_MAX_CONNECTIONS_{ENV}", 100)),
+                ttl_dns_cache=300
+            )
+            session = cls._sessions[loop] = aiohttp.ClientSession(connector=connector)
+        return session
+
+    @classmethod
+    async def close_session(cls):
+        session = cls._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
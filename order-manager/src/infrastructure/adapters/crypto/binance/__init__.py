@@ -1,4 +1,5 @@
 from .binance_adapter import BinanceAdapter
 from .binance_simple_order import BinanceSimpleOrderAdapter
 from .binance_futures_adapter import BinanceFuturesAdapter
-from .binance_futures_order import BinanceFuturesOrderAdapter
\ No newline at end of file
+from .binance_futures_order import BinanceFuturesOrderAdapter
+from .binance_async_adapter import BinanceAsyncAdapter
\ No newline at end of file
@@ -51,7 +51,7 @@ class BinanceAdapter(OrderAdapter):
         try:
             binance_order = self.transform_order(order_data)
             order = self.client.create_order(**binance_order)
-            self.logger.info(f"Order was sent to {self.provider}: {order}")
+            self.logger.info("Order was sent to %s: %s", self.provider, order)
             return order["info"]["orderId"]
         except (requests.RequestException, ValueError, KeyError) as err:
             msg = f"Could not send order to {self.provider}, reason: {err}"
@@ -68,9 +68,9 @@ class BinanceAdapter(OrderAdapter):
             if not symbol:
                 raise ValueError("Missing required argument: 'symbol'")
             order = self.client.fetch_order(id=order_id, symbol=symbol)
-            self.logger.debug(f"Order retrieved from {self.provider}: {order}")
+            self.logger.debug("Order retrieved from %s: %s", self.provider, order)
             processed_order = self.transform_get_order(order["info"])
-            self.logger.info(f"Order processed from {self.provider}: {order}")
+            self.logger.info("Order processed from %s: %s", self.provider, order)
             return processed_order
         except Exception as err:
             msg = f"Could not get order from {self.provider}, reason: {err}"
@@ -80,7 +80,7 @@ class BinanceAdapter(OrderAdapter):
     def get_open_orders(self) -> list[dict]:
         try:
             open_orders = self.client.fetch_open_orders()
-            self.logger.info(f"Open orders retrieved from Binance: {open_orders}")
+            self.logger.info("Open orders retrieved from Binance: %s", open_orders)
             return open_orders
         except Exception as err:
             self.logger.error(f"Could not retrive open orders from {self.provider}, reason: {err}")
@@ -0,0 +1,130 @@
+import asyncio
+import copy
+import os
+
+import ccxt
+import ccxt.async_support
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.order_adapter import (
+    AsyncOrderAdapter,
+    SendOrderError,
+    GetOrderError,
+    CancelOrderError
+)
+from src.infrastructure.adapters.crypto.async_session_manager import AsyncSessionManager
+from src.infrastructure.adapters.crypto.burst_throttler import BurstThrottler
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class BinanceAsyncAdapter(AsyncOrderAdapter):
+    """
+    Non blocking Binance client on ccxt.async_support, for either a spot or
+    a futures adapter. Credentials, urls (sandbox, endpoint overrides),
+    options, loaded markets and order transforms come from the sync adapter
+    it wraps. The client runs on the serving event loop and shares its
+    aiohttp session with every other async exchange client.
+
+    Requests keep ccxt's average rate limit, but BINANCE_RATE_LIMIT_BURST_{ENV}
+    cost units (a futures order costs 4) can go out at once, so a burst of
+    hedges is not spaced 200ms apart.
+    """
+    def __init__(self, order_adapter, logger = LoggerAdapter().get_logger(), burst: float = None):
+        self.order_adapter = order_adapter
+        self.logger = logger
+        self.provider = order_adapter.provider
+        self.burst = float(burst or os.environ.get(f"BINANCE_RATE_LIMIT_BURST_{ENV}", 40))
+
+        self.client: ccxt.async_support.binance = None
+        self.source_markets: dict = None
+
+    def build_client(self) -> ccxt.async_support.binance:
+        source = self.order_adapter.client
+        client = ccxt.async_support.binance({
+            'apiKey': source.apiKey,
+            'secret': source.secret,
+            'timeout': source.timeout,
+            'enableRateLimit': source.enableRateLimit,
+            'session': AsyncSessionManager.get_session(),
+            'asyncio_loop': asyncio.get_running_loop(),
+            'timeout_on_exit': 0
+        })
+        client.throttler = BurstThrottler(client.tokenBucket, capacity=self.burst)
+        client.options = copy.deepcopy(source.options)
+        client.urls = copy.deepcopy(source.urls)
+        self.source_markets = None
+        self.sync_markets(client)
+        return client
+
+    def sync_markets(self, client):
+        """
+        Follows the markets the sync client loaded or had refreshed by the
+        market cache, ccxt would otherwise load them again on the first order.
+        """
+        source = self.order_adapter.client
+        if source.markets and source.markets is not self.source_markets:
+            client.set_markets(source.markets, source.currencies)
+            self.source_markets = source.markets
+
+    def get_client(self) -> ccxt.async_support.binance:
+        if self.client is None or self.client.asyncio_loop is not asyncio.get_running_loop():
+            if self.client is not None:
+                # Its loop is gone along with that loop's session.
+                self.client.session = None
+            self.client = self.build_client()
+        elif self.order_adapter.client.markets is not self.source_markets:
+            self.sync_markets(self.client)
+        return self.client
+
+    async def close(self):
+        if self.client is not None:
+            client, self.client = self.client, None
+            await client.close()
+
+    async def send_order(self, order_data: dict) -> str:
+        try:
+            binance_order = self.order_adapter.transform_order(order_data)
+            order = await self.get_client().create_order(**binance_order)
+            self.logger.info("Order was sent to %s: %s", self.provider, order)
+            return order["info"]["orderId"]
+        except (ccxt.NetworkError, ValueError, KeyError) as err:
+            msg = f"Could not send order to {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise SendOrderError(msg) from err
+        except Exception as err:
+            msg = f"Could not send order to {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise
+
+    async def get_order(self, order_id: str, **kwargs) -> dict:
+        try:
+            symbol = kwargs.get("symbol")
+            if not symbol:
+                raise ValueError("Missing required argument: 'symbol'")
+            order = await self.get_client().fetch_order(id=order_id, symbol=symbol)
+            self.logger.debug("Order retrieved from %s: %s", self.provider, order)
+            return self.order_adapter.transform_get_order(order["info"])
+        except Exception as err:
+            msg = f"Could not get order from {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise GetOrderError(msg) from err
+
+    async def update_order(self, order_id: str, **kwargs):
+        return None
+
+    async def cancel_order(self, order_id: str, **kwargs) -> bool:
+        try:
+            symbol = kwargs.get("symbol")
+            if not symbol:
+                raise ValueError("Missing required argument: 'symbol'")
+            response = await self.get_client().cancel_order(id=order_id, symbol=symbol)
+            self.logger.info(f"Order with id: {order_id} was successfully cancelled on {self.provider}")
+            return response
+        except Exception as err:
+            msg = f"Could not cancel order from {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise CancelOrderError(msg) from err
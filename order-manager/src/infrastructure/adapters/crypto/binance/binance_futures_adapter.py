@@ -1,5 +1,6 @@
 import os
 import requests
+from urllib.parse import urlparse
 
 import ccxt
 from dotenv import load_dotenv
@@ -41,6 +42,20 @@ class BinanceFuturesAdapter(OrderAdapter):
         self.client.options["warnOnFetchOpenOrdersWithoutSymbol"] = False
         if ENV == "DEV":
             self.client.set_sandbox_mode(True)
+        if self.endpoint:
+            self.use_endpoint(self.endpoint)
+
+    def use_endpoint(self, endpoint: str) -> None:
+        """
+        Sends the futures REST calls to endpoint (e.g. https://testnet.binancefuture.com/fapi,
+        a proxy or a local stand-in) in place of the ccxt defaults.
+        """
+        base_url = endpoint.rstrip("/")
+        api_urls = self.client.urls["api"]
+        for name, url in api_urls.items():
+            path = urlparse(url).path
+            if name.startswith("fapi") and path.startswith("/fapi/"):
+                api_urls[name] = base_url + path[len("/fapi"):]
 
     def transform_order(self, order_data: str):
         raise NotImplementedError
@@ -52,7 +67,7 @@ class BinanceFuturesAdapter(OrderAdapter):
         try:
             binance_order = self.transform_order(order_data)
             order = self.client.create_order(**binance_order)
-            self.logger.info(f"Order was sent to {self.provider}: {order}")
+            self.logger.info("Order was sent to %s: %s", self.provider, order)
             return order["info"]["orderId"]
         except (requests.RequestException, ValueError, KeyError) as err:
             msg = f"Could not send order to {self.provider}, reason: {err}"
@@ -69,9 +84,9 @@ class BinanceFuturesAdapter(OrderAdapter):
             if not symbol:
                 raise ValueError("Missing required argument: 'symbol'")
             order = self.client.fetch_order(id=order_id, symbol=symbol)
-            self.logger.debug(f"Order retrieved from {self.provider}: {order}")
+            self.logger.debug("Order retrieved from %s: %s", self.provider, order)
             processed_order = self.transform_get_order(order["info"])
-            self.logger.info(f"Order processed from {self.provider}: {order}")
+            self.logger.info("Order processed from %s: %s", self.provider, order)
             return processed_order
         except Exception as err:
             msg = f"Could not get order from {self.provider}, reason: {err}"
@@ -81,7 +96,7 @@ class BinanceFuturesAdapter(OrderAdapter):
     def get_open_orders(self) -> list[dict]:
         try:
             open_orders = self.client.fetch_open_orders()
-            self.logger.info(f"Open orders retrieved from Binance: {open_orders}")
+            self.logger.info("Open orders retrieved from Binance: %s", open_orders)
             return open_orders
         except Exception as err:
             self.logger.error(f"Could not retrive open orders from {self.provider}, reason: {err}")
@@ -0,0 +1,29 @@
+import asyncio
+import time
+
+
+class BurstThrottler:
+    """
+    Drop-in for ccxt's async Throttler with the same average rate but a
+    bucket that also refills while idle, so up to `capacity` cost units go
+    out at once after a quiet period. ccxt's own looper resets its clock on
+    every restart and never builds up more than one request's worth.
+
+    Like ccxt, a request passes as soon as the bucket is not in debt and then
+    takes its cost, later requests wait until the debt is repaid.
+    """
+    def __init__(self, token_bucket: dict, capacity: float):
+        self.refill_rate = token_bucket["refillRate"]  # cost units per ms
+        self.default_cost = token_bucket.get("cost", 1)
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic() * 1000
+
+    async def __call__(self, cost: float = None):
+        now = time.monotonic() * 1000
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+        debt = -self.tokens
+        self.tokens -= self.default_cost if cost is None else cost
+        if debt > 0:
+            await asyncio.sleep(debt / self.refill_rate / 1000)
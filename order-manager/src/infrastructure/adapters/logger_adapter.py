@@ -1,27 +1,212 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
 
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+class CallSiteRateLimitFilter(logging.Filter):
+    """
+    Lets through at most `rate_limit` records per second from each call site
+    and then one in `sample_every`. Warnings and errors always pass. The next
+    record that passes carries the number suppressed before it.
+    """
+    def __init__(self, rate_limit: int, sample_every: int):
+        super().__init__()
+        self.rate_limit = rate_limit
+        self.sample_every = sample_every
+        # (pathname, lineno) -> [window start, passed in window, suppressed, seen over limit]
+        self.call_sites: dict = {}
+        self.suppressed_total = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        now = record.created
+        key = (record.pathname, record.lineno)
+        state = self.call_sites.get(key)
+        if state is None or now - state[0] >= 1:
+            state = self.call_sites[key] = [now, 0, state[2] if state else 0, 0]
+
+        if state[1] < self.rate_limit:
+            state[1] += 1
+        else:
+            state[3] += 1
+            if self.sample_every <= 0 or state[3] % self.sample_every:
+                state[2] += 1
+                self.suppressed_total += 1
+                return False
+
+        if state[2]:
+            record.suppressed = state[2]
+            state[2] = 0
+        return True
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records without formatting them, message interpolation and
+    reprs of the arguments happen on the listener thread. Arguments are
+    read after the call returns, so callers must not mutate them.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LoggerAdapter.dropped_records += 1
+
+
+class SuppressedCountFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            message = f"{message} [{suppressed} similar suppressed]"
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "process": record.process,
+            "message": record.getMessage()
+        }
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
 
 
 class LoggerAdapter:
-    def __init__(self, 
-                 level=logging.INFO):
+    """
+    Process-wide logger. Records go through a bounded queue to a listener
+    thread that owns the terminal and the optional JSON-lines file, so call
+    sites never block on I/O. Per call site rate limiting and sampling keep
+    chatty INFO/DEBUG logs from flooding the queue.
+    """
+    listener: logging.handlers.QueueListener = None
+    dropped_records = 0
+    _lock = threading.Lock()
+
+    def __init__(self,
+                 level=logging.INFO,
+                 rate_limit: int = None,
+                 sample_every: int = None,
+                 json_path: str = None):
         self.level = level
+        self.rate_limit = int(rate_limit or os.environ.get(f"LOG_RATE_LIMIT_{ENV}", 100))
+        self.sample_every = int(sample_every or os.environ.get(f"LOG_SAMPLE_EVERY_{ENV}", 100))
+        self.json_path = json_path or os.environ.get(f"LOG_JSON_PATH_{ENV}")
+        self.queue_size = int(os.environ.get(f"LOG_QUEUE_SIZE_{ENV}", 100000))
 
         self.logger = None
 
         self._start_logger()
 
+    def _get_sink_handlers(self) -> list:
+        formatter = SuppressedCountFormatter(
+            '%(asctime)s - %(levelname)s - %(message)s')
+        handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
+        handlers = [handler]
+
+        if self.json_path:
+            json_handler = logging.FileHandler(self.json_path)
+            json_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(json_handler)
+        return handlers
+
+    def _start_listener(self, queue_handler: DeferredQueueHandler):
+        listener = logging.handlers.QueueListener(
+            queue_handler.queue, *self._get_sink_handlers(), respect_handler_level=True
+        )
+        listener.start()
+        LoggerAdapter.listener = listener
+
     def _start_logger(self):
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(self.level)
         self.logger.propagate = False
 
-        if not self.logger.handlers:
-            formatter = logging.Formatter(
-                '%(asctime)s - %(levelname)s - %(message)s')
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-    
+        with LoggerAdapter._lock:
+            if not self.logger.handlers:
+                queue_handler = DeferredQueueHandler(queue.Queue(self.queue_size))
+                queue_handler.addFilter(CallSiteRateLimitFilter(self.rate_limit, self.sample_every))
+                self.logger.addHandler(queue_handler)
+                self._start_listener(queue_handler)
+                atexit.register(LoggerAdapter.stop)
+
+                def restart_in_child():
+                    # The listener thread does not survive fork, children get their own.
+                    LoggerAdapter._lock = threading.Lock()
+                    queue_handler.queue = queue.Queue(self.queue_size)
+                    self._start_listener(queue_handler)
+
+                os.register_at_fork(after_in_child=restart_in_child)
+
+    @staticmethod
+    def stop(timeout: float = 5.0):
+        """
+        Drain the queue and stop the listener thread.
+        """
+        listener = LoggerAdapter.listener
+        if not listener or not listener._thread:
+            return
+        # QueueListener.stop() enqueues its sentinel with put_nowait, which
+        # raises on a full queue, so the sentinel goes in here instead.
+        try:
+            listener.queue.put(listener._sentinel, timeout=timeout)
+        except queue.Full:
+            # The listener is stuck behind a slow sink, handle the backlog on this thread.
+            LoggerAdapter.drain(listener)
+            try:
+                listener.queue.put_nowait(listener._sentinel)
+            except queue.Full:
+                return
+        listener._thread.join()
+        listener._thread = None
+
+    @staticmethod
+    def drain(listener: logging.handlers.QueueListener):
+        while True:
+            try:
+                record = listener.queue.get_nowait()
+            except queue.Empty:
+                return
+            listener.handle(record)
+            listener.queue.task_done()
+
+    @staticmethod
+    def flush(timeout: float = 1.0):
+        listener = LoggerAdapter.listener
+        if not listener:
+            return
+        deadline = time.monotonic() + timeout
+        while not listener.queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
     def get_logger(self):
-        return self.logger
\ No newline at end of file
+        return self.logger
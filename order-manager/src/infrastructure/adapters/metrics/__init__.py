@@ -0,0 +1,3 @@
+from .latency_histogram import LatencyHistogram
+from .latency_tracker import LatencyTracker, TS_EXCHANGE, TS_RECEIVED, TS_PUBLISHED
+from .metrics_registry import MetricsRegistry, Counter, Gauge, Histogram
\ No newline at end of file
@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import time
+import weakref
+
+from dotenv import load_dotenv
+
+from src.infrastructure.adapters.metrics.latency_histogram import LatencyHistogram
+from src.infrastructure.adapters.metrics.metrics_registry import MetricsRegistry, format_labels
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+# Timestamps carried under "ts" in iNAV payloads, epoch seconds.
+TS_EXCHANGE = "exchange"
+TS_RECEIVED = "received"
+TS_PUBLISHED = "published"
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+_trackers = weakref.WeakSet()
+
+
+def render_latency_metrics() -> list:
+    """
+    Every live tracker's stages as one summary family, for the metrics registry.
+    """
+    name = "latency_stage_microseconds"
+    lines = [f"# HELP {name} Latency between pipeline stages", f"# TYPE {name} summary"]
+    for tracker in list(_trackers):
+        for stage, histogram in list(tracker.histograms.items()):
+            labels = ("tracker", "stage")
+            values = (tracker.name, stage)
+            for quantile, value in zip(QUANTILES, histogram.get_percentiles(QUANTILES)):
+                if value is not None:
+                    lines.append(f"{name}{format_labels(labels + ('quantile', ), values + (str(quantile), ))} {value}")
+            lines.append(f"{name}_sum{format_labels(labels, values)} {histogram.total}")
+            lines.append(f"{name}_count{format_labels(labels, values)} {histogram.count}")
+    return lines
+
+
+class LatencyTracker:
+    """
+    Per stage latency histograms for one component. Stages are measured
+    between epoch timestamps, so stages that span hosts include clock skew.
+
+    report() logs the stats and stores them under `latency:{name}` so the
+    other service can read them. The key expires after ttl seconds, trackers
+    named per algo run leave nothing behind once the run ends. Disabled trackers record nothing and callers
+    leave timestamps out of payloads, replays stay deterministic that way.
+    """
+    def __init__(
+        self,
+        logger: logging.Logger,
+        name: str,
+        store=None,
+        enabled: bool = None,
+        report_interval: float = 60,
+        ttl: int = None
+    ):
+        self.logger = logger
+        self.name = name
+        self.store = store
+        self.enabled = (
+            enabled if enabled is not None
+            else os.environ.get(f"LATENCY_TRACKING_{ENV}", "true").lower() == "true"
+        )
+        self.report_interval = report_interval
+        self.ttl = int(ttl or os.environ.get(f"LATENCY_STATS_TTL_{ENV}", 3600))
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.last_report_time = time.monotonic()
+        if self.enabled:
+            _trackers.add(self)
+            MetricsRegistry.get_default().add_collector(render_latency_metrics)
+
+    def get_histogram(self, stage: str) -> LatencyHistogram:
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms.setdefault(stage, LatencyHistogram())
+        return histogram
+
+    def record(self, stage: str, started_at: float, finished_at: float):
+        if not self.enabled or started_at is None or finished_at is None:
+            return
+        self.get_histogram(stage).record((finished_at - started_at) * 1_000_000)
+
+    def get_stats(self) -> dict:
+        return {stage: histogram.get_stats() for stage, histogram in self.histograms.items()}
+
+    def report(self):
+        if not self.histograms:
+            return
+        stats = self.get_stats()
+        self.last_report_time = time.monotonic()
+        self.logger.info(f"[LatencyTracker] {self.name}: {stats}")
+        if self.store is not None:
+            self.store.set_key(f"latency:{self.name}", json.dumps(stats), expire=self.ttl)
+
+    def maybe_report(self):
+        if time.monotonic() - self.last_report_time >= self.report_interval:
+            self.report()
@@ -0,0 +1,227 @@
+import bisect
+import os
+import threading
+from array import array
+from typing import Callable, List, Tuple
+
+# Seconds, for request and round trip durations.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+OVERFLOW_LABEL = "other"
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{escape_label_value(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """
+    A metric family whose series live in preallocated arrays. Each label
+    combination gets a slot on first use, past max_series new combinations
+    share one series with every label set to "other".
+    """
+    kind: str = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), max_series: int = 256):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self.series: dict = {}
+        self._lock = threading.Lock()
+
+    def get_index(self, labelvalues: tuple) -> int:
+        index = self.series.get(labelvalues)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self.series.get(labelvalues)
+            if index is None:
+                if len(self.series) < self.max_series - 1:
+                    index = self.series[labelvalues] = len(self.series)
+                else:
+                    overflow = (OVERFLOW_LABEL, ) * len(self.labelnames)
+                    index = self.series.setdefault(overflow, self.max_series - 1)
+            return index
+
+    def labels(self, *labelvalues) -> "MetricChild":
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labelvalues}")
+        return MetricChild(self, self.get_index(tuple(str(value) for value in labelvalues)))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = sorted(self.series.items(), key=lambda item: item[1])
+        for labelvalues, index in series:
+            lines.extend(self.render_series(labelvalues, index))
+        return lines
+
+    def render_series(self, labelvalues: tuple, index: int) -> List[str]:
+        raise NotImplementedError
+
+
+class MetricChild:
+    __slots__ = ("metric", "index")
+
+    def __init__(self, metric: Metric, index: int):
+        self.metric = metric
+        self.index = index
+
+    def inc(self, amount: float = 1):
+        self.metric.inc_index(self.index, amount)
+
+    def dec(self, amount: float = 1):
+        self.metric.inc_index(self.index, -amount)
+
+    def set(self, value: float):
+        self.metric.set_index(self.index, value)
+
+    def observe(self, value: float):
+        self.metric.observe_index(self.index, value)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values = array("d", [0.0] * self.max_series)
+        if not self.labelnames:
+            self.get_index(())
+
+    def inc_index(self, index: int, amount: float = 1):
+        with self._lock:
+            self.values[index] += amount
+
+    def inc(self, amount: float = 1):
+        self.inc_index(0, amount)
+
+    def get_value(self, *labelvalues) -> float:
+        return self.values[self.get_index(tuple(str(value) for value in labelvalues))]
+
+    def render_series(self, labelvalues: tuple, index: int) -> List[str]:
+        return [f"{self.name}{format_labels(self.labelnames, labelvalues)} {format_value(self.values[index])}"]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set_index(self, index: int, value: float):
+        self.values[index] = value
+
+    def set(self, value: float):
+        self.set_index(0, value)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: tuple = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Per series: one count per bucket plus +Inf, non cumulative.
+        self.row_size = len(self.buckets) + 1
+        self.counts = array("Q", [0] * (self.row_size * self.max_series))
+        self.sums = array("d", [0.0] * self.max_series)
+        if not self.labelnames:
+            self.get_index(())
+
+    def observe_index(self, index: int, value: float):
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index * self.row_size + bucket] += 1
+            self.sums[index] += value
+
+    def observe(self, value: float):
+        self.observe_index(0, value)
+
+    def render_series(self, labelvalues: tuple, index: int) -> List[str]:
+        lines = []
+        names = self.labelnames + ("le", )
+        cumulative = 0
+        row = self.counts[index * self.row_size:(index + 1) * self.row_size]
+        for bound, count in zip(self.buckets + (float("inf"), ), row):
+            cumulative += count
+            lines.append(f"{self.name}_bucket{format_labels(names, labelvalues + (format_value(bound), ))} {cumulative}")
+        labels = format_labels(self.labelnames, labelvalues)
+        lines.append(f"{self.name}_sum{labels} {format_value(self.sums[index])}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process wide metrics, rendered in the Prometheus text exposition format.
+    Collectors are callables returning extra exposition lines, read at
+    scrape time (e.g. latency histogram quantiles, pool stats).
+    """
+    default: "MetricsRegistry" = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+        self.collectors: List[Callable[[], List[str]]] = []
+        self._register_lock = threading.Lock()
+
+    @classmethod
+    def get_default(cls) -> "MetricsRegistry":
+        if cls.default is None:
+            with cls._lock:
+                if cls.default is None:
+                    cls.default = MetricsRegistry()
+        return cls.default
+
+    @classmethod
+    def reset_default(cls):
+        # Children start from empty metrics instead of the parent's copy.
+        cls._lock = threading.Lock()
+        cls.default = None
+
+    def register(self, metric: Metric) -> Metric:
+        with self._register_lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered with another type or labels")
+                return existing
+            self.metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = (), **kwargs) -> Counter:
+        return self.register(Counter(name, documentation, labelnames, **kwargs))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = (), **kwargs) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, **kwargs))
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), **kwargs) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, **kwargs))
+
+    def add_collector(self, collector: Callable[[], List[str]]):
+        if collector not in self.collectors:
+            self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self.metrics.values()):
+            lines.extend(metric.render())
+        for collector in list(self.collectors):
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+os.register_at_fork(after_in_child=MetricsRegistry.reset_default)
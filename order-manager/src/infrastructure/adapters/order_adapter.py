@@ -20,6 +20,31 @@ class OrderAdapter(ABC):
         pass
 
 
+class AsyncOrderAdapter(ABC):
+    """
+    OrderAdapter contract for the async serving path, calls must not block
+    the event loop.
+    """
+    @abstractmethod
+    async def send_order(self, order_data: dict):
+        pass
+
+    @abstractmethod
+    async def get_order(self, order_id: str, **kwargs):
+        pass
+
+    @abstractmethod
+    async def update_order(self, order_id: str, **kwargs):
+        pass
+
+    @abstractmethod
+    async def cancel_order(self, order_id: str, **kwargs) -> bool:
+        pass
+
+    async def close(self):
+        pass
+
+
 class SendOrderError(Exception):
     pass
 
@@ -1 +1,5 @@
-from .redis_adapter import RedisAdapter
\ No newline at end of file
+from .redis_adapter import RedisAdapter, RedisBatchError
+from .local_redis import LocalRedis
+from .codecs import MessageCodec, ContentType, CodecError
+from .redis_connection_manager import RedisConnectionManager
+from .redis_subscriber import RedisSubscriber
\ No newline at end of file
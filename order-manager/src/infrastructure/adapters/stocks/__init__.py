@@ -1 +1 @@
-from .flowa import FlowaAdapter, FlowaSimpleOrderAdapter
\ No newline at end of file
+from .flowa import FlowaAdapter, FlowaSimpleOrderAdapter, FlowaAsyncAdapter
\ No newline at end of file
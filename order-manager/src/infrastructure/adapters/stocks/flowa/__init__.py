@@ -1,2 +1,3 @@
 from .flowa_adapter import FlowaAdapter
-from .flowa_simple_order import FlowaSimpleOrderAdapter
\ No newline at end of file
+from .flowa_simple_order import FlowaSimpleOrderAdapter
+from .flowa_async_adapter import FlowaAsyncAdapter
\ No newline at end of file
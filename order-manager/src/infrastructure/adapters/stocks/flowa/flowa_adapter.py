@@ -78,7 +78,7 @@ class FlowaAdapter(OrderAdapter):
             order = response.json()
             if not order["Success"]:
                 raise SendOrderError(f'Failed to send order, reason: {order["Error"]}')
-            self.logger.info(f"Order was sent to {self.provider}: {order}")
+            self.logger.info("Order was sent to %s: %s", self.provider, order)
             return order["StrategyId"]
         except (httpx.HTTPError, httpx.HTTPStatusError, ValueError, KeyError) as err:
             msg = f"Could not send order to {self.provider}, reason: {err}"
@@ -0,0 +1,142 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+
+from src.infrastructure.adapters.order_adapter import (
+    AsyncOrderAdapter,
+    SendOrderError,
+    GetOrderError,
+    CancelOrderError,
+    UpdateOrderError
+)
+from src.infrastructure.adapters.stocks.flowa.flowa_adapter import FlowaAdapter
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+
+class FlowaAsyncAdapter(AsyncOrderAdapter):
+    """
+    Non blocking Flowa client. Credentials, endpoint and the order transforms
+    come from the sync adapter it wraps, requests go through one
+    httpx.AsyncClient opened on the serving event loop.
+    """
+    def __init__(self, order_adapter: FlowaAdapter, logger = LoggerAdapter().get_logger()):
+        self.order_adapter = order_adapter
+        self.logger = logger
+        self.provider = order_adapter.provider
+
+        self.client: httpx.AsyncClient = None
+        self.token = None
+        self.refreshed_token_time = None
+        self.token_lock: asyncio.Lock = None
+
+    @property
+    def url(self) -> str:
+        return f"{self.order_adapter.endpoint}/{self.order_adapter.suffix}"
+
+    def get_client(self) -> httpx.AsyncClient:
+        if self.client is None:
+            self.client = httpx.AsyncClient(timeout=10.0)
+            self.token_lock = asyncio.Lock()
+        return self.client
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def get_token(self) -> str:
+        client = self.get_client()
+        async with self.token_lock:
+            if self.token is None or datetime.now() - self.refreshed_token_time > timedelta(hours=8):
+                token_request = {
+                    'grant_type': 'client_credentials',  # do not change
+                    'scope': 'atgapi',    # do not change
+                    'client_id': self.order_adapter.client_id,
+                    'client_secret': self.order_adapter.api_secret
+                }
+                response = await client.post(self.order_adapter.token_endpoint, data=token_request)
+                response.raise_for_status()
+                self.token = response.json()['access_token']
+                self.logger.info(f"{self.provider} token was refreshed")
+                self.refreshed_token_time = datetime.now()
+        return self.token
+
+    async def mount_request_headers(self) -> dict:
+        return {
+            'Content-Type': 'application/json',
+            'Authorization': 'Bearer ' + await self.get_token()
+        }
+
+    async def send_order(self, order_data: dict) -> str:
+        try:
+            flowa_order = self.order_adapter.transform_order(order_data)
+            response = await self.get_client().post(
+                url=self.url,
+                json=flowa_order,
+                headers=await self.mount_request_headers()
+            )
+            response.raise_for_status()
+            order = response.json()
+            if not order["Success"]:
+                raise SendOrderError(f'Failed to send order, reason: {order["Error"]}')
+            self.logger.info("Order was sent to %s: %s", self.provider, order)
+            return order["StrategyId"]
+        except (httpx.HTTPError, ValueError, KeyError) as err:
+            msg = f"Could not send order to {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise SendOrderError(msg) from err
+        except Exception as err:
+            msg = f"Could not send order to {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise
+
+    async def get_order(self, order_id: str, **kwargs) -> dict:
+        try:
+            response = await self.get_client().get(
+                f'{self.url}/{order_id}',
+                headers=await self.mount_request_headers()
+            )
+            response.raise_for_status()
+            return self.order_adapter.transform_get_order(response.json())
+        except Exception as err:
+            msg = f"Could not get order from {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise GetOrderError(msg) from err
+
+    async def update_order(self, order_id: str, **kwargs):
+        try:
+            update_params = self.order_adapter.transform_update_order({**kwargs})
+            response = await self.get_client().put(
+                f'{self.url}/{order_id}',
+                headers=await self.mount_request_headers(),
+                json=update_params
+            )
+            response.raise_for_status()
+            order = response.json()
+            if not order["Success"]:
+                raise UpdateOrderError(f'Failed to update order, reason: {order["Error"]}')
+            self.logger.info(f"Order with id: {order_id} was successfully updated on {self.provider}")
+        except (httpx.HTTPError, ValueError, KeyError) as err:
+            msg = f"Could not update order to {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise UpdateOrderError(msg) from err
+        except Exception as err:
+            msg = f"Could not update order to {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise
+
+    async def cancel_order(self, order_id: str, **kwargs) -> bool:
+        try:
+            response = await self.get_client().delete(
+                f'{self.url}/{order_id}',
+                headers=await self.mount_request_headers()
+            )
+            response.raise_for_status()
+            self.logger.info(f"Order with id: {order_id} was successfully cancelled on {self.provider}")
+            return response.json()
+        except Exception as err:
+            msg = f"Could not cancel order from {self.provider}, reason: {err}"
+            self.logger.exception(msg)
+            raise CancelOrderError(msg) from err
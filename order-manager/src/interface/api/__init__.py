@@ -1,9 +1,10 @@
-from flask import Flask
+from flask import Flask, Response
 from flasgger import Swagger
 from flask_cors import CORS
 
 from src.interface.api.routes import bp_orders, bp_algos
 from src.interface.api.containers import Container
+from src.infrastructure.adapters.metrics import MetricsRegistry
 
 def create_app():
     app = Flask(__name__)
@@ -44,6 +45,19 @@ def create_app():
         """
         return {"message": "Status OK"}, 200
 
+    @app.route("/metrics", methods=["GET"])
+    def metrics():
+        """
+        Metrics endpoint, Prometheus text exposition format
+        ---
+        tags:
+            - Healthcheck
+        responses:
+            200:
+                description: Metrics of the API process
+        """
+        return Response(MetricsRegistry.get_default().render(), mimetype="text/plain; version=0.0.4")
+
     app.register_blueprint(bp_orders, url_prefix="/api/v1")
     app.register_blueprint(bp_algos, url_prefix="/api/v1")
 
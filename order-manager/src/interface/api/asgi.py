@@ -0,0 +1,42 @@
+import os
+import contextlib
+
+from a2wsgi import WSGIMiddleware
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.routing import Mount
+
+from src.interface.api import create_app
+from src.interface.api.routes import build_async_order_routes
+
+load_dotenv()
+
+ENV = os.environ.get("ENV", "DEV")
+
+
+def create_asgi_app():
+    """
+    Order endpoints served by async handlers on the event loop, everything
+    else (algos, healthcheck, metrics and Swagger) by the Flask app, which
+    runs on a thread pool of WSGI_WORKERS_{ENV} threads.
+    """
+    flask_app = create_app()
+    container = flask_app.container
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        yield
+        await container.async_order_service().close()
+
+    app = Starlette(
+        routes=[
+            *build_async_order_routes(url_prefix="/api/v1"),
+            Mount("/", app=WSGIMiddleware(flask_app, workers=int(os.environ.get(f"WSGI_WORKERS_{ENV}", 10))))
+        ],
+        middleware=[Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])],
+        lifespan=lifespan
+    )
+    app.state.container = container
+    return app
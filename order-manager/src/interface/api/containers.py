@@ -2,6 +2,7 @@ from dependency_injector import containers, providers
 
 from src.infrastructure.adapters.logger_adapter import LoggerAdapter
 from src.application.orders.order_service import OrderService
+from src.application.orders.async_order_service import AsyncOrderService
 from src.application.algorithms.algo_service import AlgoService
 
 
@@ -13,6 +14,7 @@ class Container(containers.DeclarativeContainer):
             "src.interface.api.controllers.orders.get_requests",
             "src.interface.api.controllers.orders.cancel_requests",
             "src.interface.api.controllers.orders.update_requests",
+            "src.interface.api.controllers.orders.async_requests",
             "src.interface.api.controllers.algorithms.post_requests",
             "src.interface.api.controllers.algorithms.cancel_requests"
         ]
@@ -26,6 +28,11 @@ class Container(containers.DeclarativeContainer):
         logger=logger
     )
 
+    async_order_service = providers.Singleton(
+        AsyncOrderService,
+        logger=logger
+    )
+
     algo_service = providers.Singleton(
         AlgoService,
         logger=logger
@@ -1,4 +1,10 @@
 from .post_requests import send_order_request
 from .get_requests import get_order_request
 from .cancel_requests import cancel_order_request
-from .update_requests import update_order_request
\ No newline at end of file
+from .update_requests import update_order_request
+from .async_requests import (
+    async_send_order_request,
+    async_get_order_request,
+    async_cancel_order_request,
+    async_update_order_request
+)
\ No newline at end of file
@@ -0,0 +1,85 @@
+from dependency_injector.wiring import inject, Provide
+from starlette.responses import JSONResponse
+
+from src.application.orders.async_order_service import AsyncOrderService
+from src.infrastructure.adapters.order_adapter import (
+    SendOrderError,
+    GetOrderError,
+    CancelOrderError,
+    UpdateOrderError
+)
+from src.interface.api.containers import Container
+
+
+
+def error_response(message: str, status_code: int) -> JSONResponse:
+    return JSONResponse({"success": False, "message": message}, status_code=status_code)
+
+
+@inject
+async def async_send_order_request(
+    data: dict,
+    order_service: AsyncOrderService = Provide[Container.async_order_service]
+):
+    try:
+        data = await order_service.send_order(
+            exchange_name=data["exchange_name"],
+            strategy=data["strategy"],
+            order_data=data["order_data"]
+        )
+        return JSONResponse(data, status_code=200)
+    except SendOrderError as err:
+        return error_response(f"{err}", 400)
+    except Exception as err:
+        return error_response(f"Service could not compute order, reason: {err}", 500)
+
+
+@inject
+async def async_get_order_request(
+    data: dict,
+    order_service: AsyncOrderService = Provide[Container.async_order_service]
+):
+    try:
+        data = await order_service.get_order(**data)
+        return JSONResponse(data, status_code=200)
+    except GetOrderError as err:
+        return error_response(f"{err}", 400)
+    except Exception as err:
+        return error_response(f"Service could compute order, reason: {err}", 500)
+
+
+@inject
+async def async_cancel_order_request(
+    data: dict,
+    order_service: AsyncOrderService = Provide[Container.async_order_service]
+):
+    try:
+        data = {
+            "success": True,
+            "message": "Order was successfully cancelled",
+            "data": await order_service.cancel_order(**data)
+        }
+        return JSONResponse(data, status_code=200)
+    except CancelOrderError as err:
+        return error_response(f"{err}", 400)
+    except Exception as err:
+        return error_response(f"Service could compute order, reason: {err}", 500)
+
+
+@inject
+async def async_update_order_request(
+    data: dict,
+    order_service: AsyncOrderService = Provide[Container.async_order_service]
+):
+    try:
+        data = await order_service.update_order(
+            exchange_name=data["exchange_name"],
+            strategy=data["strategy"],
+            order_id=data["order_id"],
+            **data["order_data"]
+        )
+        return JSONResponse(data, status_code=200)
+    except UpdateOrderError as err:
+        return error_response(f"{err}", 400)
+    except Exception as err:
+        return error_response(f"Service could compute order, reason: {err}", 500)
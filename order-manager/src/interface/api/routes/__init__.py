@@ -1,2 +1,3 @@
 from .orders import bp_orders, send_order_endpoint
-from .algorithms import bp_algos, send_algo_endpoint
\ No newline at end of file
+from .algorithms import bp_algos, send_algo_endpoint
+from .async_orders import build_async_order_routes
\ No newline at end of file
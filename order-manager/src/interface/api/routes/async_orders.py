@@ -0,0 +1,51 @@
+from starlette.requests import Request
+from starlette.routing import Route
+
+from src.interface.api.controllers.orders.async_requests import (
+    async_send_order_request,
+    async_get_order_request,
+    async_cancel_order_request,
+    async_update_order_request,
+    error_response
+)
+
+
+# Same URLs, params and bodies as bp_orders, whose docstrings keep feeding
+# the Swagger spec. These take precedence when served through the ASGI app.
+
+
+def invalid_body_response(err: ValueError):
+    return error_response(f"Request body must be JSON, reason: {err}", 400)
+
+
+async def async_send_order_endpoint(request: Request):
+    try:
+        order_data = await request.json()
+    except ValueError as err:
+        return invalid_body_response(err)
+    return await async_send_order_request({**request.query_params, "order_data": order_data})
+
+
+async def async_get_order_endpoint(request: Request):
+    return await async_get_order_request(dict(request.query_params))
+
+
+async def async_cancel_order_endpoint(request: Request):
+    return await async_cancel_order_request(dict(request.query_params))
+
+
+async def async_update_order_endpoint(request: Request):
+    try:
+        order_data = await request.json()
+    except ValueError as err:
+        return invalid_body_response(err)
+    return await async_update_order_request({**request.query_params, "order_data": order_data})
+
+
+def build_async_order_routes(url_prefix: str = "") -> list:
+    return [
+        Route(f"{url_prefix}/send-order", async_send_order_endpoint, methods=["POST"]),
+        Route(f"{url_prefix}/get-order", async_get_order_endpoint, methods=["GET"]),
+        Route(f"{url_prefix}/cancel-order", async_cancel_order_endpoint, methods=["DELETE"]),
+        Route(f"{url_prefix}/update-order", async_update_order_endpoint, methods=["PUT"])
+    ]
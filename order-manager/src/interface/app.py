@@ -10,7 +10,22 @@ load_dotenv()
 
 ENV = os.environ.get("ENV", "DEV")
 
+# "asgi" serves the order endpoints async under uvicorn, "wsgi" runs the
+# Flask app alone on the Werkzeug development server.
+SERVER_MODE = os.environ.get(f"SERVER_MODE_{ENV}", "asgi").lower()
+PORT = int(os.environ.get(f"API_PORT_{ENV}", 5000))
+
 
 if __name__ == '__main__':
-    app = create_app()
-    app.run(debug=False, host="0.0.0.0")
\ No newline at end of file
+    if SERVER_MODE == "asgi":
+        import uvicorn
+
+        from src.interface.api.asgi import create_asgi_app
+
+        app = create_asgi_app()
+        app.state.container.async_order_service().load_markets()
+        uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="info")
+    else:
+        app = create_app()
+        app.container.order_service().load_markets()
+        app.run(debug=False, host="0.0.0.0", port=PORT)
@@ -1,9 +1,11 @@
 from .binance import (
     TestBinanceAdapter,
-    TestBinanceFuturesAdapter
+    TestBinanceFuturesAdapter,
+    TestBinanceAsyncAdapter
 )
 from .flowa import TestFlowaAdapter
 from .order_domain import TestSimpleOrder
-from .services import TestOrderService
-from .algorithms import TestSpreadCryptoETFAdapter, TestSpreadCryptoETF
-from .clients import TestOrderServiceClient
\ No newline at end of file
+from .services import TestOrderService, TestAsyncOrderApi
+from .algorithms import TestSpreadCryptoETFAdapter, TestSpreadCryptoETF, TestTickToTradeHarness
+from .clients import TestOrderServiceClient
+from .cache import TestMarketMetadataCache
\ No newline at end of file
@@ -1,2 +1,2 @@
 from .domain import *
-from .application import TestSpreadCryptoETFAdapter
\ No newline at end of file
+from .application import TestSpreadCryptoETFAdapter, TestTickToTradeHarness
\ No newline at end of file
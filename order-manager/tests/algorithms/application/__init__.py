@@ -1,2 +1,3 @@
 from .test_spread_crypto_etf_algorithm import TestSpreadCryptoETFAdapter
-from .test_algo_service import TestAlgoService
\ No newline at end of file
+from .test_algo_service import TestAlgoService
+from .test_tick_to_trade import TestTickToTradeHarness
\ No newline at end of file
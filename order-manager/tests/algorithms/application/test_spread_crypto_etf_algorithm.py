@@ -1,10 +1,15 @@
+import json
 import pytest
 import time
+import uuid
 
 from src.application.algorithms.spread_crypto_etf import SpreadCryptoETFAdapter
 from src.domain.algorithms.entities import SpreadCryptoETF
 from src.infrastructure.adapters.clients.order_service_client import OrderServiceClient
 from src.infrastructure.adapters import LoggerAdapter
+from src.infrastructure.adapters.cache.shared_value_cache import SharedValueCache
+from src.infrastructure.adapters.queue.local_redis import LocalRedis
+from src.infrastructure.adapters.queue.redis_adapter import RedisAdapter
 
 
 def make_algo(overrides: dict = None) -> SpreadCryptoETF:
@@ -73,6 +78,32 @@ class TestSpreadCryptoETFAdapter:
         assert order_placement_price_buy == 135
         assert order_placement_price_sell == 165
     
+    def test_fair_price_snapshot_falls_back_to_redis_when_cache_is_stale(self):
+        shared_cache = SharedValueCache(logger, name=f"test-{uuid.uuid4().hex[:8]}", slots=8, create=True)
+        message_service = RedisAdapter(logger, redis_db=LocalRedis())
+        message_service.set_key("inav:ETHE11", json.dumps({"inav": 51.2, "amount_of_underlying_asset": 0.01}))
+        message_service.set_key("pcf:ETHE11", json.dumps({"amount_of_underlying_asset": 0.012}))
+        application_algo = SpreadCryptoETFAdapter(
+            logger=logger,
+            algo=make_algo(),
+            order_service_client=OrderServiceClient(logger),
+            cancel_event="test",
+            shared_cache=shared_cache,
+            message_service=message_service,
+            inav_max_age=5,
+            pcf_max_age=60
+        )
+        try:
+            shared_cache.put("inav:ETHE11", 50.0, 0.01)
+            shared_cache.put("pcf:ETHE11", 0.011)
+            assert application_algo.get_fair_price_snapshot("ETHE11") == (50.0, 0.011)
+
+            application_algo.inav_max_age = application_algo.pcf_max_age = 0.001
+            time.sleep(0.01)
+            assert application_algo.get_fair_price_snapshot("ETHE11") == (51.2, 0.012)
+        finally:
+            shared_cache.unlink()
+
     def test_can_run_algo(self):
         self.application_algo.run_algo()
         time.sleep(120)
@@ -0,0 +1,24 @@
+from benchmarks.tick_to_trade import run_harness
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.infrastructure.adapters.queue import LocalRedis
+
+
+logger = LoggerAdapter().get_logger()
+
+
+class TestTickToTradeHarness:
+    def test_measures_amends_and_hedges_against_stand_ins(self):
+        results = run_harness(logger, rounds=3, warmup=1, timeout=10)
+
+        assert results["tick_to_amend"]["count"] == 3
+        assert results["fill_to_hedge"]["count"] == 3
+        assert results["tick_to_amend"]["p50_us"] > 0
+        assert results["algo"]["receive_to_submit"]["count"] == 4
+
+    def test_local_pubsub_stops_listening_after_last_unsubscribe(self):
+        pubsub = LocalRedis().pubsub()
+        pubsub.subscribe("inav-BITH11-binance", "order-1")
+        pubsub.unsubscribe("inav-BITH11-binance")
+        pubsub.unsubscribe("order-1")
+
+        assert [message["data"] for message in pubsub.listen()] == [1, 0]
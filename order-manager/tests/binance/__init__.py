@@ -1,2 +1,3 @@
 from .test_binance_adapter import TestBinanceAdapter
-from .test_binance_futures_adapter import TestBinanceFuturesAdapter
\ No newline at end of file
+from .test_binance_futures_adapter import TestBinanceFuturesAdapter
+from .test_binance_async_adapter import TestBinanceAsyncAdapter
\ No newline at end of file
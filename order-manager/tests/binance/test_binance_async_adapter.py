@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from benchmarks.exchange_stand_ins import ExchangeStandIns
+from benchmarks.tick_to_trade import configure_endpoints, restore_environment
+from src.infrastructure import BinanceFuturesOrderAdapter, BinanceSimpleOrderAdapter, LoggerAdapter
+from src.infrastructure.adapters.crypto import BinanceAsyncAdapter, AsyncSessionManager
+
+
+logger = LoggerAdapter().get_logger()
+
+
+class TestBinanceAsyncAdapter:
+    def setup_method(self):
+        self.stand_ins = ExchangeStandIns(logger)
+        self.stand_ins.start()
+        self.previous_environment = configure_endpoints(self.stand_ins, "http://127.0.0.1")
+        futures_adapter = BinanceFuturesOrderAdapter(logger=logger)
+        futures_adapter.client.options["fetchMarkets"] = {"types": ["linear"]}
+        futures_adapter.client.options["fetchCurrencies"] = False
+        self.binance_adapter = BinanceAsyncAdapter(futures_adapter, logger=logger)
+
+    def teardown_method(self):
+        restore_environment(self.previous_environment)
+        self.stand_ins.stop()
+
+    def run(self, coroutine_function):
+        async def run_and_close():
+            try:
+                return await coroutine_function()
+            finally:
+                await self.binance_adapter.close()
+                await AsyncSessionManager.close_session()
+        return asyncio.run(run_and_close())
+
+    def test_sends_burst_of_orders_concurrently(self):
+        order_data = {"symbol": "BTCUSDT", "side": "SELL", "quantity": 0.01, "order_type": "MARKET"}
+
+        async def send_orders():
+            return await asyncio.gather(*[self.binance_adapter.send_order(order_data) for _ in range(10)])
+
+        started_at = time.perf_counter()
+        order_ids = self.run(send_orders)
+
+        # ccxt's own limiter spaces futures orders 200ms apart.
+        assert time.perf_counter() - started_at < 1
+        assert len(set(order_ids)) == 10
+        assert self.stand_ins.hedges.qsize() == 10
+
+    def test_clients_share_session_and_reuse_loaded_markets(self):
+        self.binance_adapter.order_adapter.client.load_markets()
+        spot_adapter = BinanceAsyncAdapter(BinanceSimpleOrderAdapter(logger=logger), logger=logger)
+
+        async def get_clients():
+            try:
+                return self.binance_adapter.get_client(), spot_adapter.get_client()
+            finally:
+                await spot_adapter.close()
+
+        futures_client, spot_client = self.run(get_clients)
+
+        assert futures_client.session is spot_client.session
+        assert "BTC/USDT:USDT" in futures_client.markets
+        assert futures_client.urls["api"]["fapiPrivate"].startswith(self.stand_ins.urls["binance-futures"])
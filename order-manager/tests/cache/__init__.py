@@ -0,0 +1 @@
+from .test_market_metadata_cache import TestMarketMetadataCache
\ No newline at end of file
@@ -0,0 +1,93 @@
+import tempfile
+import time
+
+import pytest
+
+from benchmarks.exchange_stand_ins import ExchangeStandIns
+from benchmarks.tick_to_trade import configure_endpoints, restore_environment
+from src.infrastructure.adapters.cache import MarketMetadataCache
+from src.infrastructure.adapters.crypto.binance import BinanceFuturesOrderAdapter
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+
+
+logger = LoggerAdapter().get_logger()
+
+
+def fail_to_load_markets(*args, **kwargs):
+    raise ConnectionError("Exchange is unreachable")
+
+
+class TestMarketMetadataCache:
+    def setup_method(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.stand_ins = ExchangeStandIns(logger)
+        self.stand_ins.start()
+        self.previous_environment = configure_endpoints(self.stand_ins, "http://127.0.0.1")
+
+    def teardown_method(self):
+        restore_environment(self.previous_environment)
+        self.stand_ins.stop()
+        self.directory.cleanup()
+
+    def make_client(self):
+        client = BinanceFuturesOrderAdapter(logger=logger).client
+        client.options["fetchMarkets"] = {"types": ["linear"]}
+        client.options["fetchCurrencies"] = False
+        return client
+
+    def make_cache(self, ttl: float = 60) -> MarketMetadataCache:
+        return MarketMetadataCache(logger, directory=self.directory.name, ttl=ttl)
+
+    def test_later_processes_load_markets_from_disk(self):
+        self.make_cache().load(self.make_client())
+
+        client = self.make_client()
+        client.load_markets = fail_to_load_markets
+        self.make_cache().load(client)
+
+        assert "BTC/USDT:USDT" in client.markets
+        assert client.market("BTC/USDT:USDT")["precision"]["amount"] == 0.001
+
+    def test_uses_stale_markets_when_refresh_fails(self):
+        cache = self.make_cache(ttl=0.01)
+        cache.load(self.make_client())
+        time.sleep(0.02)
+
+        client = self.make_client()
+        client.load_markets = fail_to_load_markets
+        cache.load(client)
+
+        assert "ETH/USDT:USDT" in client.markets
+
+    def test_zero_ttl_always_fetches(self):
+        cache = self.make_cache(ttl=0)
+        cache.register(self.make_client())
+
+        client = self.make_client()
+        fetches = []
+        load_markets = client.load_markets
+        client.load_markets = lambda *args, **kwargs: fetches.append(kwargs) or load_markets(*args, **kwargs)
+        cache.load(client)
+
+        assert cache.ttl == 0
+        assert cache.refresh_thread is None
+        assert fetches == [{"reload": True}]
+
+    def test_raises_without_cached_markets_to_fall_back_on(self):
+        client = self.make_client()
+        client.load_markets = fail_to_load_markets
+
+        with pytest.raises(ConnectionError):
+            self.make_cache().load(client)
+
+    def test_refreshes_registered_clients_in_background(self):
+        client = self.make_client()
+        cache = self.make_cache(ttl=0.2)
+        cache.register(client)
+        name = cache.get_name(client)
+        fetched_at = cache.read(name)["fetched_at"]
+
+        time.sleep(0.5)
+        cache.stop()
+
+        assert cache.read(name)["fetched_at"] > fetched_at
@@ -1 +1 @@
-from .order import TestOrderService
\ No newline at end of file
+from .order import TestOrderService, TestAsyncOrderApi
\ No newline at end of file
@@ -1 +1,2 @@
-from .test_order_service import TestOrderService
\ No newline at end of file
+from .test_order_service import TestOrderService
+from .test_async_order_api import TestAsyncOrderApi
\ No newline at end of file
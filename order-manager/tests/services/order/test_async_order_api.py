@@ -0,0 +1,88 @@
+import asyncio
+
+import httpx
+from starlette.testclient import TestClient
+
+from benchmarks.exchange_stand_ins import ExchangeStandIns
+from benchmarks.tick_to_trade import configure_endpoints, restore_environment
+from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+from src.interface.api.asgi import create_asgi_app
+
+
+logger = LoggerAdapter().get_logger()
+
+ORDER_PARAMS = {"exchange_name": "flowa", "strategy": "simple-order"}
+ORDER_DATA = {
+    "broker": "935",
+    "account": "84855",
+    "symbol": "BITH11",
+    "side": "BUY",
+    "quantity": 1,
+    "price": 30,
+    "order_type": "LIMIT",
+    "time_in_force": "GTC"
+}
+
+
+class TestAsyncOrderApi:
+    def setup_method(self):
+        self.stand_ins = ExchangeStandIns(logger)
+        self.stand_ins.start()
+        self.previous_environment = configure_endpoints(self.stand_ins, "http://127.0.0.1")
+        self.app = create_asgi_app()
+
+    def teardown_method(self):
+        restore_environment(self.previous_environment)
+        self.stand_ins.stop()
+
+    def test_manages_flowa_order_through_async_handlers(self):
+        with TestClient(self.app) as client:
+            response = client.post("/api/v1/send-order", params=ORDER_PARAMS, json=ORDER_DATA)
+            assert response.status_code == 200
+            order_id = response.json()
+
+            order = client.get("/api/v1/get-order", params={**ORDER_PARAMS, "order_id": order_id}).json()
+            assert order["order_id"] == order_id
+            assert order["status"] == "NEW"
+
+            response = client.put("/api/v1/update-order", params={**ORDER_PARAMS, "order_id": order_id}, json={"price": 31})
+            assert response.status_code == 200
+            assert self.stand_ins.amends.get(timeout=1).payload == {"Price": "31"}
+
+            response = client.delete("/api/v1/cancel-order", params={**ORDER_PARAMS, "order_id": order_id})
+            assert response.json() == {"success": True, "message": "Order was successfully cancelled", "data": {"Success": True}}
+
+    def test_maps_errors_like_flask_controllers(self):
+        with TestClient(self.app) as client:
+            response = client.get("/api/v1/get-order", params={**ORDER_PARAMS, "order_id": "UNKNOWN"})
+            assert response.status_code == 400
+            assert response.json()["success"] is False
+
+            response = client.post("/api/v1/send-order", params={"exchange_name": "nyse", "strategy": "simple-order"}, json=ORDER_DATA)
+            assert response.status_code == 500
+
+            response = client.post("/api/v1/send-order", params=ORDER_PARAMS, content=b"not json")
+            assert response.status_code == 400
+
+    def test_serves_flask_routes_and_swagger_spec(self):
+        with TestClient(self.app) as client:
+            assert client.get("/healthcheck").json() == {"message": "Status OK"}
+            assert "order_requests_total" in client.get("/metrics").text
+            paths = client.get("/apispec_1.json").json()["paths"]
+            assert {"/api/v1/send-order", "/api/v1/get-order", "/api/v1/update-order", "/api/v1/cancel-order"} <= set(paths)
+
+    def test_handles_concurrent_orders(self):
+        async def send_orders(count: int) -> list:
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+                responses = await asyncio.gather(*[
+                    client.post("/api/v1/send-order", params=ORDER_PARAMS, json=ORDER_DATA)
+                    for _ in range(count)
+                ])
+            await self.app.state.container.async_order_service().close()
+            return responses
+
+        responses = asyncio.run(send_orders(20))
+
+        assert all(response.status_code == 200 for response in responses)
+        assert len({response.json() for response in responses}) == 20